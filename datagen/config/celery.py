@@ -1,7 +1,12 @@
+import logging
+from typing import Any
+
 from django.conf import settings
 
 from celery import Celery, Task
+from celery.signals import worker_process_init
 
+logger = logging.getLogger(__name__)
 
 app = Celery("config", broker=settings.CELERY_BROKER)
 
@@ -18,3 +23,13 @@ app.autodiscover_tasks()
 @app.task(bind=True)
 def debug_task(self: Task) -> None:
     print(f"Request: {self.request!r}")
+
+
+@worker_process_init.connect
+def warm_up_worker(**kwargs: Any) -> None:
+    """Load what generation needs before the process takes its first task"""
+    # web processes import this module too, but never generate
+    from schema.services.warmup import warm_up
+
+    elapsed = warm_up(settings.WARM_UP_LOCALES, settings.VALUE_POOLS_DIR)
+    logger.info("Worker process warmed up in %.2f s", elapsed)
@@ -150,6 +150,24 @@ LOGOUT_REDIRECT_URL = LOGIN_URL
 
 USER_GENERATION_ROW_LIMIT = 100000
 
+PREVIEW_NUM_ROWS = 20
+PREVIEW_TIME_BUDGET = 0.2  # seconds
+PREVIEW_MAX_CELL_LENGTH = 1000  # characters
+
+PEEK_BYTES = 64 * 1024
+PEEK_MAX_ROWS = 200
+
+# pre-generated value pools, shared by the workers of a machine
+VALUE_POOLS_DIR = Path(environ.get("VALUE_POOLS_DIR", "/tmp/datagen-pools"))
+
+# locales (besides the default one) worker processes load before taking
+# tasks, like "de_DE,ja_JP"
+WARM_UP_LOCALES = [
+    locale.strip()
+    for locale in environ.get("WARM_UP_LOCALES", "").split(",")
+    if locale.strip()
+]
+
 
 del Path
 del environ
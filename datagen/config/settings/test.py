@@ -9,3 +9,4 @@ CELERY_BROKER = "pyamqp://@localhost/testing"
 TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 
 MEDIA_ROOT = Path("/tmp/testmedia/")
+VALUE_POOLS_DIR = Path("/tmp/testpools/")
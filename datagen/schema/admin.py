@@ -1,11 +1,14 @@
 from django.contrib import admin
 
-from .models import BaseColumn, Dataset, Schema
+from .models import BaseColumn, Dataset, DatasetPart, Schema
 
 
 admin.site.register(
     Dataset, list_display=("id", "schema", "num_rows", "created", "file")
 )
+admin.site.register(
+    DatasetPart, list_display=("id", "dataset", "number", "num_rows", "file")
+)
 
 
 def column_inline_factory(
@@ -3,17 +3,67 @@ from typing import Any, Optional
 from django import forms
 from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser
-from django.db.models import Sum
+from django.db.models import BigIntegerField, Sum
+from django.db.models.functions import Greatest
 from django.forms import ModelForm
 
-from .models import BaseColumn, Dataset, Schema
+from .models import (
+    BaseColumn,
+    Dataset,
+    ForeignKeyColumn,
+    Schema,
+    SequenceColumn,
+)
 
 
 class GenerateForm(forms.Form):
     num_rows = forms.IntegerField(label="Rows", min_value=1, initial=1234)
+    format = forms.TypedChoiceField(
+        choices=Dataset.Format.choices,
+        initial=Dataset.Format.CSV,
+        required=False,
+        empty_value=Dataset.Format.CSV,
+    )
+    split_rows = forms.IntegerField(
+        label="Rows per file", min_value=1, required=False
+    )
+    split_size = forms.IntegerField(
+        label="MB per file", min_value=1, required=False
+    )
+    insert_batch_size = forms.IntegerField(
+        label="Rows per INSERT",
+        min_value=1,
+        initial=Dataset.DEFAULT_INSERT_BATCH_SIZE,
+        required=False,
+    )
+    collect_stats = forms.BooleanField(
+        label="Column statistics",
+        required=False,
+        help_text="Generation takes longer.",
+    )
+
+    def clean_insert_batch_size(self) -> int:
+        return (
+            self.cleaned_data["insert_batch_size"]
+            or Dataset.DEFAULT_INSERT_BATCH_SIZE
+        )
+
+    def clean(self) -> dict[str, Any]:
+        cleaned_data = super().clean()
+        # a database file size is known only when it's complete
+        if cleaned_data.get(
+            "format"
+        ) == Dataset.Format.SQLITE and cleaned_data.get("split_size"):
+            self.add_error(
+                "split_size",
+                "SQLite databases can be split only by the number of rows.",
+            )
+        return cleaned_data
 
     def __init__(self, *args, **kwargs):  # type: ignore
         self.user = kwargs.pop("request").user
+        # parent tables of its foreign keys count towards the limit too
+        self.schema: Optional[Schema] = kwargs.pop("schema", None)
         super().__init__(*args, **kwargs)
 
     def clean_num_rows(self) -> int:
@@ -21,8 +71,14 @@ class GenerateForm(forms.Form):
         if not self.user.has_perm("schema.unlimited_generation"):
             rows_used = (
                 Dataset.objects.filter(schema__user=self.user).aggregate(
-                    Sum("num_rows")
-                )["num_rows__sum"]
+                    rows=Sum(
+                        Greatest(
+                            "num_rows",
+                            "total_rows",
+                            output_field=BigIntegerField(),
+                        )
+                    )
+                )["rows"]
                 or 0
             )
             rows_left = settings.USER_GENERATION_ROW_LIMIT - rows_used
@@ -31,6 +87,16 @@ class GenerateForm(forms.Form):
                 raise forms.ValidationError(
                     f"You have {rows_left} rows left. Please reduce the number of rows to {rows_left} or less."
                 )
+            total_rows = (
+                self.schema.get_bundle_rows(num_rows)
+                if self.schema
+                else num_rows
+            )
+            if total_rows > rows_left:
+                raise forms.ValidationError(
+                    f"You have {rows_left} rows left, and with its parent "
+                    f"tables the dataset has {total_rows} rows."
+                )
 
         return num_rows
 
@@ -43,6 +109,24 @@ class ColumnWithOrderFieldLast(forms.ModelForm):
         cls.field_order = fields + ["order"]
         return cls
 
+    def __init__(self, *args, user: Optional[AbstractBaseUser] = None, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        # columns referred to (foreign key parents) are the user's own only
+        for field in self.fields.values():
+            if isinstance(field, forms.ModelChoiceField):
+                field.queryset = field.queryset.filter(
+                    schema__user=user
+                ).select_related("schema")
+                field.label_from_instance = _column_label  # type: ignore[assignment]
+
+    def clean_null_rate(self) -> float:
+        # an empty null rate means no nulls
+        return self.cleaned_data["null_rate"] or 0
+
+
+def _column_label(column: BaseColumn) -> str:
+    return f"{column.schema.name}.{column.name}"
+
 
 class FieldSelectForm(forms.Form):
     name = forms.CharField(max_length=255)
@@ -54,17 +138,22 @@ class FieldSelectForm(forms.Form):
         label="Type",
     )
     order = forms.IntegerField(initial=1)
-    column_form_templates = [
-        (
-            Column.__name__,
-            forms.modelform_factory(
-                Column,
-                form=ColumnWithOrderFieldLast,
-                exclude=("id", "schema"),
-            )(prefix=Column.__name__ + "-!"),
-        )
-        for Column in BaseColumn.__subclasses__()
-    ]
+
+    def __init__(self, *args, user: AbstractBaseUser, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.column_form_templates = [
+            (
+                Column.__name__,
+                forms.modelform_factory(
+                    Column,
+                    form=ColumnWithOrderFieldLast,
+                    exclude=("id", "schema"),
+                )(
+                    prefix=Column.__name__ + "-!", user=user
+                ),  # type: ignore[call-arg]
+            )
+            for Column in BaseColumn.__subclasses__()
+        ]
 
 
 class BaseColumnFormSet(forms.BaseModelFormSet):
@@ -84,7 +173,14 @@ class BaseColumnFormSet(forms.BaseModelFormSet):
 class SchemaForm(forms.ModelForm):
     class Meta:
         model = Schema
-        fields = ("name", "column_separator", "quotechar")
+        fields = (
+            "name",
+            "column_separator",
+            "quotechar",
+            "null_token",
+            "locales",
+            "pool_size",
+        )
 
     def __init__(self, data: Optional[dict] = None, *args, user: AbstractBaseUser, **kwargs):  # type: ignore
         self.user = user
@@ -97,7 +193,12 @@ class SchemaForm(forms.ModelForm):
                 extra=0,
                 can_delete=True,
                 formset=BaseColumnFormSet,
-            )(data=data, queryset=cols_qs, prefix=col_model.__name__)
+            )(
+                data=data,
+                queryset=cols_qs,
+                prefix=col_model.__name__,
+                form_kwargs={"user": user},
+            )
             for col_model, cols_qs in self.instance.columns_grouped_by_type.items()
         ]
 
@@ -119,8 +220,10 @@ class SchemaForm(forms.ModelForm):
         # don't forget to propagate formsets errors to the main form by add_error() or the form will look like valid and will have save() called
         is_valid = all(formsets_valid)
         is_valid &= self._validate_duplicate_fields()
+        is_valid &= self._validate_foreign_keys()
         if not is_valid:
             self.add_error(None, "One or more columns have errors.")
+        self._validate_deleted_parents()
 
         # if the form isn't valid, it doesn't matter if we return here something or not as it isn't supposed to be used anyway
         return schema_cleaned_data
@@ -144,6 +247,50 @@ class SchemaForm(forms.ModelForm):
                     valid = False
         return valid
 
+    def _validate_foreign_keys(self) -> bool:
+        """Check foreign keys don't refer to this schema, directly or through
+        their parents, and add error message to the forms.
+        Return True/False if valid/invalid."""
+        if not self.instance.pk:  # nothing refers to a new schema yet
+            return True
+        valid = True
+        for column_formset in self.column_formsets:
+            for column_form in column_formset:
+                if column_form in column_formset.deleted_forms:
+                    continue
+                if not (
+                    parent := column_form.cleaned_data.get("parent", None)
+                ):
+                    continue
+                if parent.schema == self.instance or parent.schema.refers_to(
+                    self.instance
+                ):
+                    column_form.add_error(
+                        "parent", "The parent table refers to this schema."
+                    )
+                    valid = False
+        return valid
+
+    def _validate_deleted_parents(self) -> None:
+        """Check deleted columns aren't parents of foreign keys of other
+        schemas (deleting those is restricted), and add error messages.
+        Deleted columns are hidden, so the errors go to this form."""
+        for column_formset in self.column_formsets:
+            for column_form in column_formset.deleted_forms:
+                column = column_form.instance
+                if not isinstance(column, SequenceColumn) or not column.pk:
+                    continue
+                children = ForeignKeyColumn.objects.filter(
+                    parent=column
+                ).select_related("schema")
+                names = sorted({f'"{fk.schema.name}"' for fk in children})
+                if names:
+                    self.add_error(
+                        None,
+                        f'"{column.name}" can\'t be deleted, '
+                        f"foreign keys of {', '.join(names)} refer to it.",
+                    )
+
     def save(self, commit: bool = True) -> Schema:
         # if user is not set it will raise, so checking user_id
         self.instance: Schema
@@ -0,0 +1,67 @@
+from time import perf_counter
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...models import Schema
+from ...services.locales import parse_locales
+from ...services.pools import POOLED_TYPES, ValuePools
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the value pools the schemas use (of their pool sizes "
+        "and locales), or the ones given. Pools already built are kept."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--size", type=int, action="append", help="Values in a pool."
+        )
+        parser.add_argument(
+            "--locale", action="append", help="Locale of the values."
+        )
+        parser.add_argument(
+            "--type",
+            dest="types",
+            action="append",
+            choices=POOLED_TYPES,
+            help="Column type, all the pooled ones by default.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Faker is only imported by generation
+        from ...services.providers import get_faker
+
+        pools_to_build = self.get_pools(options["size"], options["locale"])
+        for pool_size, pool_locale in sorted(pools_to_build):
+            pools = ValuePools(settings.VALUE_POOLS_DIR, pool_size)
+            faker = get_faker(pool_locale)
+            for column_type in options["types"] or POOLED_TYPES:
+                start = perf_counter()
+                built = pools.build(column_type, faker)
+                name = pools.path(column_type, faker).name
+                if built:
+                    elapsed = perf_counter() - start
+                    self.stdout.write(f"Built {name} in {elapsed:.1f} s")
+                else:
+                    self.stdout.write(f"Kept {name}")
+
+    @staticmethod
+    def get_pools(
+        sizes: Optional[list[int]], locales: Optional[list[str]]
+    ) -> set[tuple[int, str]]:
+        """Pairs of pool sizes and locales: the given ones combined,
+        those of the schemas using pools for the ones not given"""
+        if sizes and locales:
+            return {(size, locale) for size in sizes for locale in locales}
+        pools = set()
+        schemas = Schema.objects.exclude(pool_size=None)
+        for pool_size, schema_locales in schemas.values_list(
+            "pool_size", "locales"
+        ):
+            for size in sizes or [pool_size]:
+                for locale in locales or parse_locales(schema_locales):
+                    pools.add((size, locale))
+        return pools
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the import of the web process entry point in fresh "
+        "interpreters (by `python -X importtime`, the best of the runs) "
+        "and fail if it's over the budget. A benchmark, timings depend "
+        "on the load of the machine, so it isn't a part of the tests."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--budget",
+            type=int,
+            default=1000,
+            help="Import time allowed, milliseconds.",
+        )
+        parser.add_argument(
+            "--runs", type=int, default=5, help="Interpreters to start."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        best = min(self.import_time() for _ in range(options["runs"]))
+        budget = options["budget"]
+        self.stdout.write(
+            f"config.wsgi imported in {best:.0f} ms, budget {budget} ms"
+        )
+        if best > budget:
+            raise CommandError("The import time is over the budget.")
+
+    @staticmethod
+    def import_time() -> float:
+        """Cumulative import time of `config.wsgi`, milliseconds"""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import config.wsgi"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # lines like "import time: self [us] | cumulative | imported package"
+        for line in result.stderr.splitlines()[1:]:
+            _, cumulative, module = line.split("|")
+            if module.strip() == "config.wsgi":
+                return int(cumulative) / 1000
+        raise CommandError("config.wsgi wasn't imported.")
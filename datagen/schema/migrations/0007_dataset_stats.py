@@ -0,0 +1,46 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:03
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "schema",
+            "0006_remove_schema_fields_randomintcolumn_namecolumn_squashed_0007_remove_randomintcolumn_max_and_more_squashed_0011_rename_addressfieldform_addresscolumn_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="stats",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="sentencescolumn",
+            name="nb_max",
+            field=models.IntegerField(
+                default=1,
+                validators=[
+                    django.core.validators.MinValueValidator(1),
+                    django.core.validators.MaxValueValidator(100000),
+                ],
+                verbose_name="max",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="sentencescolumn",
+            name="nb_min",
+            field=models.IntegerField(
+                default=1,
+                validators=[
+                    django.core.validators.MinValueValidator(1),
+                    django.core.validators.MaxValueValidator(100000),
+                ],
+                verbose_name="min",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0007_dataset_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="sha256",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="dataset",
+            name="size",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
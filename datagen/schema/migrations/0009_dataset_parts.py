@@ -0,0 +1,63 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:06
+
+import django.core.files.storage
+from django.db import migrations, models
+import django.db.models.deletion
+import schema.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0008_dataset_size_sha256"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="split_rows",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="dataset",
+            name="split_size",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="DatasetPart",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.PositiveIntegerField()),
+                (
+                    "file",
+                    models.FileField(
+                        storage=django.core.files.storage.FileSystemStorage(),
+                        upload_to="",
+                    ),
+                ),
+                ("num_rows", models.IntegerField()),
+                ("size", models.BigIntegerField()),
+                ("sha256", models.CharField(max_length=64)),
+                (
+                    "dataset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="parts",
+                        to="schema.dataset",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("number",),
+            },
+            bases=(schema.models.FileDigestMixin, models.Model),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0009_dataset_parts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="format",
+            field=models.CharField(
+                choices=[("csv", "CSV"), ("ndjson", "JSON Lines")],
+                default="csv",
+                max_length=16,
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:18
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0010_dataset_format"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="insert_batch_size",
+            field=models.PositiveIntegerField(
+                default=1000,
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="dataset",
+            name="format",
+            field=models.CharField(
+                choices=[
+                    ("csv", "CSV"),
+                    ("ndjson", "JSON Lines"),
+                    ("pg_copy", "PostgreSQL COPY"),
+                    ("sql", "SQL INSERT"),
+                ],
+                default="csv",
+                max_length=16,
+            ),
+        ),
+    ]
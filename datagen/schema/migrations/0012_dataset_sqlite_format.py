@@ -0,0 +1,28 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0011_dataset_sql_formats"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dataset",
+            name="format",
+            field=models.CharField(
+                choices=[
+                    ("csv", "CSV"),
+                    ("ndjson", "JSON Lines"),
+                    ("pg_copy", "PostgreSQL COPY"),
+                    ("sql", "SQL INSERT"),
+                    ("sqlite", "SQLite database"),
+                ],
+                default="csv",
+                max_length=16,
+            ),
+        ),
+    ]
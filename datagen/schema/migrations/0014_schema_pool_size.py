@@ -0,0 +1,28 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0013_dataset_xlsx_format"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schema",
+            name="pool_size",
+            field=models.PositiveIntegerField(
+                blank=True,
+                choices=[
+                    (10000, "10 thousand values"),
+                    (100000, "100 thousand values"),
+                    (1000000, "1 million values"),
+                ],
+                help_text="Pick names, companies, jobs and addresses from a pool of pre-generated values: much faster, but there are no more distinct values than the pool has.",
+                null=True,
+                verbose_name="value pool",
+            ),
+        ),
+    ]
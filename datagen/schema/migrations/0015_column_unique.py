@@ -0,0 +1,93 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0014_schema_pool_size"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="addresscolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="companycolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="datecolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="domaincolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="emailcolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobcolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="namecolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="phonenumbercolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="randomintcolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="sentencescolumn",
+            name="unique",
+            field=models.BooleanField(
+                default=False,
+                help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+            ),
+        ),
+    ]
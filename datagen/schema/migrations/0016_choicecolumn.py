@@ -0,0 +1,72 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:38
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0015_column_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChoiceColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "choices",
+                    models.TextField(
+                        default="active\ninactive",
+                        help_text="One value per line.",
+                        verbose_name="values",
+                    ),
+                ),
+                (
+                    "weights",
+                    models.TextField(
+                        blank=True,
+                        default="",
+                        help_text="Weights of the values in the same order, separated by commas. Leave empty for equally likely values.",
+                    ),
+                ),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,185 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:40
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0016_choicecolumn"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DistributedIntColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "distribution",
+                    models.CharField(
+                        choices=[
+                            ("normal", "Normal"),
+                            ("lognormal", "Log-normal"),
+                            ("zipf", "Zipf"),
+                            ("poisson", "Poisson"),
+                        ],
+                        default="normal",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "mean",
+                    models.FloatField(
+                        default=100,
+                        help_text="Mean of normal, log-normal and Poisson values.",
+                    ),
+                ),
+                (
+                    "deviation",
+                    models.FloatField(
+                        default=50,
+                        help_text="Standard deviation of normal and log-normal values.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0)
+                        ],
+                    ),
+                ),
+                (
+                    "exponent",
+                    models.FloatField(
+                        default=2,
+                        help_text="Zipf exponent, greater than 1: the greater, the more values are close to min.",
+                    ),
+                ),
+                ("min", models.IntegerField(default=0)),
+                ("max", models.IntegerField(default=1000)),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="DistributedFloatColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "distribution",
+                    models.CharField(
+                        choices=[
+                            ("normal", "Normal"),
+                            ("lognormal", "Log-normal"),
+                            ("zipf", "Zipf"),
+                            ("poisson", "Poisson"),
+                        ],
+                        default="normal",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "mean",
+                    models.FloatField(
+                        default=100,
+                        help_text="Mean of normal, log-normal and Poisson values.",
+                    ),
+                ),
+                (
+                    "deviation",
+                    models.FloatField(
+                        default=50,
+                        help_text="Standard deviation of normal and log-normal values.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0)
+                        ],
+                    ),
+                ),
+                (
+                    "exponent",
+                    models.FloatField(
+                        default=2,
+                        help_text="Zipf exponent, greater than 1: the greater, the more values are close to min.",
+                    ),
+                ),
+                ("min", models.FloatField(default=0)),
+                ("max", models.FloatField(default=1000)),
+                (
+                    "precision",
+                    models.PositiveSmallIntegerField(
+                        default=2,
+                        help_text="Number of decimal places.",
+                        validators=[
+                            django.core.validators.MaxValueValidator(10)
+                        ],
+                    ),
+                ),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
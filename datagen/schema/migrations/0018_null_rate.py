@@ -0,0 +1,194 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:44
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0017_distributed_columns"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="addresscolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="choicecolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="companycolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="datecolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="distributedfloatcolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="distributedintcolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="domaincolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="emailcolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobcolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="namecolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="phonenumbercolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="randomintcolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="schema",
+            name="null_token",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="How empty cells are written in CSV, e.g. NULL or \\N. Other formats have their own nulls.",
+                max_length=16,
+                verbose_name="null as",
+            ),
+        ),
+        migrations.AddField(
+            model_name="sentencescolumn",
+            name="null_rate",
+            field=models.FloatField(
+                blank=True,
+                default=0,
+                help_text="Share of empty cells, from 0 to 1.",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(1),
+                ],
+            ),
+        ),
+    ]
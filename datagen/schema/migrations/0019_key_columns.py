@@ -0,0 +1,202 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:45
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0018_null_rate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UUIDColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "null_rate",
+                    models.FloatField(
+                        blank=True,
+                        default=0,
+                        help_text="Share of empty cells, from 0 to 1.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(1),
+                        ],
+                    ),
+                ),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveSmallIntegerField(
+                        choices=[
+                            (4, "Version 4 (random)"),
+                            (7, "Version 7 (time-ordered)"),
+                        ],
+                        default=4,
+                    ),
+                ),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="SequenceColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "null_rate",
+                    models.FloatField(
+                        blank=True,
+                        default=0,
+                        help_text="Share of empty cells, from 0 to 1.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(1),
+                        ],
+                    ),
+                ),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                ("start", models.IntegerField(default=1)),
+                ("step", models.IntegerField(default=1)),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="CodeColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "null_rate",
+                    models.FloatField(
+                        blank=True,
+                        default=0,
+                        help_text="Share of empty cells, from 0 to 1.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(1),
+                        ],
+                    ),
+                ),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "prefix",
+                    models.CharField(blank=True, default="", max_length=32),
+                ),
+                ("start", models.PositiveIntegerField(default=1)),
+                (
+                    "digits",
+                    models.PositiveSmallIntegerField(
+                        default=8,
+                        help_text="Numbers are padded with zeros to this many digits.",
+                        validators=[
+                            django.core.validators.MinValueValidator(1),
+                            django.core.validators.MaxValueValidator(20),
+                        ],
+                    ),
+                ),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
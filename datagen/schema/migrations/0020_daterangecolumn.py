@@ -0,0 +1,119 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:47
+
+import datetime
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+from django.utils.timezone import utc
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0019_key_columns"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DateRangeColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "null_rate",
+                    models.FloatField(
+                        blank=True,
+                        default=0,
+                        help_text="Share of empty cells, from 0 to 1.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(1),
+                        ],
+                    ),
+                ),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "start",
+                    models.DateTimeField(
+                        default=datetime.datetime(2000, 1, 1, 0, 0, tzinfo=utc)
+                    ),
+                ),
+                (
+                    "end",
+                    models.DateTimeField(
+                        default=datetime.datetime(2030, 1, 1, 0, 0, tzinfo=utc)
+                    ),
+                ),
+                (
+                    "format",
+                    models.CharField(
+                        default="%Y-%m-%d %H:%M:%S",
+                        help_text="As in strftime, e.g. %Y-%m-%d for dates only.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "timezone",
+                    models.CharField(
+                        default="UTC",
+                        help_text="Time zone of the values, e.g. Europe/Kyiv.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "mode",
+                    models.CharField(
+                        choices=[
+                            ("random", "Random between start and end"),
+                            ("series", "Time series from start"),
+                        ],
+                        default="random",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "interval",
+                    models.PositiveIntegerField(
+                        default=60,
+                        help_text="Mean number of seconds between values of a time series.",
+                        validators=[
+                            django.core.validators.MinValueValidator(1)
+                        ],
+                    ),
+                ),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:49
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0020_daterangecolumn"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PatternColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "null_rate",
+                    models.FloatField(
+                        blank=True,
+                        default=0,
+                        help_text="Share of empty cells, from 0 to 1.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(1),
+                        ],
+                    ),
+                ),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "pattern",
+                    models.CharField(
+                        default="[A-Z]{3}-\\d{6}",
+                        help_text="A regular expression the values match. Repeats must be bounded: no *, + or {n,}.",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,122 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:54
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0021_patterncolumn"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasetpart",
+            name="table",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.CreateModel(
+            name="ForeignKeyColumn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255,
+                        validators=[
+                            django.core.validators.MinLengthValidator(1)
+                        ],
+                    ),
+                ),
+                ("order", models.IntegerField(default=1)),
+                (
+                    "null_rate",
+                    models.FloatField(
+                        blank=True,
+                        default=0,
+                        help_text="Share of empty cells, from 0 to 1.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(1),
+                        ],
+                    ),
+                ),
+                (
+                    "unique",
+                    models.BooleanField(
+                        default=False,
+                        help_text="No value is repeated in a dataset (about 2 bytes of memory per row while generating).",
+                    ),
+                ),
+                (
+                    "fanout",
+                    models.CharField(
+                        choices=[
+                            ("uniform", "Uniform"),
+                            ("normal", "Normal"),
+                            ("lognormal", "Log-normal"),
+                            ("zipf", "Zipf"),
+                            ("poisson", "Poisson"),
+                        ],
+                        default="uniform",
+                        help_text="Distribution of the number of rows per parent row.",
+                        max_length=16,
+                        verbose_name="fan-out",
+                    ),
+                ),
+                (
+                    "mean",
+                    models.FloatField(
+                        default=10,
+                        help_text="Mean number of rows per parent row: the parent table gets this many times fewer rows.",
+                    ),
+                ),
+                (
+                    "deviation",
+                    models.FloatField(
+                        default=5,
+                        help_text="Standard deviation of normal and log-normal fan-outs.",
+                        validators=[
+                            django.core.validators.MinValueValidator(0)
+                        ],
+                    ),
+                ),
+                (
+                    "exponent",
+                    models.FloatField(
+                        default=2,
+                        help_text="Exponent of Zipf fan-outs, greater than 1: the greater, the more parent rows have no rows at all.",
+                    ),
+                ),
+                (
+                    "parent",
+                    models.ForeignKey(
+                        help_text="Sequence column of the parent table the values are picked from.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="foreign_keys",
+                        to="schema.sequencecolumn",
+                    ),
+                ),
+                (
+                    "schema",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="schema.schema",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.0.10 on 2026-10-19 15:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0022_foreignkeycolumn"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schema",
+            name="locales",
+            field=models.CharField(
+                blank=True,
+                default="en_US",
+                help_text="Locale of names, addresses, texts and the like, e.g. de_DE, or a weighted mix like en_US:3, de_DE:1.",
+                max_length=255,
+                verbose_name="locale",
+            ),
+        ),
+    ]
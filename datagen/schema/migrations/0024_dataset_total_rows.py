@@ -0,0 +1,42 @@
+# Generated by Django 4.0.10 on 2026-10-19 16:21
+
+import django.core.validators
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import (
+    BaseDatabaseSchemaEditor as SchemaEditor,
+)
+from django.db.models import Model
+
+
+def raise_means(apps: Apps, schema_editor: SchemaEditor) -> None:
+    """Means below 1 gave parent tables more rows than the limit allows"""
+    ForeignKeyColumn: type[Model] = apps.get_model(
+        "schema", "ForeignKeyColumn"
+    )
+    ForeignKeyColumn.objects.filter(mean__lt=1).update(mean=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0023_schema_locales"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="total_rows",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="foreignkeycolumn",
+            name="mean",
+            field=models.FloatField(
+                default=10,
+                help_text="Mean number of rows per parent row, at least 1: the parent table gets this many times fewer rows.",
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+        migrations.RunPython(raise_means, migrations.RunPython.noop),
+    ]
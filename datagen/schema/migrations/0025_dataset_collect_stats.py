@@ -0,0 +1,18 @@
+# Generated by Django 4.0.10 on 2026-10-19 16:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0024_dataset_total_rows"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="collect_stats",
+            field=models.BooleanField(default=False),
+        ),
+    ]
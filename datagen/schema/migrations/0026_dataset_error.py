@@ -0,0 +1,18 @@
+# Generated by Django 4.0.10 on 2026-10-19 16:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0025_dataset_collect_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="error",
+            field=models.TextField(blank=True),
+        ),
+    ]
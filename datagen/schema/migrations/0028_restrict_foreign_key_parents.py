@@ -0,0 +1,24 @@
+# Generated by Django 4.0.10 on 2026-10-19 16:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema", "0027_protect_foreign_key_parents"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="foreignkeycolumn",
+            name="parent",
+            field=models.ForeignKey(
+                help_text="Sequence column of the parent table the values are picked from.",
+                on_delete=django.db.models.deletion.RESTRICT,
+                related_name="foreign_keys",
+                to="schema.sequencecolumn",
+            ),
+        ),
+    ]
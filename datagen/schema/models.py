@@ -1,5 +1,9 @@
+from base64 import b64encode
+from datetime import datetime, timezone as dt_timezone
 from itertools import chain
-from typing import Any, Iterable
+from math import ceil
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, Sequence
+from zoneinfo import available_timezones
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -11,14 +15,59 @@ from django.core.validators import (
 )
 from django.db import models
 from django.forms.models import model_to_dict
+from django.utils.text import slugify
+
+from .services import dates, distributions, relations
+from .services.choices import parse_values, parse_weights
+from .services.columns import (
+    STREAMED_MIN_SENTENCES,
+    ColumnDTO,
+    sentences_streamed,
+)
+from .services.patterns import PatternError, compile_pattern
+from .services.locales import DEFAULT_LOCALE, parse_locales
+from .services.pools import ValuePools
 
-from .services.generator import ColumnDTO, Generator
+if TYPE_CHECKING:
+    from .services.generator import Generator
 
 
 class Schema(models.Model):
+    POOL_SIZES = [
+        (10_000, "10 thousand values"),
+        (100_000, "100 thousand values"),
+        (1_000_000, "1 million values"),
+    ]
+
     name = models.CharField(max_length=255)
     column_separator = models.CharField(max_length=1, default=",")
     quotechar = models.CharField(max_length=1, default='"')
+    null_token = models.CharField(
+        "null as",
+        max_length=16,
+        blank=True,
+        default="",
+        help_text="How empty cells are written in CSV, e.g. NULL or \\N. "
+        "Other formats have their own nulls.",
+    )
+    locales = models.CharField(
+        "locale",
+        max_length=255,
+        blank=True,
+        default=DEFAULT_LOCALE,
+        help_text="Locale of names, addresses, texts and the like, "
+        "e.g. de_DE, or a weighted mix like en_US:3, de_DE:1.",
+    )
+    # see `services.pools`
+    pool_size = models.PositiveIntegerField(
+        "value pool",
+        choices=POOL_SIZES,
+        null=True,
+        blank=True,
+        help_text="Pick names, companies, jobs and addresses "
+        "from a pool of pre-generated values: much faster, "
+        "but there are no more distinct values than the pool has.",
+    )
     user = models.ForeignKey(
         get_user_model(), on_delete=models.CASCADE, related_name="schemas"
     )
@@ -28,6 +77,13 @@ class Schema(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def clean(self) -> None:
+        super().clean()
+        try:
+            parse_locales(self.locales)
+        except ValueError as error:
+            raise ValidationError({"locales": str(error)})
+
     @property
     def columns(self) -> Iterable["BaseColumn"]:
         return chain.from_iterable(
@@ -43,54 +99,224 @@ class Schema(models.Model):
         }
 
     @property
-    def get_generator(self) -> Generator:
-        return Generator(
-            ColumnDTO(
-                column.name,
-                column.type,
-                column.order,
-                column.params,
+    def table_name(self) -> str:
+        return slugify(self.name).replace("-", "_") or "dataset"
+
+    @property
+    def get_generator(self) -> "Generator":
+        return self.make_generator()
+
+    def make_generator(
+        self, parent_keys: Optional[Mapping[int, Sequence[int]]] = None
+    ) -> "Generator":
+        """Foreign keys are picked from `parent_keys` by the pk of their
+        parent column if given, else from the keys of the first parent rows
+        (see `ForeignKeyColumn.params`)"""
+        # generation imports Faker and factory_boy, web processes don't need it
+        from .services.generator import Generator
+
+        parent_keys = parent_keys or {}
+        columns = []
+        for column in self.columns:
+            params = column.params
+            if (
+                isinstance(column, ForeignKeyColumn)
+                and column.parent_id in parent_keys
+            ):
+                params["keys"] = parent_keys[column.parent_id]
+            columns.append(
+                ColumnDTO(
+                    column.name,
+                    column.type,
+                    column.order,
+                    params,
+                    column.unique,
+                    column.null_rate,
+                )
             )
-            for column in self.columns
+        return Generator(
+            columns, pools=self.pools, locales=parse_locales(self.locales)
+        )
+
+    @property
+    def foreign_keys(self) -> models.QuerySet["ForeignKeyColumn"]:
+        return ForeignKeyColumn.objects.filter(schema=self).select_related(
+            "parent__schema"
         )
 
-    def run_generate_task(self, num_rows: int) -> None:
+    def refers_to(self, other: "Schema") -> bool:
+        """Whether foreign keys of this schema refer to `other`,
+        directly or through foreign keys of their parents"""
+        return any(
+            column.parent.schema == other
+            or column.parent.schema.refers_to(other)
+            for column in self.foreign_keys
+        )
+
+    def get_bundle(self, num_rows: int) -> list[tuple["Schema", int]]:
+        """This schema and the schemas its foreign keys refer to (directly
+        or not) with their numbers of rows, parents before children,
+        so this schema is the last. A parent gets as many rows as its
+        children need for the mean fan-out of their foreign keys
+        (the most of them if several foreign keys refer to it)."""
+        order: list[Schema] = []
+        visited: set[int] = set()
+
+        def visit(schema: Schema) -> None:
+            visited.add(schema.pk)
+            for column in schema.foreign_keys:
+                if column.parent.schema.pk not in visited:
+                    visit(column.parent.schema)
+            order.append(schema)
+
+        visit(self)
+        rows = {self.pk: num_rows}
+        for schema in reversed(order):
+            for column in schema.foreign_keys:
+                parent_pk = column.parent.schema.pk
+                rows[parent_pk] = max(
+                    rows.get(parent_pk, 0),
+                    ceil(rows[schema.pk] / column.mean),
+                )
+        return [(schema, rows[schema.pk]) for schema in order]
+
+    def get_bundle_rows(self, num_rows: int) -> int:
+        """Rows of all tables of the bundle"""
+        return sum(rows for _, rows in self.get_bundle(num_rows))
+
+    @property
+    def pools(self) -> Optional[ValuePools]:
+        if not self.pool_size:
+            return None
+        return ValuePools(settings.VALUE_POOLS_DIR, self.pool_size)
+
+    def run_generate_task(self, num_rows: int, **options: Any) -> None:
+        """Create a dataset with given options (see `Dataset` fields)
+        and run its generation"""
         from .tasks import generate_data  # prevent circular import
 
-        dataset = self.datasets.create(num_rows=num_rows)
+        dataset = self.datasets.create(
+            num_rows=num_rows,
+            total_rows=self.get_bundle_rows(num_rows),
+            **options,
+        )
         if settings.INPROCESS_CELERY_WORKER:
             generate_data.run(dataset.pk)
         else:
             generate_data.delay(dataset.pk)
 
 
-class Dataset(models.Model):
+class FileDigestMixin:
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the file as a `Digest` header value"""
+        sha256: str = self.sha256  # type: ignore[attr-defined]
+        return "sha-256=" + b64encode(bytes.fromhex(sha256)).decode()
+
+
+class Dataset(FileDigestMixin, models.Model):
+    class Format(models.TextChoices):
+        CSV = "csv", "CSV"
+        NDJSON = "ndjson", "JSON Lines"
+        PG_COPY = "pg_copy", "PostgreSQL COPY"
+        SQL = "sql", "SQL INSERT"
+        SQLITE = "sqlite", "SQLite database"
+        XLSX = "xlsx", "Excel workbook"
+
+    PEEKABLE_FORMATS = (Format.CSV, Format.NDJSON)
+    DEFAULT_INSERT_BATCH_SIZE = 1000
+
     schema = models.ForeignKey(
         Schema, on_delete=models.CASCADE, related_name="datasets"
     )
     num_rows = models.IntegerField()
+    # of the bundle, parent tables included (0 if not counted)
+    total_rows = models.BigIntegerField(default=0)
+    format = models.CharField(
+        max_length=16, choices=Format.choices, default=Format.CSV
+    )
     file = models.FileField(
         storage=settings.PRIVATE_MEDIA_STORAGE(), null=True
     )
     created = models.DateTimeField(auto_now_add=True)
+    size = models.BigIntegerField(null=True, blank=True)
+    sha256 = models.CharField(max_length=64, blank=True)
+    # gathered during generation if asked for (it slows it down),
+    # see `services.stats.DatasetStats`
+    collect_stats = models.BooleanField(default=False)
+    stats = models.JSONField(null=True, blank=True)
+    # why generation failed, if it did
+    error = models.TextField(blank=True)
+    # Split output into parts of that many rows and/or megabytes.
+    # Then the `file` is a JSON manifest of the parts.
+    # Schemas with foreign keys are generated with their parent tables,
+    # as parts of a bundle (at least one per table) with such manifest too.
+    split_rows = models.PositiveIntegerField(null=True, blank=True)
+    split_size = models.PositiveIntegerField(null=True, blank=True)
+    # rows per statement of the SQL INSERT format
+    insert_batch_size = models.PositiveIntegerField(
+        default=DEFAULT_INSERT_BATCH_SIZE, validators=[MinValueValidator(1)]
+    )
+    parts: models.QuerySet["DatasetPart"]
+
+    @property
+    def is_split(self) -> bool:
+        return bool(self.split_rows or self.split_size)
+
+    @property
+    def is_peekable(self) -> bool:
+        return self.format in self.PEEKABLE_FORMATS
 
     def __str__(self) -> str:
         return f"{self.schema.name} - {self.num_rows} rows on {self.created.strftime('%Y-%m-%d')}"
 
 
+class DatasetPart(FileDigestMixin, models.Model):
+    dataset = models.ForeignKey(
+        Dataset, on_delete=models.CASCADE, related_name="parts"
+    )
+    number = models.PositiveIntegerField()
+    # the table of a bundle the part is of, see `Schema.get_bundle`
+    table = models.CharField(max_length=255, blank=True, default="")
+    file = models.FileField(storage=settings.PRIVATE_MEDIA_STORAGE())
+    num_rows = models.IntegerField()
+    size = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64)
+
+    class Meta:
+        ordering = ("number",)
+
+    def __str__(self) -> str:
+        return f"{self.dataset} - part {self.number}"
+
+
 class BaseColumn(models.Model):
     label: str
     type: str
     name = models.CharField(max_length=255, validators=[MinLengthValidator(1)])
     order = models.IntegerField(default=1)
     schema = models.ForeignKey(Schema, on_delete=models.CASCADE)
+    null_rate = models.FloatField(
+        default=0,
+        blank=True,
+        validators=[MinValueValidator(0), MaxValueValidator(1)],
+        help_text="Share of empty cells, from 0 to 1.",
+    )
+    unique = models.BooleanField(
+        default=False,
+        help_text="No value is repeated in a dataset (about 2 bytes "
+        "of memory per row while generating).",
+    )
 
     class Meta:
         abstract = True
 
     @property
     def params(self) -> dict[str, Any]:
-        return model_to_dict(self, exclude=("id", "name", "order", "schema"))
+        return model_to_dict(
+            self,
+            exclude=("id", "name", "order", "schema", "unique", "null_rate"),
+        )
 
     def __init_subclass__(cls) -> None:
         """Ensure `type` and `label` attributes on subclasses are set"""
@@ -181,3 +407,311 @@ class SentencesColumn(BaseColumn):
                     "nb_max": "Max must be greater than min.",
                 }
             )
+        # streamed texts are written before they could be compared
+        if self.unique and sentences_streamed(self.nb_min, self.nb_max):
+            raise ValidationError(
+                {
+                    "unique": f"Texts of {STREAMED_MIN_SENTENCES} "
+                    "or more sentences can't be unique."
+                }
+            )
+
+
+class ChoiceColumn(BaseColumn):
+    type = "weighted_choice"
+    label = "Choice"
+
+    choices = models.TextField(
+        verbose_name="values",
+        default="active\ninactive",
+        help_text="One value per line.",
+    )
+    weights = models.TextField(
+        blank=True,
+        default="",
+        help_text="Weights of the values in the same order, "
+        "separated by commas. Leave empty for equally likely values.",
+    )
+
+    def clean(self) -> None:
+        super().clean()
+        values = parse_values(self.choices)
+        if not values:
+            raise ValidationError({"choices": "Enter at least one value."})
+        try:
+            weights = parse_weights(self.weights)
+        except ValueError:
+            raise ValidationError(
+                {"weights": "Weights must be numbers separated by commas."}
+            )
+        if weights is None:
+            return
+        if len(weights) != len(values):
+            raise ValidationError(
+                {
+                    "weights": f"Enter a weight for each of {len(values)} values."
+                }
+            )
+        if min(weights) < 0 or not sum(weights):
+            raise ValidationError(
+                {
+                    "weights": "Weights must not be negative "
+                    "and some must be positive."
+                }
+            )
+
+
+class DistributionFields(models.Model):
+    """Parameters of numbers following a distribution,
+    see `services.distributions`"""
+
+    class Distribution(models.TextChoices):
+        NORMAL = distributions.NORMAL, "Normal"
+        LOGNORMAL = distributions.LOGNORMAL, "Log-normal"
+        ZIPF = distributions.ZIPF, "Zipf"
+        POISSON = distributions.POISSON, "Poisson"
+
+    min: Any
+    max: Any
+    distribution = models.CharField(
+        max_length=16,
+        choices=Distribution.choices,
+        default=Distribution.NORMAL,
+    )
+    mean = models.FloatField(
+        default=100,
+        help_text="Mean of normal, log-normal and Poisson values.",
+    )
+    deviation = models.FloatField(
+        default=50,
+        validators=[MinValueValidator(0)],
+        help_text="Standard deviation of normal and log-normal values.",
+    )
+    exponent = models.FloatField(
+        default=2,
+        help_text="Zipf exponent, greater than 1: the greater, "
+        "the more values are close to min.",
+    )
+
+    class Meta(BaseColumn.Meta):
+        abstract = True
+
+    def clean(self) -> None:
+        super().clean()
+        if self.min > self.max:
+            raise ValidationError(
+                {
+                    "__all__": "Min must be less than max.",
+                    "min": "Min must be less than max.",
+                    "max": "Max must be greater than min.",
+                }
+            )
+        if (
+            self.distribution
+            in (self.Distribution.LOGNORMAL, self.Distribution.POISSON)
+            and self.mean <= 0
+        ):
+            raise ValidationError(
+                {"mean": "Mean must be positive for this distribution."}
+            )
+        if self.distribution == self.Distribution.ZIPF and self.exponent <= 1:
+            raise ValidationError(
+                {"exponent": "Exponent must be greater than 1."}
+            )
+
+
+class DistributedIntColumn(DistributionFields, BaseColumn):
+    type = "distributed_int"
+    label = "Distributed integer"
+
+    min = models.IntegerField(default=0)
+    max = models.IntegerField(default=1000)
+
+
+class DistributedFloatColumn(DistributionFields, BaseColumn):
+    type = "distributed_float"
+    label = "Distributed decimal"
+
+    min = models.FloatField(default=0)
+    max = models.FloatField(default=1000)
+    precision = models.PositiveSmallIntegerField(
+        default=2,
+        validators=[MaxValueValidator(10)],
+        help_text="Number of decimal places.",
+    )
+
+
+class SequenceColumn(BaseColumn):
+    type = "sequence"
+
+    start = models.IntegerField(default=1)
+    step = models.IntegerField(default=1)
+
+    def keys(self, num_rows: int) -> range:
+        """Values of the first `num_rows` rows"""
+        return range(self.start, self.start + num_rows * self.step, self.step)
+
+    def clean(self) -> None:
+        super().clean()
+        if self.step == 0:
+            raise ValidationError({"step": "Step must not be zero."})
+        referred = ForeignKeyColumn.objects.filter(parent_id=self.pk)
+        if self.null_rate and self.pk and referred.exists():
+            raise ValidationError(
+                {"null_rate": "Foreign keys refer to this column."}
+            )
+
+
+class UUIDColumn(BaseColumn):
+    type = "uuid"
+    label = "UUID"
+
+    VERSIONS = [
+        (4, "Version 4 (random)"),
+        (7, "Version 7 (time-ordered)"),
+    ]
+
+    version = models.PositiveSmallIntegerField(choices=VERSIONS, default=4)
+
+
+class CodeColumn(BaseColumn):
+    type = "code"
+    label = "Code"
+
+    prefix = models.CharField(max_length=32, blank=True, default="")
+    start = models.PositiveIntegerField(default=1)
+    digits = models.PositiveSmallIntegerField(
+        default=8,
+        validators=[MinValueValidator(1), MaxValueValidator(20)],
+        help_text="Numbers are padded with zeros to this many digits.",
+    )
+
+
+class DateRangeColumn(BaseColumn):
+    type = "date_range"
+    label = "Date range"
+
+    class Mode(models.TextChoices):
+        RANDOM = dates.RANDOM, "Random between start and end"
+        SERIES = dates.SERIES, "Time series from start"
+
+    start = models.DateTimeField(
+        default=datetime(2000, 1, 1, tzinfo=dt_timezone.utc)
+    )
+    end = models.DateTimeField(
+        default=datetime(2030, 1, 1, tzinfo=dt_timezone.utc)
+    )
+    format = models.CharField(
+        max_length=64,
+        default="%Y-%m-%d %H:%M:%S",
+        help_text="As in strftime, e.g. %Y-%m-%d for dates only.",
+    )
+    timezone = models.CharField(
+        max_length=64,
+        default="UTC",
+        help_text="Time zone of the values, e.g. Europe/Kyiv.",
+    )
+    mode = models.CharField(
+        max_length=16, choices=Mode.choices, default=Mode.RANDOM
+    )
+    interval = models.PositiveIntegerField(
+        default=60,
+        validators=[MinValueValidator(1)],
+        help_text="Mean number of seconds between values of a time series.",
+    )
+
+    def clean(self) -> None:
+        super().clean()
+        if self.start and self.end and self.start > self.end:
+            raise ValidationError(
+                {
+                    "__all__": "Start must be before end.",
+                    "start": "Start must be before end.",
+                    "end": "End must be after start.",
+                }
+            )
+        if self.timezone not in available_timezones():
+            raise ValidationError({"timezone": "Unknown time zone."})
+
+
+class PatternColumn(BaseColumn):
+    type = "pattern"
+
+    pattern = models.CharField(
+        max_length=255,
+        default=r"[A-Z]{3}-\d{6}",
+        help_text="A regular expression the values match. "
+        "Repeats must be bounded: no *, + or {n,}.",
+    )
+
+    def clean(self) -> None:
+        super().clean()
+        try:
+            compile_pattern(self.pattern)
+        except PatternError as error:
+            raise ValidationError({"pattern": str(error)})
+
+
+class ForeignKeyColumn(BaseColumn):
+    type = "foreign_key"
+    label = "Foreign key"
+
+    class Fanout(models.TextChoices):
+        UNIFORM = relations.UNIFORM, "Uniform"
+        NORMAL = distributions.NORMAL, "Normal"
+        LOGNORMAL = distributions.LOGNORMAL, "Log-normal"
+        ZIPF = distributions.ZIPF, "Zipf"
+        POISSON = distributions.POISSON, "Poisson"
+
+    parent = models.ForeignKey(
+        SequenceColumn,
+        on_delete=models.RESTRICT,
+        related_name="foreign_keys",
+        help_text="Sequence column of the parent table "
+        "the values are picked from.",
+    )
+    parent_id: int
+    fanout = models.CharField(
+        "fan-out",
+        max_length=16,
+        choices=Fanout.choices,
+        default=Fanout.UNIFORM,
+        help_text="Distribution of the number of rows per parent row.",
+    )
+    mean = models.FloatField(
+        default=10,
+        validators=[MinValueValidator(1)],
+        help_text="Mean number of rows per parent row, at least 1: "
+        "the parent table gets this many times fewer rows.",
+    )
+    deviation = models.FloatField(
+        default=5,
+        validators=[MinValueValidator(0)],
+        help_text="Standard deviation of normal and log-normal fan-outs.",
+    )
+    exponent = models.FloatField(
+        default=2,
+        help_text="Exponent of Zipf fan-outs, greater than 1: the greater, "
+        "the more parent rows have no rows at all.",
+    )
+
+    @property
+    def params(self) -> dict[str, Any]:
+        params = super().params
+        del params["parent"]
+        # a dataset replaces them with the keys of its parent table
+        params["keys"] = self.parent.keys(
+            ceil(settings.PREVIEW_NUM_ROWS / self.mean)
+        )
+        return params
+
+    def clean(self) -> None:
+        super().clean()
+        if self.parent_id and self.parent.null_rate:
+            raise ValidationError(
+                {"parent": "The parent column must not have empty cells."}
+            )
+        if self.fanout == self.Fanout.ZIPF and self.exponent <= 1:
+            raise ValidationError(
+                {"exponent": "Exponent must be greater than 1."}
+            )
@@ -0,0 +1,44 @@
+from hashlib import blake2b
+from typing import Callable, Iterable, Iterator
+
+# generates a column of `n` values
+Filler = Callable[[int], list]
+
+
+class StreamedText:
+    """A huge text cell, generated piece by piece while it's written,
+    so it's never held in memory as a whole. Can be iterated once.
+
+    `alphabet` is every character the text can contain, so writers can decide
+    on quoting before seeing it. Length and a 64-bit hash (the one used for
+    distinct values statistics) are known once the text is consumed."""
+
+    def __init__(self, pieces: Iterable[str], alphabet: frozenset[str]):
+        self._pieces = pieces
+        self.alphabet = alphabet
+        self.length = 0
+        self._hash = blake2b(digest_size=8)
+
+    def __iter__(self) -> Iterator[str]:
+        for piece in self._pieces:
+            self.length += len(piece)
+            self._hash.update(piece.encode())
+            yield piece
+
+    def __str__(self) -> str:
+        """The whole text, for consumers that can't write it in pieces"""
+        return "".join(self)
+
+    def head(self, length: int) -> str:
+        """The first `length` characters, the text is generated only that far
+        (the rest of it is never generated)"""
+        pieces, read = [], 0
+        for piece in self:
+            pieces.append(piece)
+            read += len(piece)
+            if read >= length:
+                break
+        return "".join(pieces)[:length]
+
+    def digest(self) -> bytes:
+        return self._hash.digest()
@@ -0,0 +1,77 @@
+"""Categorical values picked by user-defined weights.
+
+Picks go through an alias table (Vose's alias method), built once
+for a column: a value costs a single random number and a comparison,
+whatever the number of categories."""
+
+from functools import lru_cache
+from math import isfinite
+from random import Random
+from typing import Any, Optional, Sequence
+
+from .cells import Filler
+
+
+def parse_values(choices: str) -> list[str]:
+    """Values are the non-empty lines of the text"""
+    return [line for line in choices.splitlines() if line.strip()]
+
+
+def parse_weights(weights: str) -> Optional[list[float]]:
+    """Comma-separated numbers, None if empty (values are equally likely).
+    Raise ValueError if not numbers."""
+    if not weights.strip():
+        return None
+    parsed = [float(weight) for weight in weights.split(",")]
+    if not all(map(isfinite, parsed)):
+        raise ValueError("Weights must be finite numbers.")
+    return parsed
+
+
+class AliasTable:
+    def __init__(
+        self, values: Sequence[Any], weights: Optional[Sequence[float]]
+    ):
+        size = len(values)
+        weights = weights or [1.0] * size
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        # the probability of keeping the value of the column, else its alias
+        keep = [1.0] * size
+        alias = list(range(size))
+        small = [idx for idx, weight in enumerate(scaled) if weight < 1]
+        large = [idx for idx, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            keep[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        self.size = size
+        self.values = list(values)
+        self.aliases = [values[idx] for idx in alias]
+        # a uniform number `x` in [0, size) falls into column `int(x)`,
+        # and keeps its value if less than the threshold
+        self.thresholds = [idx + keep[idx] for idx in range(size)]
+
+    def sample(self, random: Random, n: int) -> list:
+        size, values, aliases = self.size, self.values, self.aliases
+        thresholds = self.thresholds
+        return [
+            values[idx] if x < thresholds[idx] else aliases[idx]
+            for x in [random.random() * size for _ in range(n)]
+            for idx in (int(x),)
+        ]
+
+
+@lru_cache(maxsize=64)
+def alias_table(choices: str, weights: str) -> AliasTable:
+    return AliasTable(parse_values(choices), parse_weights(weights))
+
+
+def weighted_choice_filler(
+    faker: Any, choices: str, weights: str = ""
+) -> Filler:
+    table = alias_table(choices, weights)
+    random = faker.random
+    return lambda n: table.sample(random, n)
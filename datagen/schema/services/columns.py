@@ -0,0 +1,69 @@
+"""Columns as generation and its consumers (writers, stats) see them,
+apart from the generator, so the consumers don't import Faker."""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+
+class ValueKind(Enum):
+    """What kind of values a column type produces,
+    for the consumers that treat them differently (stats, encoders)"""
+
+    INTEGER = "integer"
+    # formatted decimal numbers, see `distributions`
+    DECIMAL = "decimal"
+    DATE = "date"
+    # dates and times in a format of the column, see `dates`
+    TIMESTAMP = "timestamp"
+    TEXT = "text"
+
+
+VALUE_KINDS: dict[str, ValueKind] = {
+    "random_int": ValueKind.INTEGER,
+    "distributed_int": ValueKind.INTEGER,
+    "distributed_float": ValueKind.DECIMAL,
+    "sequence": ValueKind.INTEGER,
+    "foreign_key": ValueKind.INTEGER,
+    "date": ValueKind.DATE,
+    "date_range": ValueKind.TIMESTAMP,
+}
+
+
+# sentences cells with more sentences are streamed
+STREAMED_MIN_SENTENCES = 1000
+
+
+def sentences_streamed(nb_min: int = 3, nb_max: int = 6) -> bool:
+    return nb_max >= STREAMED_MIN_SENTENCES
+
+
+# column type -> whether cells with these params are `StreamedText`
+# (see `cells`), which writers and stats handle apart
+STREAMED: dict[str, Callable[..., bool]] = {
+    "sentences_variable_str": sentences_streamed,
+}
+
+
+def is_streamed(column_type: str, params: dict) -> bool:
+    return column_type in STREAMED and STREAMED[column_type](**params)
+
+
+@dataclass
+class ColumnDTO:
+    name: str
+    type: str
+    order: int
+    params: dict
+    unique: bool = False
+    # share of null (None) values
+    null_rate: float = 0
+
+    @property
+    def kind(self) -> ValueKind:
+        return VALUE_KINDS.get(self.type, ValueKind.TEXT)
+
+    @property
+    def streamed(self) -> bool:
+        """Whether values are `StreamedText` in generated blocks"""
+        return is_streamed(self.type, self.params)
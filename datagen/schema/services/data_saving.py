@@ -1,19 +1,731 @@
-import csv
+import hashlib
+import os
+import re
+import sqlite3
+import string
 import uuid
+import zipfile
+from dataclasses import dataclass
+from io import StringIO
+from json import dumps
+from json.encoder import encode_basestring  # type: ignore[attr-defined]
 from pathlib import Path
-from typing import Iterable
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Callable,
+    Generator as GeneratorType,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+)
+from xml.sax.saxutils import escape as escape_xml
 
+from .cells import StreamedText
+from .columns import ColumnDTO, ValueKind
+from .locales import DEFAULT_LOCALE
 
-def generate_to_csv(
-    generator: Iterable, header: list[str], delimiter: str, quotechar: str
-) -> Path:
-    tmp_path = Path(f"/tmp/{uuid.uuid4()}")
 
-    with open(tmp_path, "w") as csv_file:
-        csv_writer = csv.writer(
-            csv_file, delimiter=delimiter, quotechar=quotechar
+NUMERIC_KINDS = (ValueKind.INTEGER, ValueKind.DECIMAL)
+
+
+@dataclass
+class WrittenFile:
+    """A written temporary file with its size and checksum.
+    Can be used in place of its path."""
+
+    path: Path
+    size: int
+    sha256: str
+    num_rows: int
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+
+class HashingFile:
+    """Text writing interface over a binary file,
+    counting bytes and computing SHA-256 of everything written through it"""
+
+    def __init__(self, file: BinaryIO, encoding: str = "utf-8"):
+        self.file = file
+        self.encoding = encoding
+        self.size = 0
+        self._hash = hashlib.sha256()
+
+    def write(self, data: str) -> int:
+        return self.write_bytes(data.encode(self.encoding))
+
+    def write_bytes(self, data: bytes) -> int:
+        self.size += len(data)
+        self._hash.update(data)
+        return self.file.write(data)
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+
+@dataclass
+class FormatOptions:
+    """Output settings of a schema, every writer takes what it needs"""
+
+    delimiter: str = ","
+    quotechar: str = '"'
+    table_name: str = "dataset"
+    batch_size: int = 1000
+    # how nulls are written in CSV, other formats have their own
+    null: str = ""
+    # of the values
+    locales: Sequence[str] = (DEFAULT_LOCALE,)
+
+
+class DatasetWriter:
+    """Writes blocks of rows of a single output file"""
+
+    extension: str
+    # how the format writes nulls (None values), see `encode_nulls`
+    null = ""
+
+    def __init__(
+        self,
+        file: HashingFile,
+        columns: list[ColumnDTO],
+        options: FormatOptions,
+    ):
+        self.file = file
+        self.columns = columns
+        self.options = options
+        self.streams = any(column.streamed for column in columns)
+
+    def write_header(self) -> None:
+        pass
+
+    def write_rows(self, rows: list[list]) -> None:
+        raise NotImplementedError
+
+    def write_footer(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        """Release what the writer holds besides the file, when writing
+        stops on an error. The file is removed by `generate_to_files`."""
+
+    def get_encoders(
+        self, text: Callable[[Any], str], numeric: Callable[[Any], str] = str
+    ) -> list[Callable[[Any], str]]:
+        """An encoder per column: numbers are written as they are
+        and everything else with the text encoder of the format.
+        Streamed texts are read whole, see `write_streaming` to avoid that."""
+        return [
+            numeric
+            if column.kind in NUMERIC_KINDS
+            else (lambda cell: text(str(cell)))
+            if column.streamed
+            else text
+            for column in self.columns
+        ]
+
+    def encode_nulls(
+        self, encoders: list[Callable[[Any], Any]]
+    ) -> list[Callable[[Any], Any]]:
+        """Make encoders of columns with nulls write them as `null`"""
+        return [
+            self._or_null(encode, self.null) if column.null_rate else encode
+            for column, encode in zip(self.columns, encoders)
+        ]
+
+    @staticmethod
+    def _or_null(
+        encode: Callable[[Any], Any], null: str
+    ) -> Callable[[Any], Any]:
+        return lambda cell: null if cell is None else encode(cell)
+
+    @staticmethod
+    def keep_streamed(cell: Any) -> Any:
+        """Encoder leaving streamed texts for `write_streaming`"""
+        return cell
+
+    def write_streaming(
+        self,
+        rows: Iterable[Sequence],
+        prefixes: list[str],
+        suffix: str,
+        write_cell: Callable[[StreamedText], None],
+    ) -> None:
+        """Write encoded rows where streamed texts are left as they are:
+        everything before such a cell is written out, then the cell itself
+        piece by piece with `write_cell`. Every value is preceded by its
+        prefix, and every row is followed by the suffix."""
+        parts: list[str] = []
+        for row in rows:
+            for prefix, value in zip(prefixes, row):
+                parts.append(prefix)
+                if isinstance(value, StreamedText):
+                    self.file.write("".join(parts))
+                    parts.clear()
+                    write_cell(value)
+                else:
+                    parts.append(value)
+            parts.append(suffix)
+        self.file.write("".join(parts))
+
+    @staticmethod
+    def encode_rows(
+        rows: list[list], encoders: Sequence[Callable[[Any], Any]]
+    ) -> Iterator[tuple]:
+        """Encode values column by column, with an encoder per column"""
+        return zip(
+            *(
+                map(encode, values)
+                for encode, values in zip(encoders, zip(*rows))
+            )
+        )
+
+
+class CSVWriter(DatasetWriter):
+    """Output of `csv.writer` with the default (minimal) quoting,
+    byte for byte, but faster: which columns need to be scanned for special
+    characters is worked out once from the characters their values consist
+    of, and the other columns are joined as they are."""
+
+    extension = "csv"
+    LINE_TERMINATOR = "\r\n"
+    # characters the values of a column type can consist of
+    SAFE_ALPHABETS = {
+        "random_int": string.digits + "-",
+        "distributed_int": string.digits + "-",
+        "distributed_float": string.digits + "-.",
+        "date": string.digits + "-",
+        "sequence": string.digits + "-",
+        "foreign_key": string.digits + "-",
+        "uuid": string.hexdigits.lower() + "-",
+    }
+    # the same for localized column types, by locale; the values
+    # of other locales may consist of anything
+    LOCALIZED_ALPHABETS = {
+        "phone_number": {"en_US": string.digits + "()+-.x"},
+    }
+
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        delimiter, quotechar = self.options.delimiter, self.options.quotechar
+        self._special = set(delimiter + quotechar + self.LINE_TERMINATOR)
+        self._needs_quoting = re.compile(
+            f"[{re.escape(''.join(self._special))}]"
+        ).search
+        self._doubled_quote = quotechar * 2
+        # `csv.writer` quotes a lone empty field, so the row isn't blank
+        self._quote_text = (
+            self.quote_single if len(self.columns) == 1 else self.quote
+        )
+        plain: Callable[[Any], Any] = str
+        self._encoders = [
+            self.keep_streamed
+            if column.streamed
+            else plain
+            if self.is_safe(column)
+            else self._quote_text
+            for column in self.columns
+        ]
+        self.null = self._quote_text(self.options.null)
+        self._encoders = self.encode_nulls(self._encoders)
+
+    def is_safe(self, column: ColumnDTO) -> bool:
+        alphabet = self.SAFE_ALPHABETS.get(column.type)
+        by_locale = self.LOCALIZED_ALPHABETS.get(column.type, {})
+        if by_locale and set(self.options.locales) <= by_locale.keys():
+            alphabet = "".join(
+                by_locale[locale] for locale in self.options.locales
+            )
+        return alphabet is not None and self._special.isdisjoint(alphabet)
+
+    def quote(self, value: Any) -> str:
+        text = str(value)
+        if self._needs_quoting(text):
+            quotechar = self.options.quotechar
+            return (
+                quotechar
+                + text.replace(quotechar, self._doubled_quote)
+                + quotechar
+            )
+        return text
+
+    def quote_single(self, value: Any) -> str:
+        return self.quote(value) or self._doubled_quote
+
+    def write_header(self) -> None:
+        self._write_encoded(
+            [[self._quote_text(column.name) for column in self.columns]]
+        )
+
+    def write_rows(self, rows: list[list]) -> None:
+        if not self.columns:
+            self.file.write(self.LINE_TERMINATOR * len(rows))
+        elif rows:
+            self._write_encoded(self.encode_rows(rows, self._encoders))
+
+    def _write_encoded(self, rows: Iterable[Sequence[str]]) -> None:
+        delimiter, terminator = self.options.delimiter, self.LINE_TERMINATOR
+        if self.streams:
+            prefixes = [""] + [delimiter] * (len(self.columns) - 1)
+            self.write_streaming(rows, prefixes, terminator, self._write_cell)
+            return
+        self.file.write(
+            "".join([delimiter.join(row) + terminator for row in rows])
+        )
+
+    def _write_cell(self, cell: StreamedText) -> None:
+        # quoted if it may need to be, as its content is yet unknown
+        if self._special.isdisjoint(cell.alphabet):
+            for piece in cell:
+                self.file.write(piece)
+            return
+        quotechar = self.options.quotechar
+        self.file.write(quotechar)
+        for piece in cell:
+            self.file.write(piece.replace(quotechar, self._doubled_quote))
+        self.file.write(quotechar)
+
+
+class NDJSONWriter(DatasetWriter):
+    """A JSON object per line with column names as keys.
+    Encoding is done column by column with precomputed key prefixes
+    instead of building and dumping a dict per row."""
+
+    extension = "ndjson"
+    null = "null"
+
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self._prefixes = [
+            ("{" if idx == 0 else ",") + dumps(column.name) + ":"
+            for idx, column in enumerate(self.columns)
+        ]
+        self._encoders = self.get_encoders(text=encode_basestring)
+        if self.streams:
+            self._encoders = [
+                self.keep_streamed if column.streamed else encode
+                for column, encode in zip(self.columns, self._encoders)
+            ]
+        self._encoders = self.encode_nulls(self._encoders)
+
+    def write_rows(self, rows: list[list]) -> None:
+        if not rows:
+            return
+        if not self.columns:
+            self.file.write("{}\n" * len(rows))
+            return
+        if self.streams:
+            self.write_streaming(
+                self.encode_rows(rows, self._encoders),
+                self._prefixes,
+                "}\n",
+                self._write_cell,
+            )
+            return
+        encoded_columns = [
+            [prefix + value for value in map(encode, values)]
+            for prefix, encode, values in zip(
+                self._prefixes, self._encoders, zip(*rows)
+            )
+        ]
+        self.file.write(
+            "}\n".join(map("".join, zip(*encoded_columns))) + "}\n"
         )
-        csv_writer.writerow(header)
-        csv_writer.writerows(generator)
 
-    return tmp_path
+    def _write_cell(self, cell: StreamedText) -> None:
+        self.file.write('"')
+        for piece in cell:
+            self.file.write(encode_basestring(piece)[1:-1])
+        self.file.write('"')
+
+
+class SQLWriterMixin:
+    """Table definition for SQL dumps. Parts of a split dataset
+    can be loaded in any order, so the table is created if not exists."""
+
+    SQL_TYPES = {
+        ValueKind.INTEGER: "bigint",
+        ValueKind.DECIMAL: "numeric",
+        ValueKind.DATE: "date",
+        # formats are free, and not all of them are understood
+        ValueKind.TIMESTAMP: "text",
+        ValueKind.TEXT: "text",
+    }
+    columns: list[ColumnDTO]
+    options: FormatOptions
+
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    @property
+    def table(self) -> str:
+        return self.quote_identifier(self.options.table_name)
+
+    @property
+    def column_list(self) -> str:
+        return ", ".join(
+            map(self.quote_identifier, (c.name for c in self.columns))
+        )
+
+    def create_table(self) -> str:
+        definitions = ",\n".join(
+            f"    {self.quote_identifier(column.name)} {self.SQL_TYPES[column.kind]}"
+            for column in self.columns
+        )
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.table} (\n{definitions}\n);\n"
+        )
+
+
+class PostgresCopyWriter(SQLWriterMixin, DatasetWriter):
+    """`COPY ... FROM stdin` in the text format, to be run by `psql`"""
+
+    extension = "copy.sql"
+    null = "\\N"
+    ESCAPES = str.maketrans(
+        {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+    )
+
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self._encoders = self.encode_nulls(self.get_encoders(text=self.escape))
+
+    @classmethod
+    def escape(cls, value: str) -> str:
+        return value.translate(cls.ESCAPES)
+
+    def write_header(self) -> None:
+        self.file.write(
+            self.create_table()
+            + f"COPY {self.table} ({self.column_list}) FROM stdin;\n"
+        )
+
+    def write_rows(self, rows: list[list]) -> None:
+        self.file.write(
+            "".join(
+                "\t".join(row) + "\n"
+                for row in self.encode_rows(rows, self._encoders)
+            )
+        )
+
+    def write_footer(self) -> None:
+        self.file.write("\\.\n")
+
+
+class SQLInsertWriter(SQLWriterMixin, DatasetWriter):
+    """Multi-row `INSERT` statements of `batch_size` rows each"""
+
+    extension = "sql"
+    null = "NULL"
+
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self._encoders = self.encode_nulls(
+            self.get_encoders(text=self.literal)
+        )
+        self._pending: list[str] = []
+
+    @staticmethod
+    def literal(value: str) -> str:
+        return "'" + value.replace("'", "''") + "'"
+
+    def write_header(self) -> None:
+        self.file.write(self.create_table())
+
+    def write_rows(self, rows: list[list]) -> None:
+        self._pending.extend(
+            "(" + ", ".join(row) + ")"
+            for row in self.encode_rows(rows, self._encoders)
+        )
+        batch_size = self.options.batch_size
+        while len(self._pending) >= batch_size:
+            self._write_batch(self._pending[:batch_size])
+            del self._pending[:batch_size]
+
+    def write_footer(self) -> None:
+        if self._pending:
+            self._write_batch(self._pending)
+            self._pending = []
+
+    def _write_batch(self, values: list[str]) -> None:
+        self.file.write(
+            f"INSERT INTO {self.table} ({self.column_list}) VALUES\n"
+            + ",\n".join(values)
+            + ";\n"
+        )
+
+
+class SQLiteWriter(SQLWriterMixin, DatasetWriter):
+    """A ready-to-use SQLite database with a single table.
+    The database is built in a temporary file with journaling and syncing
+    off, in a single transaction, and copied into the output when complete.
+    So the output size is unknown until the footer is written."""
+
+    extension = "sqlite"
+    SQL_TYPES = {
+        ValueKind.INTEGER: "INTEGER",
+        ValueKind.DECIMAL: "REAL",
+        ValueKind.DATE: "TEXT",  # ISO 8601, as SQLite has no date type
+        ValueKind.TIMESTAMP: "TEXT",
+        ValueKind.TEXT: "TEXT",
+    }
+    COPY_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self._path = Path(f"/tmp/{uuid.uuid4()}.sqlite")
+        # transactions are managed explicitly
+        self._db = sqlite3.connect(self._path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        placeholders = ", ".join("?" * len(self.columns))
+        self._insert = (
+            f"INSERT INTO {self.table} ({self.column_list}) "
+            f"VALUES ({placeholders})"
+        )
+
+    def write_header(self) -> None:
+        self._db.execute(self.create_table())
+        self._db.execute("BEGIN")
+
+    def write_rows(self, rows: list[list]) -> None:
+        if self.streams:
+            rows = [
+                [str(v) if isinstance(v, StreamedText) else v for v in row]
+                for row in rows
+            ]
+        self._db.executemany(self._insert, rows)
+
+    def write_footer(self) -> None:
+        self._db.execute("COMMIT")
+        self._db.close()
+        with open(self._path, "rb") as database:
+            while chunk := database.read(self.COPY_CHUNK_SIZE):
+                self.file.write_bytes(chunk)
+        os.remove(self._path)
+
+    def abort(self) -> None:
+        self._db.close()
+        self._path.unlink(missing_ok=True)
+
+
+class _BinaryStream:
+    """Binary file interface over `HashingFile`, for `zipfile`"""
+
+    def __init__(self, file: HashingFile):
+        self.write = file.write_bytes
+
+    def flush(self) -> None:
+        pass
+
+
+class XLSXWriter(DatasetWriter):
+    """Excel workbook written as a stream: worksheet XML goes straight
+    into a deflated zip entry, so memory use doesn't depend on the number
+    of rows. A sheet holds up to `SHEET_MAX_ROWS` rows including the header,
+    the rest rolls over to new sheets. Texts are inline strings, so there
+    is no shared strings table to keep in memory.
+
+    Excel refuses workbooks with control characters XML doesn't allow or
+    cells over `CELL_MAX_LENGTH` characters, so texts lose the former
+    and are cut to the latter (streamed texts are only generated that far)."""
+
+    extension = "xlsx"
+    null = "<c/>"
+    SHEET_MAX_ROWS = 1_048_576
+    CELL_MAX_LENGTH = 32_767
+    ILLEGAL_CHARACTERS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+    NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    RELATIONSHIPS = (
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    )
+    PACKAGE_RELATIONSHIPS = (
+        "http://schemas.openxmlformats.org/package/2006/relationships"
+    )
+    CONTENT_TYPE = "application/vnd.openxmlformats-officedocument"
+
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self._zip = zipfile.ZipFile(
+            _BinaryStream(self.file),  # type: ignore[arg-type]
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+        )
+        self._sheet: Optional[IO[bytes]] = None
+        self._num_sheets = 0
+        self._sheet_rows = 0
+        encoders = self.get_encoders(
+            text=self.text_cell, numeric=self.number_cell
+        )
+        for i, column in enumerate(self.columns):
+            if column.streamed:
+                encoders[i] = self.streamed_cell
+        self._encoders = self.encode_nulls(encoders)
+
+    @classmethod
+    def text_cell(cls, value: Any) -> str:
+        text = cls.ILLEGAL_CHARACTERS.sub("", str(value))
+        return (
+            '<c t="inlineStr"><is><t xml:space="preserve">'
+            + escape_xml(text[: cls.CELL_MAX_LENGTH])
+            + "</t></is></c>"
+        )
+
+    @classmethod
+    def streamed_cell(cls, value: StreamedText) -> str:
+        return cls.text_cell(value.head(cls.CELL_MAX_LENGTH))
+
+    @staticmethod
+    def number_cell(value: Any) -> str:
+        return f"<c><v>{value}</v></c>"
+
+    def write_header(self) -> None:
+        self._new_sheet()
+
+    def write_rows(self, rows: list[list]) -> None:
+        while rows:
+            if self._sheet_rows >= self.SHEET_MAX_ROWS:
+                self._new_sheet()
+            left = self.SHEET_MAX_ROWS - self._sheet_rows
+            self._write_cells(self.encode_rows(rows[:left], self._encoders))
+            rows = rows[left:]
+
+    def write_footer(self) -> None:
+        self._close_sheet()
+        sheets = range(1, self._num_sheets + 1)
+        self._write_entry(
+            "[Content_Types].xml",
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{self.CONTENT_TYPE}.spreadsheetml.sheet.main+xml"/>'
+            + "".join(
+                f'<Override PartName="/xl/worksheets/sheet{n}.xml" ContentType="{self.CONTENT_TYPE}.spreadsheetml.worksheet+xml"/>'
+                for n in sheets
+            )
+            + "</Types>",
+        )
+        self._write_entry(
+            "_rels/.rels",
+            f'<Relationships xmlns="{self.PACKAGE_RELATIONSHIPS}">'
+            f'<Relationship Id="rId1" Type="{self.RELATIONSHIPS}/officeDocument" Target="xl/workbook.xml"/>'
+            "</Relationships>",
+        )
+        self._write_entry(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{self.NAMESPACE}" xmlns:r="{self.RELATIONSHIPS}"><sheets>'
+            + "".join(
+                f'<sheet name="Sheet{n}" sheetId="{n}" r:id="rId{n}"/>'
+                for n in sheets
+            )
+            + "</sheets></workbook>",
+        )
+        self._write_entry(
+            "xl/_rels/workbook.xml.rels",
+            f'<Relationships xmlns="{self.PACKAGE_RELATIONSHIPS}">'
+            + "".join(
+                f'<Relationship Id="rId{n}" Type="{self.RELATIONSHIPS}/worksheet" Target="worksheets/sheet{n}.xml"/>'
+                for n in sheets
+            )
+            + "</Relationships>",
+        )
+        self._zip.close()
+
+    def _write_entry(self, name: str, xml: str) -> None:
+        self._zip.writestr(
+            name,
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + xml,
+        )
+
+    def _new_sheet(self) -> None:
+        self._close_sheet()
+        self._num_sheets += 1
+        self._sheet = self._zip.open(
+            f"xl/worksheets/sheet{self._num_sheets}.xml", "w", force_zip64=True
+        )
+        self._sheet.write(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<worksheet xmlns="{self.NAMESPACE}"><sheetData>'.encode()
+        )
+        self._sheet_rows = 0
+        self._write_cells([[self.text_cell(c.name) for c in self.columns]])
+
+    def _write_cells(self, rows: Iterable[Iterable[str]]) -> None:
+        """Write rows of encoded cells to the current sheet"""
+        assert self._sheet
+        xml_rows = ["<row>" + "".join(row) + "</row>" for row in rows]
+        self._sheet.write("".join(xml_rows).encode())
+        self._sheet_rows += len(xml_rows)
+
+    def _close_sheet(self) -> None:
+        if self._sheet:
+            self._sheet.write(b"</sheetData></worksheet>")
+            self._sheet.close()
+            self._sheet = None
+
+
+WRITERS: dict[str, type[DatasetWriter]] = {
+    "csv": CSVWriter,
+    "ndjson": NDJSONWriter,
+    "pg_copy": PostgresCopyWriter,
+    "sql": SQLInsertWriter,
+    "sqlite": SQLiteWriter,
+    "xlsx": XLSXWriter,
+}
+
+
+def generate_to_files(
+    blocks: Iterable[list[list]],
+    make_writer: Callable[[HashingFile], DatasetWriter],
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> GeneratorType[WrittenFile, None, None]:
+    """Write blocks of rows into consecutive files,
+    yielding every file as soon as it is complete.
+    A file is complete when it has `max_rows` rows or reaches `max_bytes`
+    (so it can be bigger by the last block, but has at least one row).
+    Without limits it's a single file.
+    There is always at least one file, even if there are no rows.
+    If writing fails (as generating the blocks may), the incomplete file
+    is removed."""
+    blocks = iter(blocks)
+    block: list[list] = next(blocks, [])
+    is_first = True
+    while is_first or block:
+        is_first = False
+        tmp_path = Path(f"/tmp/{uuid.uuid4()}")
+        num_rows = 0
+        writer: Optional[DatasetWriter] = None
+
+        try:
+            with open(tmp_path, "wb") as raw_file:
+                file = HashingFile(raw_file)
+                writer = make_writer(file)
+                writer.write_header()
+                while block:
+                    if num_rows and max_bytes and file.size >= max_bytes:
+                        break
+                    if max_rows:
+                        if num_rows >= max_rows:
+                            break
+                        left = max_rows - num_rows
+                        rows, block = block[:left], block[left:]
+                    else:
+                        rows, block = block, []
+                    writer.write_rows(rows)
+                    num_rows += len(rows)
+                    if not block:
+                        block = next(blocks, [])
+                writer.write_footer()
+        except BaseException:
+            if writer:
+                writer.abort()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        yield WrittenFile(tmp_path, file.size, file.sha256, num_rows)
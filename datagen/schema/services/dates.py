@@ -0,0 +1,258 @@
+"""Dates and times between bounds, or as a time series,
+generated as Unix timestamps (whole seconds) and formatted in bulk.
+
+A format is split into parts depending only on the day (like "%Y-%m-%d")
+and only on the time of day (like "%H:%M"), and every part is formatted
+once per distinct day or second of the day, then looked up. Formats with
+other directives (zone names, locale's date and time) are formatted
+value by value. Offsets of the time zone are looked up among its
+transitions (DST changes), see `ZoneOffsets`."""
+
+import re
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from random import Random
+from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo
+
+from .cells import Filler
+
+RANDOM = "random"
+SERIES = "series"
+
+DIRECTIVE = re.compile(r"%.")
+DAY_DIRECTIVES = set("aAwdbBmyYjUWGuV")
+TIME_DIRECTIVES = set("HIpMSf")
+SECONDS_PER_DAY = 24 * 60 * 60
+EPOCH = date(1970, 1, 1)
+DEFAULT_FORMAT = "%Y-%m-%d %H:%M:%S"
+# directives of formats whose texts sort in the order of time, see
+# `is_chronological`
+CHRONOLOGICAL_DIRECTIVES = ["%Y", "%m", "%d", "%H", "%M", "%S"]
+# distinct days formatted are kept, 45 years of them
+DAYS_CACHE_SIZE = 1 << 14
+
+# formats part of a timestamp, given its day or second of the day
+PartFormatter = Callable[[int], str]
+
+
+def _format_day(form: str) -> PartFormatter:
+    @lru_cache(maxsize=DAYS_CACHE_SIZE)
+    def format_day(day: int) -> str:
+        return (EPOCH + timedelta(days=day)).strftime(form)
+
+    return format_day
+
+
+def _format_time(form: str) -> PartFormatter:
+    @lru_cache(maxsize=SECONDS_PER_DAY)
+    def format_time(second: int) -> str:
+        return time(second // 3600, second // 60 % 60, second % 60).strftime(
+            form
+        )
+
+    return format_time
+
+
+def split_format(form: str) -> Optional[list[tuple[bool, str]]]:
+    """Split a format into parts, each formatted by the day (True)
+    or by the time of day (False). Literals stick to the preceding part.
+    None if the format has other directives."""
+    parts: list[tuple[bool, str]] = []
+    position = 0
+    for match in DIRECTIVE.finditer(form):
+        directive = match.group()[1]
+        if directive == "%":
+            continue
+        if directive in DAY_DIRECTIVES:
+            by_day = True
+        elif directive in TIME_DIRECTIVES:
+            by_day = False
+        else:
+            return None
+        literal = form[position : match.start()]
+        if parts and parts[-1][0] is by_day:
+            parts[-1] = (by_day, parts[-1][1] + literal + match.group())
+        elif parts:
+            parts[-1] = (parts[-1][0], parts[-1][1] + literal)
+            parts.append((by_day, match.group()))
+        else:
+            parts.append((by_day, literal + match.group()))
+        position = match.end()
+    if not parts:
+        return None
+    parts[-1] = (parts[-1][0], parts[-1][1] + form[position:])
+    return parts
+
+
+class ZoneOffsets:
+    """UTC offsets of a time zone, looked up by bisecting its transitions.
+    The transitions are found once for the timestamps seen so far, by
+    checking the offset every `SCAN_STEP` seconds (no zone changes it twice
+    within a day). Zones of a constant offset have no transitions to find."""
+
+    SCAN_STEP = SECONDS_PER_DAY
+
+    def __init__(self, zone: ZoneInfo):
+        self.zone = zone
+        fixed = zone.utcoffset(None)
+        self.fixed = None if fixed is None else int(fixed.total_seconds())
+        # timestamps the offsets begin at, and the offsets: `offsets[i]`
+        # is before `transitions[i]`, the last one is after all of them
+        self.transitions: list[int] = []
+        self.offsets: list[int] = []
+        self.first = self.last = 0  # the timestamps the transitions cover
+
+    def offset(self, timestamp: int) -> int:
+        utcoffset = datetime.fromtimestamp(timestamp, self.zone).utcoffset()
+        return int(utcoffset.total_seconds()) if utcoffset else 0
+
+    def to_local(self, timestamps: list[int]) -> list[int]:
+        """The timestamps shifted by their offsets"""
+        if self.fixed is not None:
+            fixed = self.fixed
+            return [timestamp + fixed for timestamp in timestamps]
+        if not timestamps:
+            return []
+        self.cover(min(timestamps), max(timestamps))
+        transitions, offsets = self.transitions, self.offsets
+        if not transitions:
+            offset = offsets[0]
+            return [timestamp + offset for timestamp in timestamps]
+        return [
+            timestamp + offsets[bisect_right(transitions, timestamp)]
+            for timestamp in timestamps
+        ]
+
+    def cover(self, first: int, last: int) -> None:
+        """Find the transitions between the timestamps"""
+        if not self.offsets:
+            self.transitions, self.offsets = self._scan(first, last)
+            self.first, self.last = first, last
+            return
+        if first < self.first:
+            transitions, offsets = self._scan(first, self.first)
+            self.transitions = transitions + self.transitions
+            self.offsets = offsets[:-1] + self.offsets
+            self.first = first
+        if last > self.last:
+            transitions, offsets = self._scan(self.last, last)
+            self.transitions += transitions
+            self.offsets += offsets[1:]
+            self.last = last
+
+    def _scan(self, first: int, last: int) -> tuple[list[int], list[int]]:
+        """Transitions after `first` up to `last`, and the offsets
+        from `first` on"""
+        transitions, offsets = [], [self.offset(first)]
+        low = first
+        while low < last:
+            high = min(low + self.SCAN_STEP, last)
+            if self.offset(high) != offsets[-1]:
+                # bisect for the first second of the new offset
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self.offset(middle) == offsets[-1]:
+                        low = middle
+                    else:
+                        high = middle
+                transitions.append(high)
+                offsets.append(self.offset(high))
+            low = high
+        return transitions, offsets
+
+
+def is_chronological(form: str) -> bool:
+    """Whether texts of the format sort in the order of time: its
+    directives go from the year down, so they are of fixed widths
+    at fixed positions"""
+    directives = [
+        directive for directive in DIRECTIVE.findall(form) if directive != "%%"
+    ]
+    return bool(directives) and (
+        directives == CHRONOLOGICAL_DIRECTIVES[: len(directives)]
+    )
+
+
+def timestamps_formatter(
+    form: str, timezone: str
+) -> Callable[[list[int]], list[str]]:
+    zone = ZoneInfo(timezone)
+    parts = split_format(form)
+    if parts is None:
+        return lambda timestamps: [
+            datetime.fromtimestamp(timestamp, zone).strftime(form)
+            for timestamp in timestamps
+        ]
+    formatters = [
+        (by_day, (_format_day if by_day else _format_time)(part))
+        for by_day, part in parts
+    ]
+    offsets = ZoneOffsets(zone)
+
+    def format_all(timestamps: list[int]) -> list[str]:
+        local = offsets.to_local(timestamps)
+        days, seconds = (
+            [timestamp // SECONDS_PER_DAY for timestamp in local],
+            [timestamp % SECONDS_PER_DAY for timestamp in local],
+        )
+        columns = [
+            map(format_part, days if by_day else seconds)
+            for by_day, format_part in formatters
+        ]
+        if len(columns) == 1:
+            return list(columns[0])
+        return list(map("".join, zip(*columns)))
+
+    return format_all
+
+
+def random_timestamps(random: Random, start: int, end: int) -> Filler:
+    span = end - start + 1
+    return lambda n: [start + int(random.random() * span) for _ in range(n)]
+
+
+def series_timestamps(random: Random, first: float, interval: float) -> Filler:
+    """Increasing timestamps, exponentially distributed increments
+    of `interval` seconds on average"""
+    position = first
+    rate = 1 / interval
+
+    def fill(n: int) -> list[int]:
+        nonlocal position
+        positions = list(
+            accumulate(
+                (random.expovariate(rate) for _ in range(n)),
+                initial=position,
+            )
+        )
+        position = positions.pop()
+        return list(map(int, positions))
+
+    return fill
+
+
+def date_range_filler(
+    faker: Any,
+    first_row: int,
+    start: datetime,
+    end: datetime,
+    format: str = DEFAULT_FORMAT,
+    timezone: str = "UTC",
+    mode: str = RANDOM,
+    interval: int = 60,
+) -> Filler:
+    """A time series continues from the expected time of `first_row`"""
+    random = faker.random
+    if mode == SERIES:
+        timestamps = series_timestamps(
+            random, start.timestamp() + first_row * interval, interval
+        )
+    else:
+        timestamps = random_timestamps(
+            random, int(start.timestamp()), int(end.timestamp())
+        )
+    format_all = timestamps_formatter(format, timezone)
+    return lambda n: format_all(timestamps(n))
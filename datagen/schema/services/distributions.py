@@ -0,0 +1,124 @@
+"""Numbers following a distribution, clamped to bounds.
+
+Normal and log-normal ones are given by the mean and standard deviation
+of the values. Zipf values are ranks starting from the lower bound, and
+Poisson ones are counts with the given mean. Values out of bounds are
+moved to the nearest bound."""
+
+from functools import lru_cache
+from math import exp, floor, lgamma, log, sqrt
+from random import Random
+from typing import Any, Callable
+
+from .cells import Filler
+from .choices import AliasTable
+
+NORMAL = "normal"
+LOGNORMAL = "lognormal"
+ZIPF = "zipf"
+POISSON = "poisson"
+
+# Poisson probabilities are tabled (and picked from an alias table)
+# within this many standard deviations of the mean, the rest is negligible
+POISSON_TABLE_DEVIATIONS = 10
+# above this mean, Poisson values are approximated by normal ones
+POISSON_MAX_TABLED_MEAN = 1_000_000
+
+# generates `n` numbers
+Sampler = Callable[[Random, int], list]
+
+
+def clamp(values: list, low: float, high: float) -> list:
+    return [low if x < low else high if x > high else x for x in values]
+
+
+def normal_sampler(mean: float, deviation: float) -> Sampler:
+    return lambda random, n: [random.gauss(mean, deviation) for _ in range(n)]
+
+
+def lognormal_sampler(mean: float, deviation: float) -> Sampler:
+    # parameters of the normal distribution of the logarithm of values
+    sigma = sqrt(log(1 + (deviation / mean) ** 2))
+    mu = log(mean) - sigma**2 / 2
+    return lambda random, n: [
+        random.lognormvariate(mu, sigma) for _ in range(n)
+    ]
+
+
+def zipf_sampler(exponent: float) -> Sampler:
+    """Rejection sampling by Devroye, as in NumPy's `zipf`"""
+    a = exponent - 1
+    b = 2**a
+    # larger ranks would overflow, their probability is negligible
+    max_log_rank = 60 * log(2)
+
+    def sample(random: Random) -> int:
+        while True:
+            u = 1 - random.random()
+            if -log(u) / a > max_log_rank:
+                continue
+            x = floor(u ** (-1 / a))
+            t = (1 + 1 / x) ** a
+            if random.random() * x * (t - 1) / (b - 1) <= t / b:
+                return x
+
+    return lambda random, n: [sample(random) for _ in range(n)]
+
+
+def shifted(sample: Sampler, offset: float) -> Sampler:
+    return lambda random, n: [x + offset for x in sample(random, n)]
+
+
+def poisson_sampler(mean: float) -> Sampler:
+    if mean > POISSON_MAX_TABLED_MEAN:
+        deviation = sqrt(mean)
+        return lambda random, n: [
+            max(round(random.gauss(mean, deviation)), 0) for _ in range(n)
+        ]
+    spread = POISSON_TABLE_DEVIATIONS * (sqrt(mean) + 1)
+    counts = range(max(floor(mean - spread), 0), floor(mean + spread) + 1)
+    table = AliasTable(
+        counts,
+        [exp(k * log(mean) - mean - lgamma(k + 1)) for k in counts],
+    )
+    return table.sample
+
+
+@lru_cache(maxsize=64)
+def get_sampler(
+    distribution: str,
+    min: float,
+    max: float,
+    mean: float,
+    deviation: float,
+    exponent: float,
+) -> Sampler:
+    """Sampler of the distribution with values clamped to [min, max]"""
+    sample: Sampler
+    if distribution == NORMAL:
+        sample = normal_sampler(mean, deviation)
+    elif distribution == LOGNORMAL:
+        sample = lognormal_sampler(mean, deviation)
+    elif distribution == ZIPF:
+        sample = shifted(zipf_sampler(exponent), min - 1)
+    elif distribution == POISSON:
+        sample = poisson_sampler(mean)
+    else:
+        raise ValueError(f"Unknown distribution {distribution!r}.")
+    return lambda random, n: clamp(sample(random, n), min, max)
+
+
+def distributed_int_filler(faker: Any, **params: Any) -> Filler:
+    sample = get_sampler(**params)
+    random = faker.random
+    return lambda n: list(map(round, sample(random, n)))
+
+
+def distributed_float_filler(
+    faker: Any, precision: int = 2, **params: Any
+) -> Filler:
+    """Values are formatted with `precision` decimal places"""
+    sample = get_sampler(**params)
+    random = faker.random
+    form = f"%.{precision}f"
+    return lambda n: list(map(form.__mod__, sample(random, n)))
@@ -0,0 +1,110 @@
+"""Column fillers: functions generating a whole column of values at once.
+Column types without a specialized filler call the Faker formatter
+for every value. Fillers of huge texts
+return `cells.StreamedText` instead of strings."""
+
+from random import Random
+from typing import Any, Callable, Optional, Sequence
+
+from .cells import Filler
+from .choices import AliasTable, weighted_choice_filler
+from .dates import date_range_filler
+from .distributions import distributed_float_filler, distributed_int_filler
+from .patterns import pattern_filler
+from .pools import ValuePools
+from .providers import get_faker
+from .relations import foreign_key_filler
+from .sequences import code_filler, sequence_filler, uuid_filler
+from .templates import (
+    phone_number_filler,
+    safe_domain_name_filler,
+    safe_email_filler,
+)
+from .variable_sentences_provider import sentences_filler
+
+# column type -> builder of its filler from a Faker instance
+# and the column params
+FILLERS: dict[str, Callable[..., Filler]] = {
+    "phone_number": phone_number_filler,
+    "safe_email": safe_email_filler,
+    "safe_domain_name": safe_domain_name_filler,
+    "sentences_variable_str": sentences_filler,
+    "weighted_choice": weighted_choice_filler,
+    "distributed_int": distributed_int_filler,
+    "distributed_float": distributed_float_filler,
+    "uuid": uuid_filler,
+    "pattern": pattern_filler,
+    "foreign_key": foreign_key_filler,
+}
+
+# column type -> builder of its filler from a Faker instance, the number
+# of the first row (among all shards) and the column params,
+# for values depending on it
+ROW_FILLERS: dict[str, Callable[..., Filler]] = {
+    "sequence": sequence_filler,
+    "code": code_filler,
+    "date_range": date_range_filler,
+}
+
+# column types (besides `ROW_FILLERS`) with the same values in any locale
+LOCALE_FREE = {
+    "random_int",
+    "weighted_choice",
+    "distributed_int",
+    "distributed_float",
+    "uuid",
+    "pattern",
+    "foreign_key",
+}
+
+
+def get_filler(
+    column_type: str,
+    params: dict,
+    faker: Any = None,
+    pools: Optional[ValuePools] = None,
+    first_row: int = 0,
+) -> Filler:
+    faker = faker or get_faker()
+    if column_type in ROW_FILLERS:
+        return ROW_FILLERS[column_type](faker, first_row, **params)
+    if pools and not params:
+        if pooled := pools.get_filler(column_type, faker):
+            return pooled
+    if column_type in FILLERS:
+        return FILLERS[column_type](faker, **params)
+    method = getattr(faker, column_type)
+    return lambda n: [method(**params) for _ in range(n)]
+
+
+def is_localized(column_type: str) -> bool:
+    return column_type not in ROW_FILLERS and column_type not in LOCALE_FREE
+
+
+def mixed_filler(
+    fillers: Sequence[Filler], weights: Sequence[float], random: Random
+) -> Filler:
+    """Values of the fillers (of locales), each picked with its weight"""
+    table = AliasTable(range(len(fillers)), weights)
+
+    def fill(n: int) -> list:
+        picks = table.sample(random, n)
+        values = [
+            iter(fill_one(picks.count(idx)))
+            for idx, fill_one in enumerate(fillers)
+        ]
+        return [next(values[pick]) for pick in picks]
+
+    return fill
+
+
+def with_nulls(fill: Filler, null_rate: float, random: Random) -> Filler:
+    """Make about `null_rate` of values None. Which ones is decided
+    for a whole column at once, and only the rest of values is generated."""
+
+    def fill_with_nulls(n: int) -> list:
+        nulls = [random.random() < null_rate for _ in range(n)]
+        values = iter(fill(nulls.count(False)))
+        return [None if null else next(values) for null in nulls]
+
+    return fill_with_nulls
@@ -1,30 +1,108 @@
-from dataclasses import dataclass
-from typing import OrderedDict, List, Generator as GeneratorType, Iterable
+from functools import cached_property
+from typing import (
+    List,
+    Generator as GeneratorType,
+    Iterable,
+    Mapping,
+    Optional,
+)
 
-from factory import Faker, ListFactory
+from .columns import ColumnDTO
+from .fillers import (
+    ROW_FILLERS,
+    Filler,
+    get_faker,
+    get_filler,
+    is_localized,
+    mixed_filler,
+    with_nulls,
+)
+from .locales import DEFAULT_LOCALE
+from .pools import ValuePools
+from .unique import UniqueFilter
 
 
-@dataclass
-class ColumnDTO:
-    name: str
-    type: str
-    order: int
-    params: dict
+BLOCK_SIZE = 1000
 
 
 class Generator:
-    def __init__(self, columns: Iterable[ColumnDTO]):
+    def __init__(
+        self,
+        columns: Iterable[ColumnDTO],
+        pools: Optional[ValuePools] = None,
+        locales: Optional[Mapping[str, float]] = None,
+    ):
+        """Values of pooled column types are picked from `pools` if given.
+        `locales` are weights of locales values are made in
+        (see `locales.parse_locales`), by default the default locale."""
         self.fields = sorted(columns, key=lambda x: x.order)
+        self.pools = pools
+        self.locales = dict(locales or {DEFAULT_LOCALE: 1})
         self.header: list[str] = [field.name for field in self.fields]
 
-    def _get_Factory(self) -> type[ListFactory]:  # NOSONAR
-        key_values = [
-            (f"f_{idx}", Faker(field.type, **field.params))
-            for idx, field in enumerate(self.fields)
-        ]
-        return type("_Factory", (ListFactory,), OrderedDict(key_values))
-
-    def generate(self, num_records: int) -> GeneratorType[List, None, None]:
-        factory = self._get_Factory()
-        for _ in range(num_records):
-            yield factory()
+    def _get_filler(self, field: ColumnDTO, first_row: int = 0) -> Filler:
+        """Values of a column in a mix of locales are mixed independently
+        of the other columns"""
+        if len(self.locales) == 1 or not is_localized(field.type):
+            return get_filler(
+                field.type,
+                field.params,
+                get_faker(next(iter(self.locales))),
+                self.pools,
+                first_row,
+            )
+        return mixed_filler(
+            [
+                get_filler(
+                    field.type, field.params, get_faker(locale), self.pools
+                )
+                for locale in self.locales
+            ],
+            list(self.locales.values()),
+            get_faker().random,
+        )
+
+    @cached_property
+    def _fillers(self) -> list[Filler]:
+        return [self._get_filler(field) for field in self.fields]
+
+    def generate_blocks(
+        self,
+        num_records: int,
+        block_size: int = BLOCK_SIZE,
+        shard: int = 0,
+        num_shards: int = 1,
+        first_row: Optional[int] = None,
+    ) -> GeneratorType[List[List], None, None]:
+        """Generate rows grouped in lists of `block_size` (the last can be shorter),
+        so consumers can process them in bulk.
+        Values are generated column by column, see `fillers`.
+        Values of unique columns are unique among the generated rows
+        and those of the other `num_shards` shards, see `unique`.
+        Sequences start from the number of the `first_row` among all shards,
+        by default as if all shards had `num_records` rows.
+        Null values are None."""
+        if first_row is None:
+            first_row = shard * num_records
+        fillers = list(self._fillers)
+        for idx, field in enumerate(self.fields):
+            if field.type in ROW_FILLERS:
+                fillers[idx] = self._get_filler(field, first_row)
+            if field.unique:
+                # streamed texts can't be checked before they're written
+                if field.streamed:
+                    raise ValueError(f"Texts of {field.name} can't be unique.")
+                fillers[idx] = UniqueFilter(
+                    fillers[idx], num_records, shard, num_shards
+                )
+            if field.null_rate:
+                fillers[idx] = with_nulls(
+                    fillers[idx], field.null_rate, get_faker().random
+                )
+        for start in range(0, num_records, block_size):
+            size = min(block_size, num_records - start)
+            columns = [fill(size) for fill in fillers]
+            if not columns:
+                yield [[] for _ in range(size)]
+                continue
+            yield list(map(list, zip(*columns)))
@@ -0,0 +1,49 @@
+"""Locales of generated values: a single one or a weighted mix,
+like "en_US" or "en_US:3, de_DE:1"."""
+
+import pkgutil
+from functools import lru_cache
+from importlib.util import find_spec
+from math import isfinite
+from pathlib import Path
+
+# as `faker.config.DEFAULT_LOCALE`, which imports all of Faker
+DEFAULT_LOCALE = "en_US"
+
+
+@lru_cache(maxsize=None)
+def available_locales() -> frozenset[str]:
+    """Locales of Faker, as `faker.config.AVAILABLE_LOCALES`: subpackages
+    of its providers. These are only listed here, as importing them
+    to find out takes a while and web processes don't need Faker."""
+    spec = find_spec("faker")
+    assert spec and spec.origin
+    providers = Path(spec.origin).parent / "providers"
+    return frozenset(
+        module.name
+        for provider in pkgutil.iter_modules([str(providers)])
+        if provider.ispkg
+        for module in pkgutil.iter_modules([str(providers / provider.name)])
+        if module.ispkg
+    )
+
+
+def parse_locales(text: str) -> dict[str, float]:
+    """Locales by their weights (1 if not given), the default locale
+    if the text is empty. Raise ValueError if a locale is unknown
+    or a weight is not a positive number."""
+    locales: dict[str, float] = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        locale, _, weight = item.partition(":")
+        locale = locale.strip()
+        if locale not in available_locales():
+            raise ValueError(f"Unknown locale {locale!r}.")
+        try:
+            locales[locale] = float(weight) if weight.strip() else 1.0
+        except ValueError:
+            raise ValueError(f"Weight of {locale} is not a number.")
+        if not (isfinite(locales[locale]) and locales[locale] > 0):
+            raise ValueError(f"Weight of {locale} must be positive.")
+    return locales or {DEFAULT_LOCALE: 1.0}
@@ -0,0 +1,227 @@
+"""Strings matching a regular expression.
+
+A pattern is parsed by the `re` parser once and compiled into a plan
+of literals, character classes, repeats and alternatives, which fills
+a whole column at once. Characters of a class are drawn from random
+bytes in bulk, mapped to the class with `bytes.translate` (bytes that
+would make some characters more likely than others are dropped).
+Patterns that may match unbounded or unknown strings are rejected."""
+
+import re
+import string
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from importlib import import_module
+from itertools import accumulate
+from random import Random
+from typing import Any
+
+from .cells import Filler
+
+# the parser of `re`, moved into the package in Python 3.11
+sre_parse: Any = import_module(
+    "re._parser" if sys.version_info >= (3, 11) else "sre_parse"
+)
+sre_constants: Any = import_module(
+    "re._constants" if sys.version_info >= (3, 11) else "sre_constants"
+)
+
+# longest value a pattern may make
+MAX_LENGTH = 10_000
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: string.digits,
+    sre_constants.CATEGORY_WORD: string.ascii_letters + string.digits + "_",
+    sre_constants.CATEGORY_SPACE: " ",
+}
+# what "." stands for
+ANY_CHARACTER = string.ascii_letters + string.digits + string.punctuation
+
+
+class PatternError(ValueError):
+    pass
+
+
+class Node:
+    max_length: int
+
+    def fill(self, random: Random, n: int) -> list[str]:
+        raise NotImplementedError
+
+
+class Literal(Node):
+    def __init__(self, text: str):
+        self.text = text
+        self.max_length = len(text)
+
+    def fill(self, random: Random, n: int) -> list[str]:
+        return [self.text] * n
+
+
+class Chars(Node):
+    """A character of a class"""
+
+    max_length = 1
+
+    def __init__(self, alphabet: str):
+        self.alphabet = alphabet
+        size = len(alphabet)
+        self.table = None
+        if max(map(ord, alphabet)) < 256:
+            # bytes mapped to every character are equally likely
+            self.table = bytes(
+                ord(alphabet[byte % size]) for byte in range(256)
+            )
+            self.dropped = bytes(range(256 - 256 % size, 256))
+
+    def draw(self, random: Random, k: int) -> str:
+        """`k` characters as a string"""
+        if self.table is None:
+            return "".join(random.choices(self.alphabet, k=k))
+        pieces = []
+        while k > 0:
+            data = random.randbytes(k + k // 4 + 8)
+            piece = data.translate(self.table, self.dropped)[:k]
+            pieces.append(piece)
+            k -= len(piece)
+        return b"".join(pieces).decode("latin-1")
+
+    def fill(self, random: Random, n: int) -> list[str]:
+        return list(self.draw(random, n))
+
+
+class Repeat(Node):
+    def __init__(self, node: Node, min: int, max: int):
+        self.node = node
+        self.min = min
+        self.max = max
+        self.max_length = node.max_length * max
+
+    def fill(self, random: Random, n: int) -> list[str]:
+        if self.min == self.max:
+            counts = [self.min] * n
+        else:
+            counts = [random.randint(self.min, self.max) for _ in range(n)]
+        total = sum(counts)
+        offsets = list(accumulate(counts, initial=0))
+        if isinstance(self.node, Chars):
+            text = self.node.draw(random, total)
+            return [
+                text[start:end] for start, end in zip(offsets, offsets[1:])
+            ]
+        items = self.node.fill(random, total)
+        return [
+            "".join(items[start:end])
+            for start, end in zip(offsets, offsets[1:])
+        ]
+
+
+class Concat(Node):
+    def __init__(self, nodes: list[Node]):
+        self.nodes = nodes
+        self.max_length = sum(node.max_length for node in nodes)
+
+    def fill(self, random: Random, n: int) -> list[str]:
+        columns = [node.fill(random, n) for node in self.nodes]
+        return list(map("".join, zip(*columns)))
+
+
+class Branch(Node):
+    def __init__(self, options: list[Node]):
+        self.options = options
+        self.max_length = max(option.max_length for option in options)
+
+    def fill(self, random: Random, n: int) -> list[str]:
+        picks = random.choices(range(len(self.options)), k=n)
+        positions: defaultdict[int, list[int]] = defaultdict(list)
+        for position, pick in enumerate(picks):
+            positions[pick].append(position)
+        values: list[str] = [""] * n
+        for pick, pick_positions in positions.items():
+            option_values = self.options[pick].fill(
+                random, len(pick_positions)
+            )
+            for position, value in zip(pick_positions, option_values):
+                values[position] = value
+        return values
+
+
+def _class_alphabet(items: Any) -> str:
+    characters: list[str] = []
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            characters.append(chr(av))
+        elif op == sre_constants.RANGE:
+            characters.extend(map(chr, range(av[0], av[1] + 1)))
+        elif op == sre_constants.CATEGORY and av in CATEGORIES:
+            characters.extend(CATEGORIES[av])
+        else:
+            raise PatternError("Negated classes are not supported.")
+    return "".join(dict.fromkeys(characters))
+
+
+def _compile(parsed: Any) -> Node:
+    nodes: list[Node] = []
+    for op, av in parsed:
+        node: Node
+        if op == sre_constants.LITERAL:
+            node = Literal(chr(av))
+        elif op == sre_constants.ANY:
+            node = Chars(ANY_CHARACTER)
+        elif op == sre_constants.IN:
+            alphabet = _class_alphabet(av)
+            node = Chars(alphabet) if len(alphabet) > 1 else Literal(alphabet)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            low, high, item = av
+            if high == sre_constants.MAXREPEAT:
+                raise PatternError(
+                    "Unbounded repeats (*, + or {n,}) are not supported."
+                )
+            node = Repeat(_compile(item), low, high)
+        elif op == sre_constants.SUBPATTERN:
+            node = _compile(av[-1])
+        elif op == sre_constants.BRANCH:
+            node = Branch([_compile(option) for option in av[1]])
+        elif op == sre_constants.NOT_LITERAL:
+            raise PatternError("Negated classes are not supported.")
+        elif op == sre_constants.AT and av in (
+            sre_constants.AT_BEGINNING,
+            sre_constants.AT_BEGINNING_STRING,
+            sre_constants.AT_END,
+            sre_constants.AT_END_STRING,
+        ):
+            continue
+        else:
+            raise PatternError(f"{op} in patterns is not supported.")
+        if (
+            isinstance(node, Literal)
+            and nodes
+            and isinstance(nodes[-1], Literal)
+        ):
+            nodes[-1] = Literal(nodes[-1].text + node.text)
+        else:
+            nodes.append(node)
+    if len(nodes) == 1:
+        return nodes[0]
+    return Concat(nodes) if nodes else Literal("")
+
+
+@lru_cache(maxsize=128)
+def compile_pattern(pattern: str) -> Node:
+    """Raise PatternError if the pattern is invalid or not supported"""
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error as error:
+        raise PatternError(f"Invalid pattern: {error}.")
+    node = _compile(parsed)
+    if node.max_length > MAX_LENGTH:
+        raise PatternError(
+            f"Values can be longer than {MAX_LENGTH} characters."
+        )
+    return node
+
+
+def pattern_filler(faker: Any, pattern: str) -> Filler:
+    node = compile_pattern(pattern)
+    random = faker.random
+    return lambda n: node.fill(random, n)
@@ -0,0 +1,59 @@
+import csv
+import json
+from io import StringIO
+from itertools import islice
+
+from django.db.models.fields.files import FieldFile
+
+
+def read_head(file: FieldFile, size: int) -> bytes:
+    """Read at most `size` bytes from the beginning of a stored file.
+    Storages that can do ranged reads provide `read_head()`,
+    others are read from the start of an opened file."""
+    ranged_read = getattr(file.storage, "read_head", None)
+    if ranged_read is not None:
+        return ranged_read(file.name, size)  # type: ignore[no-any-return]
+    opened = file.storage.open(file.name, "rb")
+    try:
+        return opened.read(size)  # type: ignore[no-any-return]
+    finally:
+        opened.close()
+
+
+def parse_head(
+    data: bytes,
+    truncated: bool,
+    delimiter: str,
+    quotechar: str,
+    max_rows: int,
+) -> tuple[list[str], list[list[str]]]:
+    """Parse complete CSV rows from the head of a file into a header and rows.
+    If the data was cut off, the last row can be incomplete
+    (even a quoted multiline value), so it's dropped."""
+    # a cut multibyte character can only be at the end, in the dropped row
+    text = data.decode("utf-8", errors="ignore" if truncated else "strict")
+    reader = csv.reader(
+        StringIO(text), delimiter=delimiter, quotechar=quotechar
+    )
+    # the header, rows and one more to know if the last needed one is whole
+    rows = list(islice(reader, max_rows + 2))
+    if truncated and len(rows) < max_rows + 2:
+        rows = rows[:-1]
+    if not rows:
+        return [], []
+    return rows[0], rows[1 : max_rows + 1]
+
+
+def parse_ndjson_head(
+    data: bytes, truncated: bool, max_rows: int
+) -> tuple[list[str], list[list]]:
+    """Parse complete JSON Lines from the head of a file into a header
+    (the keys of the first object) and rows"""
+    lines = data.split(b"\n")
+    # the last line is either cut or an empty one after the last newline
+    lines = lines[:-1] if truncated or not lines[-1] else lines
+    objects = [json.loads(line) for line in lines[:max_rows]]
+    if not objects:
+        return [], []
+    header = list(objects[0])
+    return header, [[obj.get(key) for key in header] for obj in objects]
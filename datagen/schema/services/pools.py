@@ -0,0 +1,135 @@
+"""Pre-generated pools of values of expensive column types.
+
+A pool is a file of `size` values made by the Faker formatter, which
+columns are then filled from by picking random indices, at the cost of
+fewer distinct values. The file is memory-mapped, so all worker processes
+on a machine share the same pages of it. Layout: the number of values,
+offsets of the values in the data (all as native 8 bytes integers)
+and the UTF-8 data itself.
+
+Pools take minutes to build (a million addresses takes several), so they
+are built ahead (`manage.py build_value_pools`), never while generating:
+until a pool is there, its column is generated as usual."""
+
+import fcntl
+import mmap
+import os
+import uuid
+from array import array
+from pathlib import Path
+from random import Random
+from threading import Lock
+from typing import Any, Iterable, Optional
+
+from .cells import Filler
+
+# column types whose values are worth pooling
+POOLED_TYPES = ("name", "company", "job", "address")
+
+OFFSET_SIZE = array("Q").itemsize
+
+_pools: dict[Path, "ValuePool"] = {}
+_lock = Lock()
+
+
+class ValuePool:
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        self.size = view[:OFFSET_SIZE].cast("Q")[0]
+        self._data_start = OFFSET_SIZE * (self.size + 2)
+        self._offsets = view[OFFSET_SIZE : self._data_start].cast("Q")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx: int) -> str:
+        start = self._data_start + self._offsets[idx]
+        end = self._data_start + self._offsets[idx + 1]
+        return self._map[start:end].decode()
+
+    def sample(self, random: Random, n: int) -> list[str]:
+        return list(
+            map(self.__getitem__, random.choices(range(self.size), k=n))
+        )
+
+    @staticmethod
+    def build(path: Path, values: Iterable[str]) -> None:
+        """Write values into a pool file. It's written aside
+        and then moved in place, so a pool is never seen half-written."""
+        data = bytearray()
+        offsets = array("Q", [0])
+        for value in values:
+            data += value.encode()
+            offsets.append(len(data))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4()}")
+        with open(tmp_path, "wb") as file:
+            file.write(array("Q", [len(offsets) - 1]).tobytes())
+            file.write(offsets.tobytes())
+            file.write(data)
+        os.replace(tmp_path, path)
+
+
+class ValuePools:
+    """Pools of `size` values kept in `directory`.
+    Opened pools are cached for the life of the process."""
+
+    def __init__(self, directory: Path, size: int):
+        self.directory = directory
+        self.size = size
+
+    def path(self, column_type: str, faker: Any) -> Path:
+        # the pool of a locale is built with (and only valid for) it
+        locale = faker.locales[0]
+        return self.directory / f"{column_type}.{locale}.{self.size}.pool"
+
+    def get(self, column_type: str, faker: Any) -> Optional[ValuePool]:
+        """The pool, None if it isn't built yet"""
+        path = self.path(column_type, faker)
+        with _lock:
+            if path in _pools:
+                return _pools[path]
+        if not path.exists():
+            return None
+        pool = ValuePool(path)
+        with _lock:
+            return _pools.setdefault(path, pool)
+
+    def build(self, column_type: str, faker: Any) -> bool:
+        """Build the pool unless it's there. Return whether it was built.
+        Processes building the same pool wait for the first one
+        on a lock file, instead of building it again."""
+        path = self.path(column_type, faker)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_name(f"{path.name}.lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if path.exists():
+                return False
+            method = getattr(faker, column_type)
+            ValuePool.build(path, (method() for _ in range(self.size)))
+            return True
+
+    def get_filler(self, column_type: str, faker: Any) -> Optional[Filler]:
+        if column_type not in POOLED_TYPES:
+            return None
+        pool = self.get(column_type, faker)
+        if pool is None:
+            return None
+        sample, random = pool.sample, faker.random
+        return lambda n: sample(random, n)
+
+
+def preload_pools(directory: Path) -> int:
+    """Open the pools already built in `directory` (missing ones aren't
+    built), so tasks find them open. Return the number of pools."""
+    paths = list(directory.glob("*.pool"))
+    for path in paths:
+        with _lock:
+            if path in _pools:
+                continue
+        pool = ValuePool(path)
+        with _lock:
+            _pools.setdefault(path, pool)
+    return len(paths)
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Hashable
+
+from .cells import StreamedText
+from .generator import Generator
+
+CACHE_SIZE = 128
+
+_generators: OrderedDict[Hashable, Generator] = OrderedDict()
+_lock = Lock()
+
+
+def get_cached_generator(
+    key: Hashable, build: Callable[[], Generator]
+) -> Generator:
+    """Return a generator compiled earlier for the same key
+    or build a new one and keep it for the next previews.
+    The key must change whenever the schema changes."""
+    with _lock:
+        if key in _generators:
+            _generators.move_to_end(key)
+            return _generators[key]
+
+    generator = build()
+    with _lock:
+        _generators[key] = generator
+        while len(_generators) > CACHE_SIZE:
+            _generators.popitem(last=False)
+    return generator
+
+
+def generate_preview(
+    generator: Generator,
+    num_rows: int,
+    time_budget: float,
+    max_length: int,
+) -> list[list]:
+    """Generate up to `num_rows` rows, but stop as soon as
+    the time budget (in seconds) is spent. At least one row is returned.
+    Texts are cut to `max_length` characters, see `preview_cell`."""
+    deadline = perf_counter() + time_budget
+    rows = []
+    for block in generator.generate_blocks(num_rows, block_size=1):
+        rows.append([preview_cell(value, max_length) for value in block[0]])
+        if perf_counter() > deadline:
+            break
+    return rows
+
+
+def preview_cell(value: Any, max_length: int) -> Any:
+    """Texts longer than `max_length` are cut, with an ellipsis.
+    Streamed texts are only generated that far."""
+    if isinstance(value, StreamedText):
+        value = value.head(max_length + 1)
+    if isinstance(value, str) and len(value) > max_length:
+        return value[:max_length] + "…"
+    return value
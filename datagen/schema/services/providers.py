@@ -0,0 +1,40 @@
+"""The Faker instances generation uses, with the custom providers.
+Custom column types are generated by their fillers (see `fillers`),
+the one provider left is `sentences_variable_str`, the formatter
+the sentences filler reproduces in bulk.
+
+Only generation imports this module (and so Faker and factory_boy),
+the rest of the services don't depend on them."""
+
+from threading import Lock
+from typing import Any, Optional
+
+from factory import Faker
+
+from .variable_sentences_provider import Provider as SentencesProvider
+
+# added to the Faker instance of a locale on its first use
+PROVIDERS = [SentencesProvider]
+
+_providers_lock = Lock()
+# locales whose Faker instances have the custom providers
+_provided: set[str] = set()
+
+
+def get_faker(locale: Optional[str] = None) -> Any:
+    """The Faker instance of factory_boy for the locale (the default one
+    if not given), with the custom providers. Instances are created on first
+    use and kept (by factory_boy) for the life of the process, so a locale
+    loads its providers and their data once."""
+    faker = Faker._get_faker(locale)
+    if faker.locales[0] not in _provided:
+        with _providers_lock:
+            if faker.locales[0] not in _provided:
+                for provider in PROVIDERS:
+                    faker.add_provider(provider)
+                _provided.add(faker.locales[0])
+    return faker
+
+
+# the default locale is used by every generation
+get_faker()
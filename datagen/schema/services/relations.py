@@ -0,0 +1,92 @@
+"""Foreign keys: values of a key column of a parent table.
+
+Keys of a parent table are collected while it is written, into an array
+of 64-bit integers (8 bytes per row), so child tables pick from them
+without reading the parent table again. How many child rows refer to
+each parent row (the fan-out) follows a distribution: every parent row
+gets a weight drawn from it, and child rows pick parents in proportion
+to their weights, by a binary search in the running totals of weights."""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from math import inf
+from random import Random
+from typing import (
+    Any,
+    Generator as GeneratorType,
+    Iterable,
+    Optional,
+    Sequence,
+)
+
+from .cells import Filler
+from .distributions import get_sampler
+
+# every parent row is equally likely, the fan-out is about Poisson
+UNIFORM = "uniform"
+# weights are drawn and summed up by chunks of that many parent rows
+WEIGHTS_CHUNK = 10_000
+
+
+def collect_keys(
+    blocks: Iterable[list[list]], idx: int, keys: array
+) -> GeneratorType[list[list], None, None]:
+    """Pass the blocks of rows through, adding the values of the column
+    `idx` (but nulls) to `keys`"""
+    for block in blocks:
+        keys.extend(row[idx] for row in block if row[idx] is not None)
+        yield block
+
+
+def fanout_totals(
+    random: Random,
+    size: int,
+    fanout: str,
+    mean: float,
+    deviation: float,
+    exponent: float,
+) -> Optional[array]:
+    """Running totals of the weights of `size` parent rows,
+    None if they are equally likely"""
+    if fanout == UNIFORM:
+        return None
+    sample = get_sampler(fanout, 0, inf, mean, deviation, exponent)
+    totals = array("d")
+    total = 0.0
+    for start in range(0, size, WEIGHTS_CHUNK):
+        weights = sample(random, min(WEIGHTS_CHUNK, size - start))
+        totals.extend(accumulate(weights, initial=total))
+        # the initial total is the last one of the previous chunk
+        del totals[start]
+        total = totals[-1]
+    # no parent row got a weight
+    return totals if total > 0 else None
+
+
+def foreign_key_filler(
+    faker: Any,
+    keys: Sequence[int],
+    fanout: str = UNIFORM,
+    mean: float = 10,
+    deviation: float = 5,
+    exponent: float = 2,
+) -> Filler:
+    """Keys must not be empty, unless no values are filled"""
+    random = faker.random
+    size = len(keys)
+    totals = fanout_totals(random, size, fanout, mean, deviation, exponent)
+    if totals is None:
+        return lambda n: [keys[int(random.random() * size)] for _ in range(n)]
+    return _weighted_picks(random, keys, totals)
+
+
+def _weighted_picks(
+    random: Random, keys: Sequence[int], totals: array
+) -> Filler:
+    total = totals[-1]
+    last = len(keys) - 1
+    return lambda n: [
+        keys[min(bisect_right(totals, random.random() * total), last)]
+        for _ in range(n)
+    ]
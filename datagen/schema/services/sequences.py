@@ -0,0 +1,94 @@
+"""Key-like columns generated without Faker.
+
+Sequences and codes depend on the number of the row among all rows,
+so every shard of a dataset continues them from its own first row.
+UUIDs are random and so unique in any shard."""
+
+import os
+import time
+from typing import Any
+
+from .cells import Filler
+
+# the variant field (10xx bits) in place of a random hex digit
+VARIANT_DIGITS = {
+    digit: format(0x8 | int(digit, 16) & 0x3, "x")
+    for digit in "0123456789abcdef"
+}
+# UUIDv7 sub-millisecond counter, the rest of its bits are random
+UUID7_COUNTER_BITS = 12
+
+
+def sequence_filler(
+    faker: Any, first_row: int, start: int = 1, step: int = 1
+) -> Filler:
+    position = start + first_row * step
+
+    def fill(n: int) -> list[int]:
+        nonlocal position
+        values = list(range(position, position + n * step, step))
+        position += n * step
+        return values
+
+    return fill
+
+
+def code_filler(
+    faker: Any,
+    first_row: int,
+    prefix: str = "",
+    start: int = 1,
+    digits: int = 8,
+) -> Filler:
+    """Prefixed zero-padded numbers"""
+    numbers = sequence_filler(faker, first_row, start)
+    form = prefix.replace("%", "%%") + f"%0{digits}d"
+    return lambda n: list(map(form.__mod__, numbers(n)))
+
+
+def _format_uuid(hex: str, version: str) -> str:
+    return (
+        f"{hex[:8]}-{hex[8:12]}-{version}{hex[13:16]}-"
+        f"{VARIANT_DIGITS[hex[16]]}{hex[17:20]}-{hex[20:32]}"
+    )
+
+
+def uuid4_filler() -> Filler:
+    """Random UUIDs, from a single `os.urandom` call per column"""
+
+    def fill(n: int) -> list[str]:
+        data = os.urandom(16 * n).hex()
+        return [
+            _format_uuid(data[idx : idx + 32], "4")
+            for idx in range(0, 32 * n, 32)
+        ]
+
+    return fill
+
+
+def uuid7_filler() -> Filler:
+    """Time-ordered UUIDs: Unix time in milliseconds, then a counter
+    (the time is moved forward when it runs out), then random bits"""
+    last_time = 0
+    counter = 0
+
+    def fill(n: int) -> list[str]:
+        nonlocal last_time, counter
+        now = time.time_ns() // 1_000_000
+        if now > last_time:
+            last_time, counter = now, 0
+        data = os.urandom(8 * n).hex()
+        values = []
+        for idx in range(0, 16 * n, 16):
+            if counter >> UUID7_COUNTER_BITS:
+                last_time, counter = last_time + 1, 0
+            prefix = format(last_time, "012x") + format(counter, "04x")
+            counter += 1
+            values.append(_format_uuid(prefix + data[idx : idx + 16], "7"))
+        return values
+
+    return fill
+
+
+def uuid_filler(faker: Any, version: int = 4) -> Filler:
+    return uuid7_filler() if version == 7 else uuid4_filler()
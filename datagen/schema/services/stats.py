@@ -0,0 +1,148 @@
+from math import log
+from typing import Any, Generator as GeneratorType, Iterable, Sequence
+
+from .cells import StreamedText
+from .columns import ColumnDTO, ValueKind
+from .dates import DEFAULT_FORMAT, is_chronological
+
+
+class HyperLogLog:
+    """Distinct values estimator taking `2 ** precision` bytes of memory
+    regardless of the number of values. The standard error is about
+    `1.04 / sqrt(2 ** precision)`, 1.6% for the default precision.
+
+    Values are hashed by their texts with the Python string hash (SipHash),
+    which is computed in C and kept by the strings. It is randomized
+    per process, so an estimator is only valid within the process."""
+
+    HASH_BITS = 64
+    HASH_MASK = (1 << HASH_BITS) - 1
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+        self._rest_bits = self.HASH_BITS - precision
+        self._rest_mask = (1 << self._rest_bits) - 1
+
+    def add(self, value: Any) -> None:
+        self.add_many([value])
+
+    def add_many(self, values: Iterable) -> None:
+        registers, mask = self.registers, self.HASH_MASK
+        rest_bits, rest_mask = self._rest_bits, self._rest_mask
+        # numbers hash to themselves, their texts hash well
+        for hashed in map(hash, map(str, values)):
+            hashed &= mask
+            rank = rest_bits - (hashed & rest_mask).bit_length() + 1
+            if rank > registers[hashed >> rest_bits]:
+                registers[hashed >> rest_bits] = rank
+
+    def add_digest(self, digest: bytes) -> None:
+        """Add a value by its 8 bytes BLAKE2b digest"""
+        hashed = int.from_bytes(digest, "big")
+        idx = hashed >> self._rest_bits
+        rank = self._rest_bits - (hashed & self._rest_mask).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def count(self) -> int:
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-rank for rank in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:  # small range correction
+            estimate = m * log(m / zeros)
+        return round(estimate)
+
+
+class ColumnStats:
+    def __init__(self, column: ColumnDTO):
+        self.name = column.name
+        self.ordered = column.kind is not ValueKind.TEXT and (
+            column.kind is not ValueKind.TIMESTAMP
+            # otherwise the texts would be compared, not the times
+            or is_chronological(column.params.get("format", DEFAULT_FORMAT))
+        )
+        self.textual = column.kind is not ValueKind.INTEGER
+        # decimals are formatted, so compared by their numbers
+        self.key = float if column.kind is ValueKind.DECIMAL else None
+        self.count = 0
+        # nulls are counted apart, other stats are of the rest of values
+        self.nullable = bool(column.null_rate)
+        self.nulls = 0
+        self.total_length = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.distinct = HyperLogLog()
+        # Streamed texts are measured once written, so they are kept until
+        # the next block comes (the current one is written by then) or the end
+        self.streamed = column.streamed
+        self._unmeasured: Sequence[StreamedText] = ()
+
+    def add_many(self, values: Sequence) -> None:
+        if self.nullable:
+            present = [value for value in values if value is not None]
+            self.nulls += len(values) - len(present)
+            values = present
+        self.count += len(values)
+        if self.streamed:
+            self._measure_streamed()
+            self._unmeasured = values
+            return
+        self.distinct.add_many(values)
+        if self.textual:
+            self.total_length += sum(map(len, values))
+        if self.ordered and values:
+            key = self.key
+            low, high = min(values, key=key), max(values, key=key)
+            if self.min is None:
+                self.min, self.max = low, high
+            else:
+                self.min = min(self.min, low, key=key)
+                self.max = max(self.max, high, key=key)
+
+    def _measure_streamed(self) -> None:
+        for text in self._unmeasured:
+            self.distinct.add_digest(text.digest())
+            self.total_length += text.length
+        self._unmeasured = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        self._measure_streamed()
+        stats: dict[str, Any] = {
+            "name": self.name,
+            "distinct": self.distinct.count(),
+        }
+        if self.ordered:
+            stats["min"], stats["max"] = self.min, self.max
+        if self.nullable:
+            stats["nulls"] = self.nulls
+        if self.textual:
+            stats["avg_length"] = round(
+                self.total_length / max(self.count, 1), 2
+            )
+        return stats
+
+
+class DatasetStats:
+    """Per column statistics gathered on the fly while rows are written,
+    so the dataset file never has to be read again for them."""
+
+    def __init__(self, columns: Iterable[ColumnDTO]):
+        self.columns = [ColumnStats(column) for column in columns]
+
+    def observe(
+        self, blocks: Iterable[list[list]]
+    ) -> GeneratorType[list[list], None, None]:
+        """Pass the blocks of rows through, taking them into account"""
+        for block in blocks:
+            for column, values in zip(self.columns, zip(*block)):
+                column.add_many(values)
+            yield block
+
+    def to_dict(self, total_bytes: int) -> dict[str, Any]:
+        return {
+            "total_bytes": total_bytes,
+            "columns": [column.to_dict() for column in self.columns],
+        }
@@ -0,0 +1,249 @@
+"""Faker format templates compiled once and filled a column at a time.
+
+Faker fills a template like "(###)###-####" or "{{first_name}}##" with
+regular expression substitutions on every call. Here a template is parsed
+once into a list of parts (literals, placeholder runs, tokens), and every
+part is generated for a whole column with a single bulk random call.
+Random values come from the Faker's own `random.Random`, so seeding works
+the same way, and the placeholders have the same distributions."""
+
+import re
+import string
+from collections import defaultdict
+from itertools import accumulate
+from random import Random
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from faker.providers.internet import Provider as InternetProvider
+from faker.providers.person import Provider as PersonProvider
+from faker.providers.phone_number import Provider as PhoneNumberProvider
+from faker.utils.text import slugify
+
+from .cells import Filler
+
+TOKEN = re.compile(r"{{\s?(\w+)\s?}}")
+NUMERIFY = "#%!@"
+BOTHIFY = NUMERIFY + "?"
+# tokens returning `random_element(attribute)` in the base person provider
+ELEMENT_TOKENS = {"first_name": "first_names", "last_name": "last_names"}
+# A random pick from these is distributed as the placeholder in Faker:
+# "!" is empty half of the time, else a digit. "@" is the same, but non-zero.
+PLACEHOLDERS: dict[str, Sequence[str]] = {
+    "#": string.digits,
+    "%": string.digits[1:],
+    "!": ("",) * 10 + tuple(string.digits),
+    "@": ("",) * 9 + tuple(string.digits[1:]),
+    "?": string.ascii_letters,
+}
+
+
+class Elements:
+    """Picks like Faker's `random_element`: uniform,
+    or weighted if elements are a mapping of weights"""
+
+    def __init__(self, elements: Union[Sequence, Mapping], random: Random):
+        self.random = random
+        self.values = list(elements)
+        self.cum_weights = (
+            list(accumulate(elements.values()))
+            if isinstance(elements, Mapping)
+            else None
+        )
+
+    def fill(self, n: int) -> list:
+        return self.random.choices(
+            self.values, cum_weights=self.cum_weights, k=n
+        )
+
+
+class Template:
+    """A template parsed into parts. `placeholders` are the characters
+    replaced with random ones, `tokens` fill `{{name}}` tokens
+    (if None, braces are literal)."""
+
+    def __init__(
+        self,
+        text: str,
+        random: Random,
+        placeholders: str,
+        tokens: Optional[Callable[[str], Filler]] = None,
+    ):
+        self.random = random
+        self.parts: list[Union[str, Filler]] = []
+        position = 0
+        if tokens:
+            for match in TOKEN.finditer(text):
+                self._parse_placeholders(
+                    text[position : match.start()], placeholders
+                )
+                self.parts.append(tokens(match.group(1)))
+                position = match.end()
+        self._parse_placeholders(text[position:], placeholders)
+
+    def _parse_placeholders(self, text: str, placeholders: str) -> None:
+        if not placeholders:
+            self._add_literal(text)
+            return
+        pattern = f"([{re.escape(placeholders)}])\\1*"
+        position = 0
+        for match in re.finditer(pattern, text):
+            self._add_literal(text[position : match.start()])
+            self.parts.append(
+                self._run_filler(match.group(1), len(match.group(0)))
+            )
+            position = match.end()
+        self._add_literal(text[position:])
+
+    def _add_literal(self, text: str) -> None:
+        if not text:
+            return
+        if self.parts and isinstance(self.parts[-1], str):
+            self.parts[-1] += text
+        else:
+            self.parts.append(text)
+
+    def _run_filler(self, placeholder: str, length: int) -> Filler:
+        random = self.random
+        if placeholder == "#":
+            # a run of independent digits is a zero-padded uniform number
+            upper = 10**length
+            form = f"0{length}d"
+            return lambda n: [
+                format(number, form)
+                for number in map(random.randrange, [upper] * n)
+            ]
+        population = PLACEHOLDERS[placeholder]
+        if length == 1:
+            return lambda n: random.choices(population, k=n)
+        # consecutive picks grouped by `length`
+        return lambda n: list(
+            map(
+                "".join,
+                zip(
+                    *[iter(random.choices(population, k=n * length))] * length
+                ),
+            )
+        )
+
+    def fill(self, n: int) -> list[str]:
+        columns: list[Iterable[str]] = [
+            [part] * n if isinstance(part, str) else part(n)
+            for part in self.parts
+        ]
+        if not columns:
+            return [""] * n
+        if len(columns) == 1:
+            return list(columns[0])
+        return list(map("".join, zip(*columns)))
+
+
+class TemplateSet:
+    """Templates of which a random one is used for every value"""
+
+    def __init__(
+        self,
+        templates: Union[Sequence[str], Mapping[str, float]],
+        random: Random,
+        **kwargs: Any,
+    ):
+        self.random = random
+        self.templates = [
+            Template(text, random, **kwargs) for text in templates
+        ]
+        self.weights = (
+            list(templates.values())
+            if isinstance(templates, Mapping)
+            else None
+        )
+
+    def fill(self, n: int) -> list[str]:
+        if len(self.templates) == 1:
+            return self.templates[0].fill(n)
+        picks = self.random.choices(
+            range(len(self.templates)), weights=self.weights, k=n
+        )
+        positions: defaultdict[int, list[int]] = defaultdict(list)
+        for position, pick in enumerate(picks):
+            positions[pick].append(position)
+        values: list[str] = [""] * n
+        for pick, pick_positions in positions.items():
+            for position, value in zip(
+                pick_positions, self.templates[pick].fill(len(pick_positions))
+            ):
+                values[position] = value
+        return values
+
+
+def token_filler(faker: Any) -> Callable[[str], Filler]:
+    """Tokens that are random elements of a provider attribute are picked
+    in bulk, other ones are filled by calling the Faker formatter
+    for every value"""
+
+    def get_filler(name: str) -> Filler:
+        method = getattr(faker, name)
+        attribute = ELEMENT_TOKENS.get(name)
+        if attribute and method.__func__ is getattr(PersonProvider, name):
+            provider = method.__self__
+            return Elements(
+                getattr(provider, attribute), provider.generator.random
+            ).fill
+        return lambda n: [str(method()) for _ in range(n)]
+
+    return get_filler
+
+
+def formatter_filler(method: Callable[[], str]) -> Filler:
+    return lambda n: [method() for _ in range(n)]
+
+
+def phone_number_filler(faker: Any) -> Filler:
+    # some locales build numbers in their own way, from `formats` or not
+    if faker.phone_number.__func__ is not PhoneNumberProvider.phone_number:
+        return formatter_filler(faker.phone_number)
+    provider = faker.phone_number.__self__
+    return TemplateSet(
+        provider.formats, provider.generator.random, placeholders=NUMERIFY
+    ).fill
+
+
+def safe_domain_name_filler(faker: Any) -> Filler:
+    provider = faker.safe_domain_name.__self__
+    domain_names = Elements(
+        provider.safe_domain_names, provider.generator.random
+    )
+    return lambda n: [name.lower() for name in domain_names.fill(n)]
+
+
+def user_name_filler(faker: Any) -> Filler:
+    if faker.user_name.__func__ is not InternetProvider.user_name:
+        return formatter_filler(faker.user_name)
+    provider = faker.user_name.__self__
+    user_names = TemplateSet(
+        provider.user_name_formats,
+        provider.generator.random,
+        placeholders=BOTHIFY,
+        tokens=token_filler(faker),
+    )
+    to_ascii = provider._to_ascii
+    # as the `slugify_unicode` decorator of `user_name` does
+    return lambda n: [
+        slugify(to_ascii(user_name.lower()), allow_unicode=True)
+        for user_name in user_names.fill(n)
+    ]
+
+
+def safe_email_filler(faker: Any) -> Filler:
+    user_names = user_name_filler(faker)
+    domain_names = safe_domain_name_filler(faker)
+    return lambda n: [
+        f"{user_name}@{domain_name}".lower()
+        for user_name, domain_name in zip(user_names(n), domain_names(n))
+    ]
@@ -1,13 +1,83 @@
+from itertools import accumulate
 from random import randint
-from typing import Optional, Sequence
-from faker.providers.lorem.en_US import Provider as LoremProvider_en_US
+from typing import Any, Callable, Iterator, Optional, Sequence
+from faker.providers import BaseProvider
 
+from ..cells import StreamedText
+from ..columns import sentences_streamed
+
+
+class Provider(BaseProvider):
+    """Sentences of the lorem provider of the Faker's locale"""
 
-class Provider(LoremProvider_en_US):
     def sentences_variable_str(
         self,
         nb_min: int = 3,
         nb_max: int = 6,
         ext_word_list: Optional[Sequence[str]] = None,
     ) -> str:
-        return " ".join(self.sentences(randint(nb_min, nb_max), ext_word_list))
+        return " ".join(
+            self.generator.sentences(randint(nb_min, nb_max), ext_word_list)
+        )
+
+
+# Number of words of a sentence, as `LoremProvider.sentence()` randomizes
+# the default 6 by 60-140% (`randomize_nb_elements`), each equally likely.
+SENTENCE_LENGTHS = [
+    max(int(6 * percent / 100), 1) for percent in range(60, 141)
+]
+
+
+SENTENCES_PER_PIECE = 1000
+
+
+def sentences_filler(
+    faker: Any, nb_min: int = 3, nb_max: int = 6
+) -> Callable[[int], list]:
+    """Fast `sentences_variable_str`: words are picked in bulk
+    as indices into a table of their plain, capitalized and punctuated forms,
+    so a sentence costs a couple of operations instead of a dozen calls.
+    Cells of many sentences are streamed in pieces."""
+    # the lorem provider of the locale
+    provider = faker.sentence.__self__
+    random = provider.generator.random
+    words = list(provider.word_list)
+    size = len(words)
+    punctuation = provider.sentence_punctuation
+    forms = (
+        words
+        + [word.title() for word in words]
+        + [word + punctuation for word in words]
+        + [word.title() + punctuation for word in words]
+    )
+    connector: str = provider.word_connector
+    indices = range(size)
+    # offsets from a word to its form at the first and the last position
+    first, last = size, 2 * size
+
+    def fill_text(count: int) -> str:
+        lengths = random.choices(SENTENCE_LENGTHS, k=count)
+        if not lengths:
+            return ""
+        ends = list(accumulate(lengths))
+        picks = random.choices(indices, k=ends[-1])
+        for start in [0] + ends[:-1]:
+            picks[start] += first
+        for end in ends:
+            picks[end - 1] += last
+        return connector.join(map(forms.__getitem__, picks))
+
+    if not sentences_streamed(nb_min, nb_max):
+        return lambda n: [
+            fill_text(random.randint(nb_min, nb_max)) for _ in range(n)
+        ]
+
+    alphabet = frozenset("".join(forms) + connector)
+
+    def pieces() -> Iterator[str]:
+        count = random.randint(nb_min, nb_max)
+        for start in range(0, count, SENTENCES_PER_PIECE):
+            text = fill_text(min(SENTENCES_PER_PIECE, count - start))
+            yield connector + text if start else text
+
+    return lambda n: [StreamedText(pieces(), alphabet) for _ in range(n)]
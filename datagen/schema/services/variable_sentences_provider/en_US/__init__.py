@@ -1,5 +0,0 @@
-from .. import Provider as LoremProvider_en_US
-
-
-class Provider(LoremProvider_en_US):
-    pass
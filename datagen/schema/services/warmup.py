@@ -0,0 +1,46 @@
+"""Warm-up of worker processes, so their first task runs at full speed.
+
+The Faker instances of the locales are created with the custom providers
+(and so their word lists), value pools already built are opened, and
+a few rows of common column types are generated, which sets up
+the rest of generation. Everything is kept for the life of the process."""
+
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Optional
+
+from .columns import ColumnDTO
+from .generator import Generator
+from .locales import DEFAULT_LOCALE, parse_locales
+from .pools import preload_pools
+
+# column types generated by the warm-up
+WARM_UP_TYPES = (
+    "name",
+    "company",
+    "job",
+    "address",
+    "safe_email",
+    "phone_number",
+    "sentences_variable_str",
+    "date",
+)
+WARM_UP_ROWS = 10
+
+
+def warm_up(
+    locales: Iterable[str] = (), pools_directory: Optional[Path] = None
+) -> float:
+    """Warm up the default locale and `locales`.
+    Return the time it took, in seconds."""
+    start = perf_counter()
+    columns = [
+        ColumnDTO(column_type, column_type, order, {})
+        for order, column_type in enumerate(WARM_UP_TYPES)
+    ]
+    for locale in parse_locales(",".join([DEFAULT_LOCALE, *locales])):
+        generator = Generator(columns, locales={locale: 1})
+        next(generator.generate_blocks(WARM_UP_ROWS))
+    if pools_directory and pools_directory.is_dir():
+        preload_pools(pools_directory)
+    return perf_counter() - start
@@ -1,12 +1,25 @@
+import hashlib
+import json
 import os
+from array import array
 from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 from celery import shared_task
+from django.core.files.base import ContentFile
 from django.utils.text import slugify
 
-from .models import Dataset, Schema
-from .services.data_saving import generate_to_csv
-from .services.generator import Generator as Generator
+from .models import Dataset, DatasetPart, Schema, SequenceColumn
+from .services.relations import collect_keys
+from .services.stats import DatasetStats
+from .services.unique import UniqueValuesExhausted
+
+if TYPE_CHECKING:
+    from .services.data_saving import WrittenFile
+    from .services.generator import Generator
+
+MEGABYTE = 1024 * 1024
 
 
 @shared_task
@@ -14,21 +27,209 @@ def generate_data(dataset_pk: int) -> None:
     dataset: Dataset = Dataset.objects.select_related("schema").get(
         pk=dataset_pk
     )
+    try:
+        _generate_dataset(dataset)
+    except UniqueValuesExhausted as error:
+        # parts saved so far are of no use
+        for part in dataset.parts.all():
+            part.file.delete(save=False)
+        dataset.parts.all().delete()
+        dataset.error = str(error)
+        dataset.save()
+
+
+def _generate_dataset(dataset: Dataset) -> None:
+    # web processes import the tasks to queue them, only workers write
+    from .services.data_saving import WRITERS
+
     schema: Schema = dataset.schema
-    gen_schema: Generator = schema.get_generator
+    writer_class = WRITERS[dataset.format]
 
     # Beware of malformed user input. Slugify will do it here.
-    file_slug = f"{schema.user.pk}/{slugify(schema.name)}_{dataset.num_rows}_{datetime.isoformat(dataset.created)}.csv"
+    file_slug = f"{schema.user.pk}/{slugify(schema.name)}_{dataset.num_rows}_{datetime.isoformat(dataset.created)}"
+
+    bundle = schema.get_bundle(dataset.num_rows)
+    if len(bundle) > 1:
+        _generate_bundle(dataset, bundle, file_slug)
+        return
 
-    csv_file_path = generate_to_csv(
-        gen_schema.generate(dataset.num_rows),
-        gen_schema.header,
-        schema.column_separator,
-        schema.quotechar,
+    gen_schema: Generator = schema.get_generator
+    blocks = gen_schema.generate_blocks(dataset.num_rows)
+    stats = None
+    if dataset.collect_stats:
+        stats = DatasetStats(gen_schema.fields)
+        blocks = stats.observe(blocks)
+    files = _generate_files(
+        dataset, schema, schema.table_name, blocks, gen_schema
     )
 
-    with open(csv_file_path, "rb") as csv_file:
-        dataset.file.save(file_slug, csv_file)  # type: ignore[arg-type]
+    if dataset.is_split:
+        parts = _save_parts(
+            dataset, files, f"{file_slug}_part{{}}.{writer_class.extension}"
+        )
+        _save_manifest(
+            dataset,
+            {
+                "format": dataset.format,
+                "header": gen_schema.header,
+                "parts": parts,
+            },
+            f"{file_slug}_manifest.json",
+        )
+        total_bytes = sum(part["size"] for part in parts)
+    else:
+        written = next(files)
+        _save_file(dataset, written, f"{file_slug}.{writer_class.extension}")
+        total_bytes = written.size
+
+    if stats:
+        dataset.stats = stats.to_dict(total_bytes=total_bytes)  # type: ignore[assignment]
+    dataset.save()
+
+
+def _generate_bundle(
+    dataset: Dataset, bundle: list[tuple[Schema, int]], file_slug: str
+) -> None:
+    """Generate the tables of a bundle, parents first, keeping the keys
+    their children refer to, and save them as parts (at least one per table)
+    with a manifest of the tables. Stats are of the dataset's own table."""
+    from .services.data_saving import WRITERS
+
+    writer_class = WRITERS[dataset.format]
+    # the dataset's own table (the last one) gets the plain name
+    table_names: dict[int, str] = {}
+    for schema, _ in reversed(bundle):
+        name = schema.table_name
+        if name in table_names.values():
+            name = f"{name}_{schema.pk}"
+        table_names[schema.pk] = name
+    referred = {
+        column.parent_id
+        for schema, _ in bundle
+        for column in schema.foreign_keys
+    }
 
+    parent_keys: dict[int, array] = {}
+    manifest: dict = {"format": dataset.format, "tables": []}
+    stats: Optional[DatasetStats] = None
+    number = 0
+    for schema, num_rows in bundle:
+        generator = schema.make_generator(parent_keys)
+        blocks = generator.generate_blocks(num_rows)
+        for column in schema.columns:
+            if isinstance(column, SequenceColumn) and column.pk in referred:
+                keys = parent_keys[column.pk] = array("q")
+                blocks = collect_keys(
+                    blocks, generator.header.index(column.name), keys
+                )
+        if schema == dataset.schema and dataset.collect_stats:
+            stats = DatasetStats(generator.fields)
+            blocks = stats.observe(blocks)
+
+        table = table_names[schema.pk]
+        parts = _save_parts(
+            dataset,
+            _generate_files(dataset, schema, table, blocks, generator),
+            f"{file_slug}_{table}_part{{}}.{writer_class.extension}",
+            first_number=number + 1,
+            table=table,
+        )
+        number += len(parts)
+        manifest["tables"].append(
+            {
+                "name": table,
+                "header": generator.header,
+                "num_rows": num_rows,
+                "parts": parts,
+            }
+        )
+
+    _save_manifest(dataset, manifest, f"{file_slug}_manifest.json")
+    if stats:
+        dataset.stats = stats.to_dict(  # type: ignore[assignment]
+            total_bytes=sum(
+                part["size"] for part in manifest["tables"][-1]["parts"]
+            )
+        )
     dataset.save()
-    os.remove(csv_file_path)
+
+
+def _generate_files(
+    dataset: Dataset,
+    schema: Schema,
+    table_name: str,
+    blocks: Iterable[list[list]],
+    generator: "Generator",
+) -> Iterator["WrittenFile"]:
+    from .services.data_saving import (
+        WRITERS,
+        FormatOptions,
+        generate_to_files,
+    )
+
+    return generate_to_files(
+        blocks,
+        partial(
+            WRITERS[dataset.format],
+            columns=generator.fields,
+            options=FormatOptions(
+                delimiter=schema.column_separator,
+                quotechar=schema.quotechar,
+                table_name=table_name,
+                batch_size=dataset.insert_batch_size,
+                null=schema.null_token,
+                locales=list(generator.locales),
+            ),
+        ),
+        max_rows=dataset.split_rows,
+        max_bytes=dataset.split_size and dataset.split_size * MEGABYTE,
+    )
+
+
+def _save_file(dataset: Dataset, written: "WrittenFile", name: str) -> None:
+    with open(written, "rb") as file:
+        dataset.file.save(name, file, save=False)  # type: ignore[arg-type]
+    dataset.size = written.size
+    dataset.sha256 = written.sha256
+    os.remove(written)
+
+
+def _save_parts(
+    dataset: Dataset,
+    files: Iterator["WrittenFile"],
+    part_name: str,
+    first_number: int = 1,
+    table: str = "",
+) -> list[dict]:
+    """Upload every part as soon as it is written.
+    Return their entries of the manifest."""
+    parts = []
+    for number, written in enumerate(files, start=first_number):
+        part = DatasetPart(
+            dataset=dataset,
+            number=number,
+            table=table,
+            num_rows=written.num_rows,
+            size=written.size,
+            sha256=written.sha256,
+        )
+        with open(written, "rb") as file:
+            part.file.save(part_name.format(number), file)  # type: ignore[arg-type]
+        os.remove(written)
+        parts.append(
+            {
+                "file": os.path.basename(part.file.name),
+                "num_rows": part.num_rows,
+                "size": part.size,
+                "sha256": part.sha256,
+            }
+        )
+    return parts
+
+
+def _save_manifest(dataset: Dataset, manifest: dict, name: str) -> None:
+    """Save the manifest of the parts as the dataset file"""
+    content = json.dumps(manifest, indent=2).encode()
+    dataset.file.save(name, ContentFile(content), save=False)
+    dataset.size = len(content)
+    dataset.sha256 = hashlib.sha256(content).hexdigest()
@@ -1,10 +1,17 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.forms.models import model_to_dict
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from ..forms import GenerateForm, SchemaForm
-from ..models import BaseColumn, Schema, NameColumn, RandomIntColumn
+from ..models import (
+    BaseColumn,
+    ForeignKeyColumn,
+    Schema,
+    NameColumn,
+    RandomIntColumn,
+    SequenceColumn,
+)
 
 
 class TestSchemaFormCase(TestCase):
@@ -425,6 +432,143 @@ class TestSchemaFormCase(TestCase):
         self.assertEqual(name_col_1.name, "Col 1 changed")
         self.assertEqual(NameColumn.objects.count(), 3)
 
+    def test_foreign_keys_refer_to_own_columns(self):
+        other_user = get_user_model().objects.create_user(
+            username="other", password="12345"
+        )
+        other_schema = Schema.objects.create(name="Other", user=other_user)
+        other_id = SequenceColumn.objects.create(
+            name="id", schema=other_schema
+        )
+        form_data = {
+            **self.copy_form_prepared({"name": "Orders"}, "Schema", idx=None),
+            **self.copy_form_prepared(
+                {
+                    "name": "customer",
+                    "order": 1,
+                    "parent": other_id.pk,
+                    "fanout": "uniform",
+                    "mean": 10,
+                    "deviation": 5,
+                    "exponent": 2,
+                },
+                "ForeignKeyColumn",
+            ),
+            **self.get_management_form({"ForeignKeyColumn": {"total": 1}}),
+        }
+        form = SchemaForm(form_data, user=self.user, prefix="Schema")
+        self.assertFalse(form.is_valid())
+        fk_formset = form.column_formsets[
+            BaseColumn.__subclasses__().index(ForeignKeyColumn)
+        ]
+        self.assertIn("parent", fk_formset[0].errors)
+
+    def test_parents_of_other_schemas_cant_be_deleted(self):
+        customers = Schema.objects.create(name="Customers", user=self.user)
+        customer_id = SequenceColumn.objects.create(
+            name="id", order=1, schema=customers
+        )
+        name = NameColumn.objects.create(
+            name="Name", order=2, schema=customers
+        )
+        orders = Schema.objects.create(name="Orders", user=self.user)
+        ForeignKeyColumn.objects.create(
+            name="customer", schema=orders, parent=customer_id
+        )
+        form_data = {
+            **self.copy_form_prepared(
+                {
+                    "name": "Customers",
+                    "column_separator": ",",
+                    "quotechar": '"',
+                },
+                "Schema",
+                idx=None,
+            ),
+            **self.copy_form_prepared(
+                {"id": customer_id.pk, "DELETE": True}, "SequenceColumn"
+            ),
+            **self.copy_form_prepared(
+                {"id": name.pk, "name": "Name", "order": 2},
+                "NameColumn",
+            ),
+            **self.get_management_form(
+                {
+                    "SequenceColumn": {"total": 1, "initial": 1},
+                    "NameColumn": {"total": 1, "initial": 1},
+                }
+            ),
+        }
+        form = SchemaForm(
+            form_data, instance=customers, user=self.user, prefix="Schema"
+        )
+        self.assertFalse(form.is_valid())
+        self.assertListEqual(
+            form.non_field_errors(),
+            ['"id" can\'t be deleted, foreign keys of "Orders" refer to it.'],
+        )
+
+    def test_foreign_keys_dont_refer_back(self):
+        customers = Schema.objects.create(name="Customers", user=self.user)
+        customer_id = SequenceColumn.objects.create(
+            name="id", schema=customers
+        )
+        orders = Schema.objects.create(name="Orders", user=self.user)
+        order_id = SequenceColumn.objects.create(name="id", schema=orders)
+        ForeignKeyColumn.objects.create(
+            name="customer", schema=orders, parent=customer_id
+        )
+        form_data = {
+            **self.copy_form_prepared(
+                {
+                    "name": "Customers",
+                    "column_separator": ",",
+                    "quotechar": '"',
+                },
+                "Schema",
+                idx=None,
+            ),
+            **self.copy_form_prepared(
+                {
+                    "id": customer_id.pk,
+                    "name": "id",
+                    "order": 1,
+                    "start": 1,
+                    "step": 1,
+                },
+                "SequenceColumn",
+            ),
+            **self.copy_form_prepared(
+                {
+                    "name": "last_order",
+                    "order": 2,
+                    "parent": order_id.pk,
+                    "fanout": "uniform",
+                    "mean": 10,
+                    "deviation": 5,
+                    "exponent": 2,
+                },
+                "ForeignKeyColumn",
+            ),
+            **self.get_management_form(
+                {
+                    "SequenceColumn": {"total": 1, "initial": 1},
+                    "ForeignKeyColumn": {"total": 1},
+                }
+            ),
+        }
+        form = SchemaForm(
+            form_data, instance=customers, user=self.user, prefix="Schema"
+        )
+        self.assertFalse(form.is_valid())
+        fk_formset = form.column_formsets[
+            BaseColumn.__subclasses__().index(ForeignKeyColumn)
+        ]
+        self.assertListEqual(
+            fk_formset[0].errors["parent"],
+            ["The parent table refers to this schema."],
+        )
+
 
 class TestGenerateForm(TestCase):
     @classmethod
@@ -458,3 +602,35 @@ class TestGenerateForm(TestCase):
 
         form = GenerateForm({"num_rows": int(1e100)}, request=self.request)
         self.assertTrue(form.is_valid(), form.errors)
+
+    def test_sqlite_is_split_only_by_rows(self):
+        data = {"num_rows": 100, "format": "sqlite", "split_rows": 10}
+        form = GenerateForm(data, request=self.request)
+        self.assertTrue(form.is_valid(), form.errors)
+
+        form = GenerateForm({**data, "split_size": 1}, request=self.request)
+        self.assertFalse(form.is_valid())
+        self.assertIn("split_size", form.errors)
+
+    @override_settings(USER_GENERATION_ROW_LIMIT=1000)
+    def test_parent_tables_count_towards_the_limit(self):
+        customers = Schema.objects.create(name="Customers", user=self.user)
+        orders = Schema.objects.create(name="Orders", user=self.user)
+        ForeignKeyColumn.objects.create(
+            name="customer",
+            schema=orders,
+            parent=SequenceColumn.objects.create(name="id", schema=customers),
+            mean=2,
+        )
+
+        form = GenerateForm(
+            {"num_rows": 700}, request=self.request, schema=orders
+        )
+        self.assertFalse(form.is_valid())  # 700 + 350 rows
+        self.assertIn("1050", form.errors["num_rows"][0])
+
+        orders.datasets.create(num_rows=600, total_rows=900)
+        form = GenerateForm(
+            {"num_rows": 200}, request=self.request, schema=customers
+        )
+        self.assertFalse(form.is_valid())  # 900 rows used
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+# only generation needs them
+GENERATION_PACKAGES = ("faker", "factory")
+# what a web process imports and runs: views, queueing of tasks
+# and validation of schemas, then the modules it has imported
+WEB_SCRIPT = """
+import config.wsgi, schema.urls, schema.views, schema.tasks
+from schema.models import Schema
+
+Schema(name="Web", locales="en_US:3, de_DE:1").full_clean(exclude=["user"])
+
+import sys
+print(*sys.modules, sep="\\n")
+"""
+
+
+class TestWebImports(SimpleTestCase):
+    """Import the entry point of web processes, the views and tasks
+    and validate a schema in a fresh interpreter. Import times
+    are measured by the `wsgi_import_time` command instead."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        result = subprocess.run(
+            [sys.executable, "-c", WEB_SCRIPT],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cls.modules = result.stdout.splitlines()
+
+    def test_generation_packages_are_not_imported(self):
+        self.assertIn("config.wsgi", self.modules)
+        imported = {module.split(".")[0] for module in self.modules}
+        self.assertFalse(imported.intersection(GENERATION_PACKAGES))
@@ -1,27 +1,39 @@
+import uuid
 from datetime import datetime, timedelta
 from unittest import mock
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db.models import RestrictedError
 from django.test import TestCase, TransactionTestCase
 from django.utils import timezone
-from factory import Faker, ListFactory
 
 from ..models import (
     AddressColumn,
     BaseColumn,
+    ChoiceColumn,
+    CodeColumn,
     CompanyColumn,
     Dataset,
     DateColumn,
+    DateRangeColumn,
+    DistributedFloatColumn,
+    DistributedIntColumn,
     DomainColumn,
     EmailColumn,
+    ForeignKeyColumn,
     JobColumn,
     NameColumn,
+    PatternColumn,
     PhoneNumberColumn,
     RandomIntColumn,
     Schema,
     SentencesColumn,
+    SequenceColumn,
+    UUIDColumn,
 )
+from ..services.fillers import get_filler
 from ..services.generator import Generator
 from . import AssertBetweenMixin
 
@@ -53,6 +65,15 @@ class TestSchema(TestCase):
         self.assertTrue(len(gen_schema.fields), 1)
         self.assertEqual(gen_schema.fields[0].name, "Name col")
 
+    def test_generator_uses_value_pools(self):
+        schema = Schema.objects.create(name="Test schema", user=self.user)
+        self.assertIsNone(schema.get_generator.pools)
+
+        schema.pool_size = 10_000
+        pools = schema.get_generator.pools
+        self.assertEqual(pools.size, 10_000)
+        self.assertEqual(pools.directory, settings.VALUE_POOLS_DIR)
+
     def test_to_str(self):
         """Test that schema string representation isn't crashing"""
         str(Schema.objects.create(name="Test", user=self.user))  # NOSONAR
@@ -85,6 +106,43 @@ class TestSchema(TestCase):
             task.delay.assert_called_once_with(gen_data.pk)
             self.assertEqual(gen_data.num_rows, 10)
 
+    def test_invalidates_unknown_locales(self):
+        schema = Schema(name="Test schema", user=self.user, locales="en_XX")
+        with self.assertRaises(ValidationError) as error:
+            schema.full_clean()
+        self.assertEqual(list(error.exception.message_dict), ["locales"])
+
+        schema.locales = "en_US:2, uk_UA"
+        schema.full_clean()
+        self.assertEqual(
+            schema.get_generator.locales, {"en_US": 2, "uk_UA": 1}
+        )
+
+    def test_bundle_of_schemas_with_foreign_keys(self):
+        customers = Schema.objects.create(name="Customers", user=self.user)
+        customer_id = SequenceColumn.objects.create(
+            name="id", schema=customers
+        )
+        orders = Schema.objects.create(name="Orders", user=self.user)
+        order_id = SequenceColumn.objects.create(name="id", schema=orders)
+        ForeignKeyColumn.objects.create(
+            name="customer", schema=orders, parent=customer_id, mean=4
+        )
+        items = Schema.objects.create(name="Items", user=self.user)
+        ForeignKeyColumn.objects.create(
+            name="order", schema=items, parent=order_id, mean=3
+        )
+        ForeignKeyColumn.objects.create(
+            name="buyer", schema=items, parent=customer_id, mean=50
+        )
+
+        self.assertListEqual(
+            items.get_bundle(100), [(customers, 9), (orders, 34), (items, 100)]
+        )
+        self.assertTrue(items.refers_to(customers))
+        self.assertFalse(customers.refers_to(items))
+        self.assertListEqual(customers.get_bundle(5), [(customers, 5)])
+
     def test_cascade_deletion_on_user(self):
         schema_id: Schema = Schema.objects.create(
             name="Test schema", user=self.user
@@ -168,21 +226,26 @@ class TestColumnsBasic(AssertBetweenMixin, TestCase):
         cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
 
     @staticmethod
-    def get_Factory(type_, params) -> type[ListFactory]:
-        return type(
-            "_Factory", (ListFactory,), {"field": Faker(type_, **params)}
-        )
+    def generate_one(type_, params):
+        return get_filler(type_, params)(1)[0]
+
+    def make_column(self, model):
+        """A column with default params, foreign keys need a parent"""
+        if model is ForeignKeyColumn:
+            parent = SequenceColumn.objects.create(
+                schema=self.schema, name="Parent col"
+            )
+            return model(schema=self.schema, name="Test col", parent=parent)
+        return model(schema=self.schema, name="Test col")
 
     @classmethod
     def get_sample_gen_data(cls, column_instance: BaseColumn):
         cls.tested_classes.add(type(column_instance))
-        return cls.get_Factory(column_instance.type, column_instance.params)()[
-            0
-        ]
+        return cls.generate_one(column_instance.type, column_instance.params)
 
     def test_simple_columns_instantiation(self):
         for column in self.COLUMNS:
-            col = column(schema=self.schema, name="Test col")
+            col = self.make_column(column)
             col.full_clean()  # check default validation
             # full_clean() is called by modelformset
             col.save()
@@ -192,10 +255,8 @@ class TestColumnsBasic(AssertBetweenMixin, TestCase):
 
     def test_simple_columns_have_existend_faker_type(self):
         for model in self.COLUMNS:
-            column = model(schema=self.schema, name="Test col")
-            self.assertIsNotNone(
-                self.get_Factory(column.type, column.params)()[0]
-            )
+            column = self.make_column(model)
+            self.assertIsNotNone(self.generate_one(column.type, column.params))
 
     def test_simple_columns_faker_type_is_heuristically_correct(self):
         """Test that instantiating throws no errors and returns something sane. Also check that all the classes has been tested."""
@@ -262,6 +323,61 @@ class TestColumnsBasic(AssertBetweenMixin, TestCase):
         self.assertIsInstance(data, str)
         self.assertBetween(len(data), 5, 150)
 
+        data = self.get_sample_gen_data(
+            ChoiceColumn(
+                name="Col", schema=self.schema, choices="a\nb", weights="1,0"
+            )
+        )
+        self.assertEqual(data, "a")
+
+        data = self.get_sample_gen_data(
+            DistributedIntColumn(name="Col", schema=self.schema)
+        )
+        self.assertIsInstance(data, int)
+        self.assertBetween(data, 0, 1000)
+
+        data = self.get_sample_gen_data(
+            DistributedFloatColumn(name="Col", schema=self.schema, precision=3)
+        )
+        self.assertIsInstance(data, str)
+        self.assertBetween(float(data), 0, 1000)
+        self.assertEqual(len(data.split(".")[1]), 3)
+
+        data = self.get_sample_gen_data(
+            SequenceColumn(name="Col", schema=self.schema, start=10)
+        )
+        self.assertEqual(data, 10)
+
+        data = self.get_sample_gen_data(
+            UUIDColumn(name="Col", schema=self.schema, version=7)
+        )
+        self.assertEqual(uuid.UUID(data).version, 7)
+
+        data = self.get_sample_gen_data(
+            CodeColumn(name="Col", schema=self.schema, prefix="ORD-", digits=4)
+        )
+        self.assertEqual(data, "ORD-0001")
+
+        data = self.get_sample_gen_data(
+            DateRangeColumn(name="Col", schema=self.schema, format="%d.%m.%Y")
+        )
+        self.assertBetween(
+            datetime.strptime(data, "%d.%m.%Y").year, 2000, 2030
+        )
+
+        data = self.get_sample_gen_data(
+            PatternColumn(name="Col", schema=self.schema)
+        )
+        self.assertRegex(data, r"^[A-Z]{3}-\d{6}$")
+
+        parent = SequenceColumn.objects.create(
+            name="Parent", schema=self.schema, start=100, step=10
+        )
+        data = self.get_sample_gen_data(
+            ForeignKeyColumn(name="Col", schema=self.schema, parent=parent)
+        )
+        self.assertIn(data, (100, 110))
+
         self.assertSetEqual(
             self.tested_classes,
             set(self.COLUMNS),
@@ -318,3 +434,220 @@ class TestSentencesColumnSpecials(TestCase):
         error_keys = set(error.exception.message_dict.keys())
         error_keys.remove("__all__")
         self.assertTrue(field_names.issuperset(error_keys))
+
+    def test_streamed_texts_cant_be_unique(self):
+        col = SentencesColumn(
+            schema=self.schema, name="Col", nb_max=999, unique=True
+        )
+        col.full_clean()
+        col.nb_max = 1000
+        with self.assertRaises(ValidationError) as error:
+            col.full_clean()
+        self.assertEqual(list(error.exception.message_dict), ["unique"])
+
+
+class TestChoiceColumnSpecials(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+
+    def test_invalidates_incorrect_weights(self):
+        for choices, weights, field in [
+            ("\n \n", "", "choices"),
+            ("a\nb", "1,x", "weights"),
+            ("a\nb", "1,2,3", "weights"),
+            ("a\nb", "1,-1", "weights"),
+            ("a\nb", "0,0", "weights"),
+            ("a\nb", "1,inf", "weights"),
+        ]:
+            col = ChoiceColumn(
+                schema=self.schema,
+                name="Test col",
+                choices=choices,
+                weights=weights,
+            )
+            with self.subTest(weights=weights), self.assertRaises(
+                ValidationError
+            ) as error:
+                col.full_clean()
+            self.assertEqual(list(error.exception.message_dict), [field])
+
+    def test_valid_weights(self):
+        ChoiceColumn(
+            schema=self.schema,
+            name="Test col",
+            choices="free\npro\nenterprise",
+            weights="10, 2.5, 0",
+        ).full_clean()
+
+
+class TestDistributedColumnSpecials(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+
+    def test_invalidates_incorrect_params(self):
+        for params, field in [
+            ({"min": 10, "max": 5}, "min"),
+            ({"distribution": "lognormal", "mean": 0}, "mean"),
+            ({"distribution": "poisson", "mean": -1}, "mean"),
+            ({"distribution": "zipf", "exponent": 1}, "exponent"),
+            ({"deviation": -1}, "deviation"),
+        ]:
+            col = DistributedIntColumn(
+                schema=self.schema, name="Test col", **params
+            )
+            with self.subTest(**params), self.assertRaises(
+                ValidationError
+            ) as error:
+                col.full_clean()
+            self.assertIn(field, error.exception.message_dict)
+
+    def test_invalidates_too_precise_decimals(self):
+        col = DistributedFloatColumn(
+            schema=self.schema, name="Test col", precision=11
+        )
+        with self.assertRaises(ValidationError) as error:
+            col.full_clean()
+        self.assertIn("precision", error.exception.message_dict)
+
+
+class TestSequenceColumnSpecials(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+
+    def test_invalidates_zero_step(self):
+        col = SequenceColumn(schema=self.schema, name="Test col", step=0)
+        with self.assertRaises(ValidationError) as error:
+            col.full_clean()
+        self.assertEqual(list(error.exception.message_dict), ["step"])
+
+
+class TestDateRangeColumnSpecials(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+
+    def test_invalidates_incorrect_params(self):
+        for params, field in [
+            (
+                {
+                    "start": timezone.now(),
+                    "end": timezone.now() - timedelta(1),
+                },
+                "end",
+            ),
+            ({"timezone": "Mars/Olympus"}, "timezone"),
+            ({"interval": 0}, "interval"),
+        ]:
+            col = DateRangeColumn(
+                schema=self.schema, name="Test col", **params
+            )
+            with self.subTest(field), self.assertRaises(
+                ValidationError
+            ) as error:
+                col.full_clean()
+            self.assertIn(field, error.exception.message_dict)
+
+
+class TestPatternColumnSpecials(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+
+    def test_invalidates_unsupported_patterns(self):
+        for pattern in ["[a-z", r"\d+", "a*", "x{2,}", "[^a]", r"(a)\1"]:
+            col = PatternColumn(
+                schema=self.schema, name="Test col", pattern=pattern
+            )
+            with self.subTest(pattern), self.assertRaises(
+                ValidationError
+            ) as error:
+                col.full_clean()
+            self.assertEqual(list(error.exception.message_dict), ["pattern"])
+
+
+class TestForeignKeyColumnSpecials(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+        cls.parent = SequenceColumn.objects.create(
+            name="id", schema=cls.schema
+        )
+
+    def test_invalidates_incorrect_fanout(self):
+        for params, field in [
+            ({"mean": 0}, "mean"),
+            ({"fanout": "zipf", "exponent": 1}, "exponent"),
+            ({"deviation": -1}, "deviation"),
+        ]:
+            col = ForeignKeyColumn(
+                schema=self.schema,
+                name="Test col",
+                parent=self.parent,
+                **params,
+            )
+            with self.subTest(field), self.assertRaises(
+                ValidationError
+            ) as error:
+                col.full_clean()
+            self.assertIn(field, error.exception.message_dict)
+
+    def test_generator_picks_given_parent_keys(self):
+        ForeignKeyColumn.objects.create(
+            schema=self.schema, name="Test col", parent=self.parent
+        )
+        generator = self.schema.make_generator({self.parent.pk: [7, 8]})
+        values = {row[1] for row in next(generator.generate_blocks(100))}
+        self.assertSetEqual(values, {7, 8})
+
+    def test_parent_keys_are_never_null(self):
+        col = ForeignKeyColumn(
+            schema=self.schema, name="Test col", parent=self.parent
+        )
+        col.save()
+        self.parent.null_rate = 0.5
+        with self.assertRaises(ValidationError) as error:
+            self.parent.full_clean()
+        self.assertEqual(list(error.exception.message_dict), ["null_rate"])
+
+        with self.assertRaises(ValidationError) as error:
+            col.full_clean()
+        self.assertEqual(list(error.exception.message_dict), ["parent"])
+
+    def test_parents_are_deleted_only_with_their_foreign_keys(self):
+        user = get_user_model().objects.create_user(
+            username="owner", password="12345"
+        )
+        customers = Schema.objects.create(name="Customers", user=user)
+        customer_id = SequenceColumn.objects.create(
+            name="id", schema=customers
+        )
+        orders = Schema.objects.create(name="Orders", user=user)
+        ForeignKeyColumn.objects.create(
+            name="customer", schema=orders, parent=customer_id
+        )
+        with self.assertRaises(RestrictedError):
+            customer_id.delete()
+
+        user.delete()
+        self.assertFalse(Schema.objects.filter(user_id=user.pk).exists())
@@ -1,15 +1,78 @@
 # TODO: investigate possible usage of factory.random.set_random_state() to work with determined generated data
 
 import csv
+import hashlib
+import json
 import os
+import shutil
+import uuid
+import random
+import warnings
+from array import array
+import re
+import sqlite3
+import string
+import zipfile
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from functools import partial
+from io import StringIO
+from pathlib import Path
 from statistics import mean
 from typing import Generator as GeneratorType
+from xml.etree import ElementTree
+from zoneinfo import ZoneInfo
 
 from django.test import SimpleTestCase
 from factory import Faker, ListFactory
+from faker.config import AVAILABLE_LOCALES
 
-from ..services.data_saving import generate_to_csv
-from ..services.generator import ColumnDTO, Generator
+from ..services.cells import StreamedText
+from ..services.choices import AliasTable, weighted_choice_filler
+from ..services.data_saving import (
+    CSVWriter,
+    FormatOptions,
+    NDJSONWriter,
+    PostgresCopyWriter,
+    SQLInsertWriter,
+    SQLiteWriter,
+    XLSXWriter,
+    generate_to_files,
+)
+from ..services.dates import (
+    date_range_filler,
+    split_format,
+    timestamps_formatter,
+    ZoneOffsets,
+)
+from ..services.distributions import (
+    distributed_float_filler,
+    distributed_int_filler,
+)
+from ..services.fillers import get_faker, with_nulls
+from ..services.columns import ColumnDTO
+from ..services.generator import Generator
+from ..services.patterns import compile_pattern
+from ..services.locales import available_locales, parse_locales
+from ..services.peek import parse_head
+from ..services.relations import collect_keys, foreign_key_filler
+from ..services import pools as pools_module, providers
+from ..services.pools import ValuePool, ValuePools, preload_pools
+from ..services.preview import generate_preview, get_cached_generator
+from ..services.stats import DatasetStats, HyperLogLog
+from ..services.templates import (
+    Elements,
+    Template,
+    TemplateSet,
+    phone_number_filler,
+    safe_email_filler,
+)
+from ..services.unique import BloomFilter, UniqueFilter, UniqueValuesExhausted
+from ..services.warmup import warm_up
+from ..services.variable_sentences_provider import (
+    SENTENCE_LENGTHS,
+    sentences_filler,
+)
 from ..tests import AssertBetweenMixin
 
 
@@ -40,28 +103,12 @@ class TestSchema(SimpleTestCase, AssertBetweenMixin):
 
         self.assertEqual(generator.header, self.sorted_header)
 
-    def test_get_generator(self):
-        """Return a Factory class with correct fields and their params"""
-        generator = Generator(self.columns)
-        factory = generator._get_Factory()
-        field_params_dict = {
-            field.provider: field._defaults
-            for field in factory._meta.declarations.values()
-        }
-        for param in field_params_dict.values():
-            del param["locale"]
-
-        self.assertDictEqual(
-            field_params_dict,
-            {field.type: field.params for field in self.columns},
-        )
-
     def test_data_generator(self):
         """Test that data_generator returns a generator with correct number of records and fields, and fields of correct type"""
         generator = Generator(self.columns)
-        generator_yielder = generator.generate(num_records=10)
+        generator_yielder = generator.generate_blocks(num_records=10)
         self.assertIsInstance(generator_yielder, GeneratorType)
-        records = list(generator_yielder)
+        records = [row for block in generator_yielder for row in block]
 
         self.assertIsInstance(records[0], list)
         self.assertEqual(len(records), 10)
@@ -72,6 +119,12 @@ class TestSchema(SimpleTestCase, AssertBetweenMixin):
         self.assertIsInstance(records[0][1], int)
         self.assertIsInstance(records[0][2], str)
 
+    def test_generate_blocks(self):
+        generator = Generator(self.columns)
+        blocks = list(generator.generate_blocks(25, block_size=10))
+        self.assertEqual([len(block) for block in blocks], [10, 10, 5])
+        self.assertEqual(len(blocks[0][0]), len(self.columns))
+
     def test_data_generator_uses_field_params(self):
         """Test param application on example of random_int field"""
         int_min = 5
@@ -82,7 +135,7 @@ class TestSchema(SimpleTestCase, AssertBetweenMixin):
         )
         generator = Generator([field])
 
-        ints = [record[0] for record in generator.generate(num_records=100)]
+        ints = [record[0] for record in next(generator.generate_blocks(100))]
 
         # check that all ints are in range
         for int in ints:
@@ -93,6 +146,158 @@ class TestSchema(SimpleTestCase, AssertBetweenMixin):
         self.assertAlmostEqual(mean(ints), mean([int_min, int_max]), delta=20)
 
 
+class TestTemplates(SimpleTestCase):
+    def setUp(self):
+        self.random = random.Random(42)
+
+    def test_parse_template(self):
+        template = Template("(###) ??-#x", self.random, placeholders="#?")
+        self.assertEqual(
+            [
+                part if isinstance(part, str) else "*"
+                for part in template.parts
+            ],
+            ["(", "*", ") ", "*", "-", "*", "x"],
+        )
+        for value in template.fill(100):
+            self.assertRegex(value, r"^\(\d{3}\) [a-zA-Z]{2}-\dx$")
+
+    def test_fill_tokens(self):
+        fillers = {
+            "first": lambda n: ["Vasya"] * n,
+            "other": lambda n: ["?"] * n,  # not a placeholder in a token
+        }
+        template = Template(
+            "{{first}}.{{ first }}##{{other}}",
+            self.random,
+            placeholders="#?",
+            tokens=fillers.__getitem__,
+        )
+        for value in template.fill(10):
+            self.assertRegex(value, r"^Vasya\.Vasya\d\d\?$")
+
+    def test_placeholders_distribution(self):
+        template = Template("!", self.random, placeholders="!")
+        counts = Counter(template.fill(10_000))
+        # empty half of the time, each digit 1/20 of the time
+        self.assertAlmostEqual(counts[""], 5000, delta=300)
+        self.assertEqual(set(counts) - {""}, set(string.digits))
+
+        digits = Counter("".join(Template("###", self.random, "#").fill(1000)))
+        self.assertEqual(set(digits), set(string.digits))
+        self.assertAlmostEqual(mean(digits.values()), 300)
+
+    def test_template_set_picks_every_template(self):
+        templates = TemplateSet(
+            OrderedDict([("a#", 0.75), ("b##", 0.25)]),
+            self.random,
+            placeholders="#",
+        )
+        values = templates.fill(4000)
+        counts = Counter(value[0] for value in values)
+        self.assertAlmostEqual(counts["a"], 3000, delta=150)
+        for value in values:
+            self.assertRegex(value, r"^(a\d|b\d\d)$")
+
+    def test_weighted_elements(self):
+        elements = Elements(OrderedDict([("x", 9), ("y", 1)]), self.random)
+        counts = Counter(elements.fill(1000))
+        self.assertAlmostEqual(counts["x"], 900, delta=50)
+
+    def test_same_formats_as_faker(self):
+        generator = Generator(
+            [
+                ColumnDTO("Phone", "phone_number", 0, {}),
+                ColumnDTO("Email", "safe_email", 1, {}),
+                ColumnDTO("Domain", "safe_domain_name", 2, {}),
+            ]
+        )
+        shapes = lambda values: {re.sub(r"\d", "#", v) for v in values}
+        block = next(generator.generate_blocks(2000))
+        phones, emails, domains = zip(*block)
+        faker = get_faker()
+
+        self.assertLessEqual(
+            shapes(phones), shapes(faker.phone_number.__self__.formats)
+        )
+        self.assertLessEqual(
+            set(domains),
+            set(faker.safe_domain_name.__self__.safe_domain_names),
+        )
+        for email in emails:
+            self.assertRegex(email, r"^[a-z]+\d{0,2}@example\.(com|org|net)$")
+
+    def test_every_locale(self):
+        for locale in AVAILABLE_LOCALES:
+            with self.subTest(locale), warnings.catch_warnings():
+                # of deprecated locales
+                warnings.simplefilter("ignore")
+                faker = get_faker(locale)
+                if hasattr(faker, "phone_number"):
+                    for phone in phone_number_filler(faker)(20):
+                        self.assertNotIn("{{", phone)
+                for email in safe_email_filler(faker)(20):
+                    self.assertTrue(email.isascii(), email)
+                    self.assertNotIn("{{", email)
+
+
+class TestValuePools(SimpleTestCase):
+    def setUp(self):
+        self.directory = Path(f"/tmp/testpools/{uuid.uuid4()}")
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def test_build_and_read_pool(self):
+        path = self.directory / "test.pool"
+        values = ["Жора", "", "Zucc\nMark", "Oleg"]
+        ValuePool.build(path, values)
+        pool = ValuePool(path)
+
+        self.assertEqual(len(pool), 4)
+        self.assertEqual([pool[idx] for idx in range(4)], values)
+        self.assertLessEqual(
+            set(pool.sample(random.Random(), 50)), set(values)
+        )
+
+    def test_columns_filled_from_pools(self):
+        pools = ValuePools(self.directory, size=20)
+        self.assertTrue(pools.build("name", get_faker()))
+        self.assertFalse(pools.build("name", get_faker()))
+        generator = Generator(
+            [
+                ColumnDTO("Name", "name", 0, {}),
+                ColumnDTO("Age", "random_int", 1, {"min": 1, "max": 5}),
+            ],
+            pools=pools,
+        )
+        names, ages = zip(*next(generator.generate_blocks(500)))
+
+        pool = pools.get("name", get_faker())
+        self.assertEqual(len(pool), 20)
+        self.assertLessEqual(set(names), {pool[idx] for idx in range(20)})
+        self.assertLessEqual(set(ages), set(range(1, 6)))
+        self.assertIs(pools.get("name", get_faker()), pool)
+
+    def test_pools_are_not_built_while_generating(self):
+        pools = ValuePools(self.directory, size=20)
+        generator = Generator([ColumnDTO("Name", "name", 0, {})], pools=pools)
+        names = next(generator.generate_blocks(500))
+
+        self.assertGreater(len(set(map(tuple, names))), 20)
+        self.assertIsNone(pools.get("name", get_faker()))
+        self.assertFalse(self.directory.exists())
+
+    def test_preload_opens_built_pools_only(self):
+        path = self.directory / "name.en_US.3.pool"
+        ValuePool.build(path, ["Ann", "Bob", "Eve"])
+        (self.directory / "name.en_US.3.pool.tmp").touch()
+
+        self.assertEqual(preload_pools(self.directory), 1)
+        self.assertIn(path, pools_module._pools)
+        pool = ValuePools(self.directory, size=3).get("name", get_faker())
+        self.assertIs(pool, pools_module._pools[path])
+        self.assertEqual(len(list(self.directory.iterdir())), 2)
+
+
 class TestCustomSentencesProvider(SimpleTestCase, AssertBetweenMixin):
     """Test LoremProvider_en_US with sentences_variable_str()
     Check https://github.com/joke2k/faker/tree/master/tests for inspiration"""
@@ -141,18 +346,52 @@ class TestCustomSentencesProvider(SimpleTestCase, AssertBetweenMixin):
         # then maybe test some statistical stuff, but there isn't much to get broken, so enough just to test it manually once. So I did.
 
 
+class TestSentencesFiller(SimpleTestCase, AssertBetweenMixin):
+    def test_sentences_structure(self):
+        fill = sentences_filler(get_faker(), nb_min=2, nb_max=4)
+        for text in fill(200):
+            sentences = text[:-1].split(". ")
+            self.assertTrue(text.endswith("."))
+            self.assertBetween(len(sentences), 2, 4)
+            for sentence in sentences:
+                words = sentence.split(" ")
+                self.assertIn(len(words), SENTENCE_LENGTHS)
+                self.assertTrue(words[0][0].isupper())
+
+    def test_same_length_distribution_as_provider(self):
+        faker = get_faker()
+        fast = sentences_filler(faker, nb_min=1, nb_max=4)(2000)
+        slow = [faker.sentences_variable_str(1, 4) for _ in range(2000)]
+        self.assertAlmostEqual(
+            mean(map(len, fast)), mean(map(len, slow)), delta=5
+        )
+
+
+def write_single_file(blocks, columns, writer_class=CSVWriter, **options):
+    return next(
+        generate_to_files(
+            blocks,
+            partial(
+                writer_class, columns=columns, options=FormatOptions(**options)
+            ),
+        )
+    )
+
+
 class TestCSVSaving(SimpleTestCase):
+    columns = [
+        ColumnDTO("name", "name", 0, {}),
+        ColumnDTO("age", "random_int", 1, {}),
+    ]
+
     def test_data_saving(self):
         header = ["name", "age"]
         data = [["Vasya", "25"], ["Zucc", "38"]]
         delimiter = "!"
         quotechar = "~"
 
-        file = generate_to_csv(
-            generator=iter(data),
-            header=header,
-            delimiter=delimiter,
-            quotechar=quotechar,
+        file = write_single_file(
+            [data], self.columns, delimiter=delimiter, quotechar=quotechar
         )
         with open(file, "r") as f:
             csv_reader = csv.reader(
@@ -162,3 +401,1022 @@ class TestCSVSaving(SimpleTestCase):
             self.assertListEqual(list(csv_reader), data)
 
         os.remove(file)
+
+    def test_size_and_checksum_of_written_file(self):
+        file = write_single_file([[["Жора", 25]]], self.columns)
+        with open(file, "rb") as f:
+            content = f.read()
+        os.remove(file)
+
+        self.assertEqual(content, "name,age\r\nЖора,25\r\n".encode())
+        self.assertEqual(file.size, len(content))
+        self.assertEqual(file.sha256, hashlib.sha256(content).hexdigest())
+        self.assertEqual(file.num_rows, 1)
+
+    def test_same_output_as_csv_writer(self):
+        columns = [
+            ColumnDTO("name, full", "name", 0, {}),
+            ColumnDTO("age", "random_int", 1, {}),
+            ColumnDTO("born", "date", 2, {}),
+            ColumnDTO("phone", "phone_number", 3, {}),
+        ]
+        data = [
+            ['Says "hi"\n', -5, "1997-05-01", "(555)123-4567x12"],
+            ["", 38, "1984-05-14", "+1-555.123.4567"],
+            ["Jr.\r", 0, "2021-01-31", "555-1234"],
+        ]
+        # the last ones make "safe" columns need quoting
+        for delimiter, quotechar in [(",", '"'), (";", "~"), ("-", '"')]:
+            for selected in (slice(None), slice(0, 1), slice(1, 2)):
+                cols, rows = columns[selected], [r[selected] for r in data]
+                with self.subTest(delimiter=delimiter, selected=selected):
+                    file = write_single_file(
+                        [rows],
+                        cols,
+                        delimiter=delimiter,
+                        quotechar=quotechar,
+                    )
+                    with open(file, "r", newline="") as f:
+                        content = f.read()
+                    os.remove(file)
+
+                    expected = StringIO()
+                    writer = csv.writer(
+                        expected, delimiter=delimiter, quotechar=quotechar
+                    )
+                    writer.writerow([column.name for column in cols])
+                    writer.writerows(rows)
+                    self.assertEqual(content, expected.getvalue())
+
+    def test_phone_numbers_of_other_locales(self):
+        columns = [ColumnDTO("phone", "phone_number", 0, {})]
+        for locales in [{"de_DE": 1}, {"en_US": 1, "hu_HU": 1}]:
+            with self.subTest(locales):
+                generator = Generator(columns, locales=locales)
+                rows = next(generator.generate_blocks(200))
+                file = write_single_file(
+                    [rows], columns, delimiter=" ", locales=list(locales)
+                )
+                with open(file, "r", newline="") as f:
+                    content = f.read()
+                os.remove(file)
+
+                expected = StringIO()
+                writer = csv.writer(expected, delimiter=" ")
+                writer.writerow(["phone"])
+                writer.writerows(rows)
+                self.assertEqual(content, expected.getvalue())
+
+
+class TestNDJSONSaving(SimpleTestCase):
+    def test_data_saving(self):
+        columns = [
+            ColumnDTO("name", "name", 0, {}),
+            ColumnDTO("age", "random_int", 1, {}),
+            ColumnDTO('"quoted"\nkey', "job", 2, {}),
+        ]
+        data = [["Жора", 25, 'Says "hi"\n'], ["Zucc", 38, "CEO"]]
+
+        file = write_single_file([data[:1], data[1:]], columns, NDJSONWriter)
+        with open(file, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        os.remove(file)
+
+        self.assertEqual(lines[0].count("Жора"), 1)  # not escaped
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [
+                {"name": "Жора", "age": 25, '"quoted"\nkey': 'Says "hi"\n'},
+                {"name": "Zucc", "age": 38, '"quoted"\nkey': "CEO"},
+            ],
+        )
+
+
+class TestStreamedCells(SimpleTestCase):
+    columns = [
+        ColumnDTO("name", "name", 0, {}),
+        ColumnDTO("text", "sentences_variable_str", 1, {"nb_max": 10_000}),
+    ]
+
+    def get_rows(self, alphabet='abc ,"\n'):
+        pieces = [["Lorem, ipsum", ' "dolor"\n'], ["sit amet"]]
+        return [
+            [name, StreamedText(iter(text), frozenset(alphabet))]
+            for name, text in zip(["Vasya", "Zucc"], pieces)
+        ]
+
+    def read_and_remove(self, file):
+        with open(file, "r", newline="") as f:
+            content = f.read()
+        os.remove(file)
+        return content
+
+    def test_streamed_text(self):
+        text = StreamedText(iter(["Жора", " 25"]), frozenset())
+        self.assertEqual(str(text), "Жора 25")
+        self.assertEqual(text.length, 7)
+        self.assertEqual(
+            text.digest(),
+            hashlib.blake2b("Жора 25".encode(), digest_size=8).digest(),
+        )
+
+    def test_giant_sentences_are_streamed(self):
+        self.assertFalse(self.columns[0].streamed)
+        self.assertTrue(self.columns[1].streamed)
+        block = next(Generator(self.columns).generate_blocks(2))
+        self.assertIsInstance(block[0][1], StreamedText)
+
+    def test_csv_streamed_cells(self):
+        file = write_single_file([self.get_rows()], self.columns)
+        self.assertEqual(
+            self.read_and_remove(file),
+            'name,text\r\nVasya,"Lorem, ipsum ""dolor""\n"\r\n'
+            'Zucc,"sit amet"\r\n',
+        )
+
+    def test_csv_streamed_cells_without_special_characters(self):
+        file = write_single_file([self.get_rows("abc ")[1:]], self.columns)
+        self.assertEqual(
+            self.read_and_remove(file), "name,text\r\nZucc,sit amet\r\n"
+        )
+
+    def test_ndjson_streamed_cells(self):
+        file = write_single_file([self.get_rows()], self.columns, NDJSONWriter)
+        self.assertEqual(
+            [
+                json.loads(line)
+                for line in self.read_and_remove(file).splitlines()
+            ],
+            [
+                {"name": "Vasya", "text": 'Lorem, ipsum "dolor"\n'},
+                {"name": "Zucc", "text": "sit amet"},
+            ],
+        )
+
+    def test_other_formats_read_streamed_cells_whole(self):
+        file = write_single_file(
+            [self.get_rows()], self.columns, SQLInsertWriter
+        )
+        self.assertIn(
+            "('Vasya', 'Lorem, ipsum \"dolor\"\n')", self.read_and_remove(file)
+        )
+
+    def test_streamed_cells_stats(self):
+        stats = DatasetStats(self.columns)
+        rows = self.get_rows()
+        file = write_single_file(stats.observe([rows]), self.columns)
+        os.remove(file)
+        text_stats = stats.to_dict(total_bytes=0)["columns"][1]
+        self.assertEqual(text_stats["distinct"], 2)
+        self.assertEqual(text_stats["avg_length"], (21 + 8) / 2)
+
+
+class TestSQLSaving(SimpleTestCase):
+    columns = [
+        ColumnDTO('Full "name"', "name", 0, {}),
+        ColumnDTO("age", "random_int", 1, {}),
+        ColumnDTO("born", "date", 2, {}),
+    ]
+    data = [
+        ["O'Neil\\\tJr.\r\n", 25, "1997-05-01"],
+        ["Zucc", 38, "1984-05-14"],
+        ["Oleg", 1, "2021-01-31"],
+    ]
+    create_table = (
+        'CREATE TABLE IF NOT EXISTS "people" (\n'
+        '    "Full ""name""" text,\n'
+        '    "age" bigint,\n'
+        '    "born" date\n'
+        ");\n"
+    )
+    column_list = '"people" ("Full ""name""", "age", "born")'
+
+    def read_and_remove(self, file):
+        with open(file, "r", newline="") as f:
+            content = f.read()
+        os.remove(file)
+        return content
+
+    def test_postgres_copy(self):
+        file = write_single_file(
+            [self.data[:1], self.data[1:]],
+            self.columns,
+            PostgresCopyWriter,
+            table_name="people",
+        )
+        self.assertEqual(
+            self.read_and_remove(file),
+            self.create_table
+            + f"COPY {self.column_list} FROM stdin;\n"
+            + "O'Neil\\\\\\tJr.\\r\\n\t25\t1997-05-01\n"
+            + "Zucc\t38\t1984-05-14\n"
+            + "Oleg\t1\t2021-01-31\n"
+            + "\\.\n",
+        )
+
+    def test_batched_inserts(self):
+        file = write_single_file(
+            [self.data[:1], self.data[1:]],
+            self.columns,
+            SQLInsertWriter,
+            table_name="people",
+            batch_size=2,
+        )
+        insert = f"INSERT INTO {self.column_list} VALUES\n"
+        self.assertEqual(
+            self.read_and_remove(file),
+            self.create_table
+            + insert
+            + "('O''Neil\\\tJr.\r\n', 25, '1997-05-01'),\n"
+            + "('Zucc', 38, '1984-05-14');\n"
+            + insert
+            + "('Oleg', 1, '2021-01-31');\n",
+        )
+
+    def test_sqlite_database(self):
+        file = write_single_file(
+            [self.data[:1], self.data[1:]],
+            self.columns,
+            SQLiteWriter,
+            table_name="people",
+        )
+        with open(file, "rb") as f:
+            content = f.read()
+        self.assertEqual(file.size, len(content))
+        self.assertEqual(file.sha256, hashlib.sha256(content).hexdigest())
+
+        db = sqlite3.connect(file)
+        try:
+            self.assertEqual(
+                db.execute('SELECT * FROM "people"').fetchall(),
+                [tuple(row) for row in self.data],
+            )
+            self.assertEqual(
+                [
+                    (name, type)
+                    for _, name, type, *_ in db.execute(
+                        'PRAGMA table_info("people")'
+                    )
+                ],
+                [
+                    ('Full "name"', "TEXT"),
+                    ("age", "INTEGER"),
+                    ("born", "TEXT"),
+                ],
+            )
+        finally:
+            db.close()
+            os.remove(file)
+
+    def test_sqlite_files_removed_on_errors(self):
+        writers = []
+
+        def make_writer(file):
+            writers.append(
+                SQLiteWriter(file, self.columns, options=FormatOptions())
+            )
+            return writers[0]
+
+        def blocks():
+            yield self.data[:1]
+            raise UniqueValuesExhausted("Out of values")
+
+        with self.assertRaises(UniqueValuesExhausted):
+            next(generate_to_files(blocks(), make_writer))
+        writer = writers[0]
+        self.assertFalse(writer._path.exists())
+        self.assertFalse(Path(writer.file.file.name).exists())
+        with self.assertRaises(sqlite3.ProgrammingError):
+            writer._db.execute("SELECT 1")
+
+
+class TestXLSXSaving(SimpleTestCase):
+    NS = {"s": XLSXWriter.NAMESPACE}
+
+    def read_sheets(self, file):
+        with zipfile.ZipFile(file) as workbook:
+            names = [
+                sheet.get("name")
+                for sheet in ElementTree.fromstring(
+                    workbook.read("xl/workbook.xml")
+                ).iterfind("s:sheets/s:sheet", self.NS)
+            ]
+            sheets = [
+                [
+                    [
+                        cell.findtext("s:v", namespaces=self.NS)
+                        or cell.findtext("s:is/s:t", namespaces=self.NS)
+                        for cell in row
+                    ]
+                    for row in ElementTree.fromstring(
+                        workbook.read(f"xl/worksheets/sheet{n}.xml")
+                    ).iterfind("s:sheetData/s:row", self.NS)
+                ]
+                for n in range(1, len(names) + 1)
+            ]
+        return names, sheets
+
+    def test_rows_roll_over_to_new_sheets(self):
+        class SmallSheetsWriter(XLSXWriter):
+            SHEET_MAX_ROWS = 3
+
+        columns = [
+            ColumnDTO("name", "name", 0, {}),
+            ColumnDTO("age", "random_int", 1, {}),
+        ]
+        data = [["<Vasya> & co", 25], [" Жора ", 38], ["Oleg", 1]]
+
+        file = write_single_file(
+            [data[:1], data[1:]], columns, SmallSheetsWriter
+        )
+        names, sheets = self.read_sheets(file)
+        os.remove(file)
+
+        self.assertEqual(names, ["Sheet1", "Sheet2"])
+        self.assertEqual(
+            sheets,
+            [
+                [["name", "age"], ["<Vasya> & co", "25"], [" Жора ", "38"]],
+                [["name", "age"], ["Oleg", "1"]],
+            ],
+        )
+
+    def test_control_characters_are_removed(self):
+        columns = [ColumnDTO("name", "name", 0, {})]
+        data = [["Va\x00sya\x0b\x1f"], ["Zu\tcc\n"]]
+
+        file = write_single_file([data], columns, XLSXWriter)
+        names, sheets = self.read_sheets(file)
+        os.remove(file)
+
+        self.assertEqual(sheets, [[["name"], ["Vasya"], ["Zu\tcc\n"]]])
+
+    def test_long_texts_are_cut(self):
+        class ShortCellsWriter(XLSXWriter):
+            CELL_MAX_LENGTH = 5
+
+        columns = [
+            ColumnDTO("name", "name", 0, {}),
+            ColumnDTO("text", "sentences_variable_str", 1, {"nb_max": 10_000}),
+        ]
+        pieces = iter(["Жора ", "is ", "never ", "generated"])
+        data = [["<Vasya>", StreamedText(pieces, frozenset())]]
+
+        file = write_single_file([data], columns, ShortCellsWriter)
+        names, sheets = self.read_sheets(file)
+        os.remove(file)
+
+        self.assertEqual(sheets, [[["name", "text"], ["<Vasy", "Жора "]]])
+        self.assertEqual(list(pieces), ["is ", "never ", "generated"])
+
+
+class TestSplitting(SimpleTestCase):
+    columns = [
+        ColumnDTO("name", "name", 0, {}),
+        ColumnDTO("age", "random_int", 1, {}),
+    ]
+    header = ["name", "age"]
+    data = [["Vasya", "25"], ["Zucc", "38"], ["Oleg", "1"]]
+
+    def write(self, blocks, **limits):
+        return list(
+            generate_to_files(
+                blocks,
+                partial(
+                    CSVWriter, columns=self.columns, options=FormatOptions()
+                ),
+                **limits,
+            )
+        )
+
+    def read_and_remove(self, files):
+        contents = []
+        for file in files:
+            with open(file, "r", newline="") as f:
+                contents.append(list(csv.reader(f)))
+            os.remove(file)
+        return contents
+
+    def test_split_by_rows(self):
+        # blocks are split as needed
+        files = self.write([self.data[:1], self.data[1:]], max_rows=2)
+        self.assertEqual([file.num_rows for file in files], [2, 1])
+        self.assertEqual(
+            self.read_and_remove(files),
+            [[self.header, *self.data[:2]], [self.header, self.data[2]]],
+        )
+
+    def test_split_by_bytes(self):
+        # the header is already over the limit, so a block per file
+        files = self.write([[row] for row in self.data], max_bytes=5)
+        self.assertEqual([file.num_rows for file in files], [1, 1, 1])
+        self.assertEqual(
+            self.read_and_remove(files),
+            [[self.header, row] for row in self.data],
+        )
+
+    def test_no_rows_is_single_file_with_header(self):
+        files = self.write([], max_rows=2)
+        self.assertEqual(self.read_and_remove(files), [[self.header]])
+
+
+class TestPreview(SimpleTestCase):
+    def setUp(self) -> None:
+        self.columns = [
+            ColumnDTO("Full name", "name", 0, {}),
+            ColumnDTO("Age", "random_int", 1, {"min": 18, "max": 65}),
+        ]
+
+    def test_generator_is_cached_by_key(self):
+        build = lambda: Generator(self.columns)
+        generator = get_cached_generator(("test", 1), build)
+        self.assertIs(get_cached_generator(("test", 1), build), generator)
+        self.assertIsNot(get_cached_generator(("test", 2), build), generator)
+
+    def test_generates_requested_rows(self):
+        rows = generate_preview(Generator(self.columns), 20, 10, 100)
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(len(rows[0]), 2)
+        self.assertIsInstance(rows[0][1], int)
+
+    def test_stops_on_spent_time_budget(self):
+        rows = generate_preview(Generator(self.columns), 20, 0, 100)
+        self.assertEqual(len(rows), 1)
+
+    def test_long_texts_are_cut(self):
+        params = {"nb_min": 100_000, "nb_max": 100_000}
+        generator = Generator(
+            [
+                ColumnDTO("Huge", "sentences_variable_str", 0, params),
+                ColumnDTO("Long", "sentences_variable_str", 1, {}),
+            ]
+        )
+        rows = generate_preview(generator, 5, 10, 50)
+
+        self.assertEqual(len(rows), 5)
+        for huge, long in rows:
+            self.assertEqual(len(huge), 51)
+            self.assertTrue(huge.endswith("…"))
+            self.assertLessEqual(len(long), 51)
+
+
+class TestPeekParsing(SimpleTestCase):
+    data = 'name,bio\r\nVasya,"Line 1\r\nLine 2"\r\nZucc,"Meta, \r\nverse"\r\n'
+
+    def test_parse_whole_file(self):
+        header, rows = parse_head(
+            self.data.encode(), False, ",", '"', max_rows=10
+        )
+        self.assertEqual(header, ["name", "bio"])
+        self.assertEqual(
+            rows,
+            [["Vasya", "Line 1\r\nLine 2"], ["Zucc", "Meta, \r\nverse"]],
+        )
+
+    def test_drop_cut_multiline_row(self):
+        cut = self.data.encode()[: self.data.index("verse")]
+        header, rows = parse_head(cut, True, ",", '"', max_rows=10)
+        self.assertEqual(rows, [["Vasya", "Line 1\r\nLine 2"]])
+
+    def test_drop_cut_multibyte_character(self):
+        data = "name\r\nЖора\r\nЖанна\r\n".encode()
+        header, rows = parse_head(data[:-6], True, ",", '"', max_rows=10)
+        self.assertEqual(rows, [["Жора"]])
+
+    def test_limit_rows(self):
+        header, rows = parse_head(
+            self.data.encode(), True, ",", '"', max_rows=1
+        )
+        self.assertEqual(header, ["name", "bio"])
+        self.assertEqual(rows, [["Vasya", "Line 1\r\nLine 2"]])
+
+
+class TestStats(SimpleTestCase):
+    def test_hyperloglog_estimates_distinct_values(self):
+        for num_values in (100, 50000):
+            hll = HyperLogLog()
+            for value in range(num_values):
+                hll.add(value)
+                hll.add(value)  # duplicates don't count
+            self.assertAlmostEqual(
+                hll.count(), num_values, delta=num_values * 0.05
+            )
+
+    def test_dataset_stats(self):
+        stats = DatasetStats(
+            [
+                ColumnDTO("Name", "name", 0, {}),
+                ColumnDTO("Age", "random_int", 1, {}),
+                ColumnDTO("Born", "date", 2, {}),
+            ]
+        )
+        rows = [
+            ["Vasya", 25, "1997-05-01"],
+            ["Zucc", 38, "1984-05-14"],
+            ["Vasya", 18, "2004-01-31"],
+        ]
+        self.assertEqual(
+            list(stats.observe([rows[:2], rows[2:]])), [rows[:2], rows[2:]]
+        )
+        self.assertDictEqual(
+            stats.to_dict(total_bytes=100),
+            {
+                "total_bytes": 100,
+                "columns": [
+                    {"name": "Name", "distinct": 2, "avg_length": 4.67},
+                    {"name": "Age", "distinct": 3, "min": 18, "max": 38},
+                    {
+                        "name": "Born",
+                        "distinct": 3,
+                        "min": "1984-05-14",
+                        "max": "2004-01-31",
+                        "avg_length": 10,
+                    },
+                ],
+            },
+        )
+
+
+class TestUniqueValues(SimpleTestCase):
+    def test_bloom_filter_false_positive_rate(self):
+        bloom = BloomFilter(10000, 0.01)
+        hashes = [
+            (random.getrandbits(64), random.getrandbits(64))
+            for _ in range(11000)
+        ]
+        for hashed in hashes[:10000]:
+            bloom.add(*hashed)
+        self.assertTrue(all(bloom.add(*hashed) for hashed in hashes[:10000]))
+        false_positives = sum(
+            bloom.add(*hashed) for hashed in hashes[10000:11000]
+        )
+        self.assertLess(false_positives, 40)
+
+    def test_unique_column(self):
+        generator = Generator(
+            [ColumnDTO("Age", "random_int", 0, {"max": 999}, unique=True)]
+        )
+        values = [
+            row[0]
+            for block in generator.generate_blocks(900, block_size=100)
+            for row in block
+        ]
+        self.assertEqual(len(values), 900)
+        self.assertEqual(len(set(values)), 900)
+
+    def test_unique_across_shards(self):
+        def fill(n):
+            return random.choices(range(3000), k=n)
+
+        values = []
+        for shard in range(3):
+            values += UniqueFilter(fill, 500, shard, num_shards=3)(500)
+        self.assertEqual(len(set(values)), 1500)
+
+    def test_values_run_out(self):
+        unique = UniqueFilter(lambda n: random.choices("abc", k=n), 10)
+        with self.assertRaises(UniqueValuesExhausted):
+            unique(4)
+
+
+class TestChoices(SimpleTestCase):
+    def test_alias_table_distribution(self):
+        weights = [5, 0, 1, 3, 1]
+        table = AliasTable("abcde", weights)
+        counts = Counter(table.sample(random.Random(1), 100000))
+        for value, weight in zip("abcde", weights):
+            self.assertAlmostEqual(
+                counts[value] / 100000, weight / 10, delta=0.01
+            )
+
+    def test_uniform_without_weights(self):
+        table = AliasTable(range(1000), None)
+        counts = Counter(table.sample(random.Random(1), 100000))
+        self.assertEqual(set(counts), set(range(1000)))
+        self.assertLess(max(counts.values()), 200)
+
+    def test_filler(self):
+        fill = weighted_choice_filler(get_faker(), "yes\n\nno\n", "1, 3")
+        values = fill(1000)
+        self.assertEqual(len(values), 1000)
+        self.assertEqual(set(values), {"yes", "no"})
+        self.assertGreater(values.count("no"), values.count("yes"))
+
+
+class TestDistributions(SimpleTestCase):
+    params = {
+        "min": 0,
+        "max": 1000,
+        "mean": 100,
+        "deviation": 20,
+        "exponent": 2,
+    }
+
+    def sample(self, distribution, **params):
+        fill = distributed_int_filler(
+            get_faker(),
+            **{**self.params, "distribution": distribution, **params},
+        )
+        return fill(20000)
+
+    def test_means(self):
+        for distribution, expected in [
+            ("normal", 100),
+            ("lognormal", 100),
+            ("poisson", 100),
+        ]:
+            with self.subTest(distribution):
+                values = self.sample(distribution)
+                self.assertTrue(all(isinstance(x, int) for x in values))
+                self.assertAlmostEqual(mean(values), expected, delta=2)
+
+    def test_zipf(self):
+        counts = Counter(self.sample("zipf", min=10))
+        self.assertEqual(min(counts), 10)
+        # probabilities of ranks are proportional to 1/rank^2
+        self.assertAlmostEqual(counts[10] / counts[11], 4, delta=0.4)
+
+    def test_clamped_to_bounds(self):
+        values = self.sample("normal", min=90, max=110)
+        self.assertEqual((min(values), max(values)), (90, 110))
+        values = self.sample("poisson", mean=1e7, min=0, max=10**8)
+        self.assertAlmostEqual(mean(values), 1e7, delta=100)
+
+    def test_decimal_formatting(self):
+        fill = distributed_float_filler(
+            get_faker(),
+            precision=3,
+            **{**self.params, "distribution": "lognormal", "min": 0.5},
+        )
+        values = fill(1000)
+        self.assertTrue(all(re.fullmatch(r"\d+\.\d{3}", x) for x in values))
+        self.assertGreaterEqual(min(map(float, values)), 0.5)
+
+    def test_decimal_stats_are_numeric(self):
+        stats = DatasetStats([ColumnDTO("Price", "distributed_float", 0, {})])
+        list(stats.observe([[["9.50"], ["10.25"]], [["100.00"]]]))
+        self.assertEqual(
+            stats.to_dict(total_bytes=0)["columns"][0],
+            {
+                "name": "Price",
+                "distinct": 3,
+                "min": "9.50",
+                "max": "100.00",
+                "avg_length": 5,
+            },
+        )
+
+    def test_timestamp_stats_in_chronological_formats(self):
+        stats = DatasetStats(
+            [
+                ColumnDTO("Default", "date_range", 0, {}),
+                ColumnDTO("Month", "date_range", 1, {"format": "%Y/%m"}),
+                ColumnDTO("Day", "date_range", 2, {"format": "%d.%m.%Y"}),
+            ]
+        )
+        list(
+            stats.observe(
+                [
+                    [
+                        ["2021-05-01 10:00:00", "2021/05", "01.05.2021"],
+                        ["2020-12-31 23:59:59", "2020/12", "31.12.2020"],
+                    ]
+                ]
+            )
+        )
+        columns = stats.to_dict(total_bytes=0)["columns"]
+        self.assertEqual(
+            [(column.get("min"), column.get("max")) for column in columns],
+            [
+                ("2020-12-31 23:59:59", "2021-05-01 10:00:00"),
+                ("2020/12", "2021/05"),
+                (None, None),
+            ],
+        )
+        self.assertNotIn("min", columns[2])
+
+
+class TestNulls(SimpleTestCase):
+    columns = [
+        ColumnDTO("name", "name", 0, {}, null_rate=0.5),
+        ColumnDTO("age", "random_int", 1, {}, null_rate=0.5),
+    ]
+    data = [["Vasya", None], [None, 38]]
+
+    def test_only_values_that_are_not_null_are_generated(self):
+        generated = []
+
+        def fill(n):
+            generated.append(n)
+            return ["x"] * n
+
+        values = with_nulls(fill, 0.9, random.Random(1))(10000)
+        self.assertEqual(values.count("x"), generated[0])
+        self.assertAlmostEqual(values.count(None), 9000, delta=150)
+
+    def test_generator_makes_nulls(self):
+        generator = Generator(
+            [ColumnDTO("name", "name", 0, {}, unique=True, null_rate=0.3)]
+        )
+        values = [row[0] for row in next(generator.generate_blocks(1000))]
+        self.assertAlmostEqual(values.count(None), 300, delta=60)
+        present = [value for value in values if value is not None]
+        self.assertEqual(len(present), len(set(present)))
+
+    def test_null_of_formats(self):
+        for writer_class, null, expected in [
+            (CSVWriter, "", "name,age\r\nVasya,\r\n,38\r\n"),
+            (CSVWriter, "\\N", "name,age\r\nVasya,\\N\r\n\\N,38\r\n"),
+            (CSVWriter, "a,b", 'name,age\r\nVasya,"a,b"\r\n"a,b",38\r\n'),
+            (
+                NDJSONWriter,
+                "",
+                '{"name":"Vasya","age":null}\n{"name":null,"age":38}\n',
+            ),
+            (PostgresCopyWriter, "", "Vasya\t\\N\n\\N\t38\n"),
+            (SQLInsertWriter, "", "('Vasya', NULL),\n(NULL, 38);"),
+        ]:
+            with self.subTest(writer_class.__name__, null=null):
+                file = write_single_file(
+                    [self.data], self.columns, writer_class, null=null
+                )
+                with open(file, newline="") as f:
+                    self.assertIn(expected, f.read())
+                os.remove(file)
+
+    def test_sqlite_nulls(self):
+        file = write_single_file([self.data], self.columns, SQLiteWriter)
+        with sqlite3.connect(file) as db:
+            rows = db.execute('SELECT * FROM "dataset"').fetchall()
+        os.remove(file)
+        self.assertEqual(rows, [("Vasya", None), (None, 38)])
+
+    def test_stats_count_nulls_apart(self):
+        stats = DatasetStats(self.columns)
+        list(stats.observe([self.data]))
+        self.assertEqual(
+            stats.to_dict(total_bytes=0)["columns"],
+            [
+                {"name": "name", "distinct": 1, "nulls": 1, "avg_length": 5},
+                {
+                    "name": "age",
+                    "distinct": 1,
+                    "min": 38,
+                    "max": 38,
+                    "nulls": 1,
+                },
+            ],
+        )
+
+
+class TestKeyColumns(SimpleTestCase):
+    columns = [
+        ColumnDTO("id", "sequence", 0, {"start": 100, "step": -2}),
+        ColumnDTO("code", "code", 1, {"prefix": "A%", "digits": 3}),
+        ColumnDTO("uuid", "uuid", 2, {"version": 4}),
+        ColumnDTO("uuid7", "uuid", 3, {"version": 7}),
+    ]
+
+    def rows(self, num_records, **kwargs):
+        generator = Generator(self.columns)
+        return [
+            row
+            for block in generator.generate_blocks(
+                num_records, block_size=7, **kwargs
+            )
+            for row in block
+        ]
+
+    def test_sequences(self):
+        rows = self.rows(20)
+        self.assertEqual([row[0] for row in rows], list(range(100, 60, -2)))
+        self.assertEqual(rows[0][1], "A%001")
+        self.assertEqual(rows[-1][1], "A%020")
+        # a kept generator starts over
+        self.assertEqual(self.rows(1)[0][:2], [100, "A%001"])
+
+    def test_shards_continue_sequences(self):
+        rows = []
+        for shard in range(3):
+            rows += self.rows(10, shard=shard, num_shards=3)
+        self.assertEqual([row[0] for row in rows], list(range(100, 40, -2)))
+        rows = self.rows(2, first_row=5)
+        self.assertEqual([row[1] for row in rows], ["A%006", "A%007"])
+
+    def test_uuids(self):
+        rows = self.rows(5000)
+        for column, version in [(2, 4), (3, 7)]:
+            values = [row[column] for row in rows]
+            self.assertEqual(len(set(values)), 5000)
+            for value in values[:100]:
+                parsed = uuid.UUID(value)
+                self.assertEqual(str(parsed), value)
+                self.assertEqual(parsed.version, version)
+                self.assertEqual(parsed.variant, uuid.RFC_4122)
+        version7 = [row[3] for row in rows]
+        self.assertEqual(version7, sorted(version7))
+
+
+class TestDates(SimpleTestCase):
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+    def test_split_format(self):
+        self.assertEqual(
+            split_format("on %d.%m.%Y at %H:%M, 100%%"),
+            [(True, "on %d.%m.%Y at "), (False, "%H:%M, 100%%")],
+        )
+        self.assertIsNone(split_format("%Y %Z"))
+        self.assertIsNone(split_format("no directives"))
+
+    def test_formatting_matches_strftime(self):
+        timestamps = [
+            random.randrange(-(10**9), 3 * 10**9) for _ in range(5000)
+        ]
+        for form, zone in [
+            ("%Y-%m-%d %H:%M:%S", "UTC"),
+            ("%a, %d %b %Y %I:%M %p", "America/New_York"),
+            ("%H:%M %d.%m.%y", "Australia/Adelaide"),
+            ("%Y-%m-%dT%H:%M:%S%z", "Europe/Kyiv"),
+        ]:
+            with self.subTest(form, zone=zone):
+                expected = [
+                    datetime.fromtimestamp(ts, ZoneInfo(zone)).strftime(form)
+                    for ts in timestamps
+                ]
+                self.assertEqual(
+                    timestamps_formatter(form, zone)(timestamps), expected
+                )
+
+    def test_zone_offsets_by_transitions(self):
+        kyiv = ZoneOffsets(ZoneInfo("Europe/Kyiv"))
+        timestamps = [int(self.start.timestamp()), int(self.end.timestamp())]
+        kyiv.to_local(timestamps)
+        # two DST changes a year
+        self.assertEqual(len(kyiv.transitions), 4)
+        self.assertEqual(kyiv.offsets, [7200, 10800] * 2 + [7200])
+        # 2020-03-29 03:00 local time, and a second before it
+        self.assertEqual(
+            kyiv.to_local([1585443600, 1585443599]),
+            [1585443600 + 10800, 1585443599 + 7200],
+        )
+
+        fixed = ZoneOffsets(ZoneInfo("Etc/GMT+3"))
+        self.assertEqual(
+            fixed.to_local(timestamps), [t - 10800 for t in timestamps]
+        )
+        self.assertEqual(fixed.offsets, [])
+
+    def test_random_between_bounds(self):
+        values = date_range_filler(
+            get_faker(), 0, self.start, self.end, format="%Y-%m-%d"
+        )(1000)
+        self.assertEqual(min(values)[:4], "2020")
+        self.assertEqual(max(values)[:4], "2021")
+
+    def test_time_series(self):
+        def timestamps(values):
+            return [
+                datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+                .replace(tzinfo=timezone.utc)
+                .timestamp()
+                for value in values
+            ]
+
+        fill = date_range_filler(
+            get_faker(), 0, self.start, self.end, mode="series", interval=10
+        )
+        values = timestamps(fill(5000) + fill(5000))
+        self.assertEqual(values[0], self.start.timestamp())
+        self.assertEqual(values, sorted(values))
+        self.assertAlmostEqual(
+            (values[-1] - values[0]) / len(values), 10, delta=0.5
+        )
+        shard = date_range_filler(
+            get_faker(), 100, self.start, self.end, mode="series"
+        )
+        self.assertEqual(
+            timestamps(shard(1))[0], self.start.timestamp() + 6000
+        )
+
+
+class TestPatterns(SimpleTestCase):
+    def test_values_match_patterns(self):
+        for pattern in [
+            r"[A-Z]{3}-\d{6}",
+            r"^(INV|ORD)-[0-9a-f]{4,8}(/\d{1,2})?$",
+            r"x{0,3}.\w[ąę_]{2}",
+            r"(ab|c){2,3}",
+        ]:
+            values = compile_pattern(pattern).fill(random.Random(1), 500)
+            with self.subTest(pattern):
+                self.assertEqual(len(values), 500)
+                for value in values:
+                    self.assertRegex(value, f"^(?:{pattern})$")
+
+    def test_characters_are_equally_likely(self):
+        values = compile_pattern("[a-c]{30}").fill(random.Random(1), 1000)
+        counts = Counter("".join(values))
+        for char in "abc":
+            self.assertAlmostEqual(counts[char] / 30000, 1 / 3, delta=0.02)
+
+    def test_variable_repeats(self):
+        values = compile_pattern(r"\d{2,4}").fill(random.Random(1), 1000)
+        self.assertEqual({len(value) for value in values}, {2, 3, 4})
+
+
+class TestForeignKeys(SimpleTestCase):
+    def test_uniform_fanout(self):
+        keys = array("q", range(100, 200))
+        fill = foreign_key_filler(get_faker(), keys)
+        counts = Counter(fill(100_000))
+        self.assertEqual(set(counts), set(keys))
+        self.assertAlmostEqual(max(counts.values()) / 1000, 1, delta=0.2)
+
+    def test_skewed_fanout(self):
+        # more parents than weights are drawn at once
+        keys = array("q", range(25_000))
+        fill = foreign_key_filler(get_faker(), keys, fanout="zipf", exponent=2)
+        counts = Counter(fill(100_000))
+        self.assertTrue(set(counts).issubset(keys))
+        # most parents get no rows, a few get many
+        self.assertLess(len(counts), len(keys) / 2)
+        self.assertGreater(max(counts.values()), 40)
+
+    def test_normal_fanout_keeps_all_parents(self):
+        keys = array("q", range(1000))
+        fill = foreign_key_filler(
+            get_faker(), keys, fanout="normal", mean=10, deviation=1
+        )
+        self.assertEqual(len(set(fill(100_000))), 1000)
+
+    def test_no_parent_keys_for_no_rows(self):
+        for fanout in ["uniform", "zipf"]:
+            fill = foreign_key_filler(get_faker(), array("q"), fanout=fanout)
+            self.assertEqual(fill(0), [])
+
+    def test_keys_are_collected_without_nulls(self):
+        blocks = [[[1, "a"], [None, "b"]], [[3, "c"]]]
+        keys = array("q")
+        self.assertEqual(list(collect_keys(blocks, 0, keys)), blocks)
+        self.assertEqual(list(keys), [1, 3])
+
+
+class TestLocales(SimpleTestCase):
+    def test_parse_locales(self):
+        self.assertEqual(parse_locales(""), {"en_US": 1})
+        self.assertEqual(parse_locales("de_DE"), {"de_DE": 1})
+        self.assertEqual(
+            parse_locales("en_US:3, ja_JP:1,"), {"en_US": 3, "ja_JP": 1}
+        )
+        for text in ["xx_XX", "en_US:x", "en_US:0", "en_US:inf"]:
+            with self.subTest(text), self.assertRaises(ValueError):
+                parse_locales(text)
+
+    def test_available_locales_as_faker(self):
+        self.assertSetEqual(available_locales(), set(AVAILABLE_LOCALES))
+
+    def test_faker_of_a_locale_is_kept_with_providers(self):
+        faker = get_faker("de_DE")
+        self.assertIs(get_faker("de_DE"), faker)
+        self.assertEqual(faker.locales, ["de_DE"])
+        self.assertIsInstance(faker.sentences_variable_str(), str)
+
+    def test_sentences_in_the_locale(self):
+        faker = get_faker("ja_JP")
+        texts = sentences_filler(faker, nb_min=1, nb_max=1)(10)
+        self.assertTrue(all(text.endswith("。") for text in texts))
+        self.assertTrue(faker.sentences_variable_str(1, 1).endswith("。"))
+
+    def test_mix_of_locales(self):
+        generator = Generator(
+            [
+                ColumnDTO("name", "name", 1, {}),
+                ColumnDTO("id", "sequence", 2, {}),
+            ],
+            locales={"en_US": 1, "ja_JP": 1},
+        )
+        rows = [
+            row for block in generator.generate_blocks(400) for row in block
+        ]
+        japanese = sum(not row[0].isascii() for row in rows)
+        self.assertAlmostEqual(japanese / 400, 0.5, delta=0.15)
+        # values of the other locale don't break the sequence
+        self.assertEqual([row[1] for row in rows], list(range(1, 401)))
+
+
+class TestWarmUp(SimpleTestCase):
+    def test_warm_up(self):
+        directory = Path(f"/tmp/testpools/{uuid.uuid4()}")
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = directory / "job.fr_FR.2.pool"
+        ValuePool.build(path, ["Chef", "Juge"])
+
+        elapsed = warm_up(["fr_FR"], directory)
+
+        self.assertGreater(elapsed, 0)
+        self.assertLessEqual({"en_US", "fr_FR"}, providers._provided)
+        self.assertIn(path, pools_module._pools)
+
+    def test_missing_pools_directory(self):
+        warm_up([], Path(f"/tmp/testpools/{uuid.uuid4()}"))
@@ -1,7 +1,17 @@
+import hashlib
+import json
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from ..models import Dataset, NameColumn, RandomIntColumn, Schema
+from ..models import (
+    Dataset,
+    ForeignKeyColumn,
+    NameColumn,
+    RandomIntColumn,
+    Schema,
+    SequenceColumn,
+)
 from ..tasks import generate_data
 
 
@@ -29,6 +39,159 @@ class TestRunGenerateDataTask(TestCase):
         dataset.refresh_from_db()
         self.assertTrue(dataset.file)
 
+    def test_file_size_and_checksum_are_recorded(self):
+        dataset = self.create_dataset()
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+
+        with dataset.file.open("rb") as file:
+            content = file.read()
+        self.assertEqual(dataset.size, len(content))
+        self.assertEqual(dataset.sha256, hashlib.sha256(content).hexdigest())
+
+    def test_dataset_stats_are_gathered(self):
+        dataset = Dataset.objects.create(
+            num_rows=10, collect_stats=True, schema=self.schema
+        )
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+
+        self.assertEqual(dataset.stats["total_bytes"], dataset.file.size)
+        name_stats, age_stats = dataset.stats["columns"]
+        self.assertEqual(name_stats["name"], "Full name")
+        self.assertGreater(name_stats["avg_length"], 0)
+        self.assertGreaterEqual(age_stats["min"], 15)
+        self.assertLessEqual(age_stats["max"], 80)
+
+    def test_dataset_stats_are_opt_in(self):
+        dataset = self.create_dataset()
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+        self.assertIsNone(dataset.stats)
+
+    def test_too_few_unique_values_fail_the_dataset(self):
+        schema = Schema.objects.create(name="Dice", user=self.user)
+        RandomIntColumn.objects.create(
+            name="Roll", min=1, max=6, unique=True, schema=schema
+        )
+        dataset = Dataset.objects.create(
+            num_rows=10, split_rows=2, schema=schema
+        )
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+
+        self.assertIn("Not enough unique values", dataset.error)
+        self.assertFalse(dataset.file)
+        self.assertFalse(dataset.parts.exists())
+
+    def test_ndjson_format(self):
+        dataset = Dataset.objects.create(
+            num_rows=10, format=Dataset.Format.NDJSON, schema=self.schema
+        )
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+
+        self.assertTrue(dataset.file.name.endswith(".ndjson"))
+        with dataset.file.open("rb") as file:
+            objects = [json.loads(line) for line in file]
+        self.assertEqual(len(objects), 10)
+        self.assertEqual(list(objects[0]), ["Full name", "Age"])
+        self.assertIsInstance(objects[0]["Age"], int)
+
+    def test_sql_insert_format(self):
+        dataset = Dataset.objects.create(
+            num_rows=10,
+            format=Dataset.Format.SQL,
+            insert_batch_size=4,
+            schema=self.schema,
+        )
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+
+        self.assertTrue(dataset.file.name.endswith(".sql"))
+        with dataset.file.open("rb") as file:
+            content = file.read().decode()
+        self.assertTrue(
+            content.startswith('CREATE TABLE IF NOT EXISTS "test_schema" (')
+        )
+        self.assertEqual(content.count("INSERT INTO"), 3)
+
+    def test_split_dataset_into_parts_with_manifest(self):
+        dataset = Dataset.objects.create(
+            num_rows=10, split_rows=4, collect_stats=True, schema=self.schema
+        )
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+
+        parts = list(dataset.parts.all())
+        self.assertEqual([part.num_rows for part in parts], [4, 4, 2])
+        for part in parts:
+            with part.file.open("rb") as file:
+                content = file.read()
+            self.assertTrue(content.startswith(b"Full name,Age\r\n"))
+            self.assertEqual(part.sha256, hashlib.sha256(content).hexdigest())
+
+        with dataset.file.open("rb") as file:
+            manifest = json.load(file)
+        self.assertEqual(manifest["header"], ["Full name", "Age"])
+        self.assertEqual(
+            [part["sha256"] for part in manifest["parts"]],
+            [part.sha256 for part in parts],
+        )
+        self.assertEqual(
+            dataset.stats["total_bytes"], sum(part.size for part in parts)
+        )
+
+    def test_bundle_with_parent_tables(self):
+        customers = Schema.objects.create(name="Customers", user=self.user)
+        customer_id = SequenceColumn.objects.create(
+            name="id", start=100, schema=customers, order=1
+        )
+        NameColumn.objects.create(name="name", schema=customers, order=2)
+        orders = Schema.objects.create(name="Orders", user=self.user)
+        ForeignKeyColumn.objects.create(
+            name="customer_id",
+            schema=orders,
+            parent=customer_id,
+            mean=4,
+            fanout="poisson",
+        )
+        dataset = Dataset.objects.create(
+            num_rows=10,
+            format=Dataset.Format.NDJSON,
+            collect_stats=True,
+            schema=orders,
+        )
+        generate_data.run(dataset.id)
+        dataset.refresh_from_db()
+
+        with dataset.file.open("rb") as file:
+            manifest = json.load(file)
+        self.assertEqual(
+            [
+                (table["name"], table["num_rows"])
+                for table in manifest["tables"]
+            ],
+            [("customers", 3), ("orders", 10)],
+        )
+        parts = list(dataset.parts.all())
+        self.assertEqual(
+            [(part.number, part.table) for part in parts],
+            [(1, "customers"), (2, "orders")],
+        )
+        tables = {}
+        for part in parts:
+            with part.file.open("rb") as file:
+                tables[part.table] = [json.loads(line) for line in file]
+        customer_ids = {row["id"] for row in tables["customers"]}
+        self.assertEqual(customer_ids, {100, 101, 102})
+        self.assertTrue(
+            {row["customer_id"] for row in tables["orders"]}.issubset(
+                customer_ids
+            )
+        )
+        self.assertEqual(dataset.stats["columns"][0]["name"], "customer_id")
+
     def test_resulting_filenames_are_different(self):
         dataset_1 = self.create_dataset()
         generate_data.run(dataset_1.id)
@@ -0,0 +1,106 @@
+import hashlib
+from base64 import b64encode
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+
+from ... import views
+from ...models import NameColumn, Schema
+
+
+class TestDatasetDownloadView(TestCase):
+    CONTENT = b"Full name\r\nVasya\r\n"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+        NameColumn.objects.create(name="Full name", order=1, schema=cls.schema)
+
+    def setUp(self):
+        self.dataset = self.schema.datasets.create(
+            num_rows=1,
+            size=len(self.CONTENT),
+            sha256=hashlib.sha256(self.CONTENT).hexdigest(),
+        )
+        self.dataset.file.save("test.csv", StringIO(self.CONTENT.decode()))
+
+    @property
+    def VIEW_URL(self):
+        return reverse("schema:download", kwargs={"pk": self.dataset.pk})
+
+    def test_url_resolves_to_view(self):
+        self.assertIs(
+            resolve(self.VIEW_URL).func.view_class, views.DatasetDownloadView
+        )
+
+    def test_call_view_deny_anonymous(self):
+        response = self.client.get(self.VIEW_URL, follow=True)
+        self.assertRedirects(
+            response, reverse("users:login") + "?next=" + self.VIEW_URL
+        )
+
+    def test_downloads_only_own_datasets(self):
+        user_2 = get_user_model().objects.create_user(
+            username="testuser_2", password="12345"
+        )
+        self.client.force_login(user_2)
+        response = self.client.get(self.VIEW_URL)
+        self.assertEqual(response.status_code, 404)
+
+    def test_serve_file_with_checksum_headers(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.VIEW_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.CONTENT)
+        self.assertEqual(response["Content-Length"], str(len(self.CONTENT)))
+        self.assertEqual(response["ETag"], f'"{self.dataset.sha256}"')
+        self.assertEqual(
+            response["Digest"],
+            "sha-256="
+            + b64encode(hashlib.sha256(self.CONTENT).digest()).decode(),
+        )
+
+    def test_not_modified_on_matching_etag(self):
+        self.client.force_login(self.user)
+        response = self.client.get(
+            self.VIEW_URL, HTTP_IF_NONE_MATCH=f'"{self.dataset.sha256}"'
+        )
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(self.VIEW_URL, HTTP_IF_NONE_MATCH='"123"')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(PRIVATE_MEDIA_STORAGE=object)
+    def test_redirect_to_remote_storage(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.VIEW_URL)
+        self.assertRedirects(
+            response, self.dataset.file.url, fetch_redirect_response=False
+        )
+        self.assertEqual(response["ETag"], f'"{self.dataset.sha256}"')
+
+    def test_serve_dataset_part(self):
+        self.client.force_login(self.user)
+        part = self.dataset.parts.create(
+            number=1,
+            num_rows=1,
+            size=len(self.CONTENT),
+            sha256=hashlib.sha256(self.CONTENT).hexdigest(),
+        )
+        part.file.save("test_part1.csv", StringIO(self.CONTENT.decode()))
+
+        response = self.client.get(
+            reverse("schema:download_part", args=(self.dataset.pk, 1))
+        )
+        self.assertEqual(b"".join(response.streaming_content), self.CONTENT)
+        self.assertEqual(response["ETag"], f'"{part.sha256}"')
+
+        response = self.client.get(
+            reverse("schema:download_part", args=(self.dataset.pk, 2))
+        )
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,102 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+
+from ... import views
+from ...models import NameColumn, Schema
+
+
+class TestDatasetPeekView(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(
+            name="Test schema", column_separator=";", user=cls.user
+        )
+        NameColumn.objects.create(name="Full name", order=1, schema=cls.schema)
+
+    def setUp(self):
+        self.dataset = self.schema.datasets.create(num_rows=3)
+        self.dataset.file.save(
+            "test.csv",
+            StringIO('Full name;Age\r\nVasya;25\r\n"Zucc; Mark";38\r\nOleg;1'),
+        )
+
+    @property
+    def VIEW_URL(self):
+        return reverse("schema:peek", kwargs={"pk": self.dataset.pk})
+
+    def test_url_resolves_to_view(self):
+        self.assertIs(
+            resolve(self.VIEW_URL).func.view_class, views.DatasetPeekView
+        )
+
+    def test_call_view_deny_anonymous(self):
+        response = self.client.get(self.VIEW_URL, follow=True)
+        self.assertRedirects(
+            response, reverse("users:login") + "?next=" + self.VIEW_URL
+        )
+
+    def test_peeks_only_own_datasets(self):
+        user_2 = get_user_model().objects.create_user(
+            username="testuser_2", password="12345"
+        )
+        self.client.force_login(user_2)
+        response = self.client.get(self.VIEW_URL)
+        self.assertEqual(response.status_code, 404)
+
+    def test_not_generated_dataset_is_not_found(self):
+        self.client.force_login(self.user)
+        dataset = self.schema.datasets.create(num_rows=10)
+        response = self.client.get(
+            reverse("schema:peek", kwargs={"pk": dataset.pk})
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_sql_dump_is_not_peekable(self):
+        self.client.force_login(self.user)
+        dataset = self.schema.datasets.create(num_rows=1, format="sql")
+        dataset.file.save("test.sql", StringIO("INSERT INTO ..."))
+        response = self.client.get(
+            reverse("schema:peek", kwargs={"pk": dataset.pk})
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_render_whole_small_file(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.VIEW_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "data/peek.html")
+        self.assertEqual(response.context["header"], ["Full name", "Age"])
+        self.assertEqual(
+            response.context["rows"],
+            [["Vasya", "25"], ["Zucc; Mark", "38"], ["Oleg", "1"]],
+        )
+
+    @override_settings(PEEK_BYTES=43)
+    def test_render_only_complete_rows_of_the_head(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.VIEW_URL)
+        self.assertEqual(
+            response.context["rows"], [["Vasya", "25"], ["Zucc; Mark", "38"]]
+        )
+
+    @override_settings(PEEK_BYTES=50)
+    def test_render_ndjson(self):
+        self.client.force_login(self.user)
+        dataset = self.schema.datasets.create(num_rows=2, format="ndjson")
+        dataset.file.save(
+            "test.ndjson",
+            StringIO(
+                '{"Full name":"Vasya","Age":25}\n{"Full name":"Zucc","Age":38}\n'
+            ),
+        )
+        response = self.client.get(
+            reverse("schema:peek", kwargs={"pk": dataset.pk})
+        )
+        self.assertEqual(response.context["header"], ["Full name", "Age"])
+        self.assertEqual(response.context["rows"], [["Vasya", 25]])
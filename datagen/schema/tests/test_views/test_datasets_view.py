@@ -71,7 +71,25 @@ class TestSchemaDataSetsView(TestCase):
         self.assertEqual(response.context["schema"].datasets.count(), 3)
         self.assertContains(response, "Processing", count=2)
         self.assertContains(response, "Ready", count=1)
-        self.assertContains(response, generated.file.url)
+        self.assertContains(
+            response, reverse("schema:download", args=(generated.pk,))
+        )
+
+    def test_render_dataset_stats(self):
+        self.client.force_login(self.user)
+        self.schema.datasets.create(
+            num_rows=10,
+            stats={
+                "total_bytes": 2048,
+                "columns": [
+                    {"name": "Full name", "distinct": 9, "avg_length": 12.5}
+                ],
+            },
+        )
+
+        response = self.client.get(self.VIEW_URL)
+        self.assertContains(response, "Statistics, 2.0\xa0KB")
+        self.assertContains(response, "<td>12.5</td>", html=True)
 
     def test_lists_only_own_datasets(self):
         self.schema.datasets.create(num_rows=10)
@@ -90,4 +108,49 @@ class TestSchemaDataSetsView(TestCase):
         self.client.force_login(self.user)
         with mock.patch.object(Schema, "run_generate_task") as mock_generate:
             self.client.post(self.VIEW_URL, {"num_rows": 10})
-            mock_generate.assert_called_once_with(10)
+            mock_generate.assert_called_once_with(
+                num_rows=10,
+                format="csv",
+                split_rows=None,
+                split_size=None,
+                insert_batch_size=1000,
+                collect_stats=False,
+            )
+
+    def test_request_split_generation(self):
+        self.client.force_login(self.user)
+        with mock.patch.object(Schema, "run_generate_task") as mock_generate:
+            self.client.post(
+                self.VIEW_URL,
+                {
+                    "num_rows": 10,
+                    "format": "ndjson",
+                    "split_rows": 3,
+                    "collect_stats": "on",
+                },
+            )
+            mock_generate.assert_called_once_with(
+                num_rows=10,
+                format="ndjson",
+                split_rows=3,
+                split_size=None,
+                insert_batch_size=1000,
+                collect_stats=True,
+            )
+
+    def test_render_dataset_parts(self):
+        self.client.force_login(self.user)
+        dataset = self.schema.datasets.create(num_rows=10, split_rows=5)
+        dataset.file.save("manifest.json", StringIO("{}"))
+        for number in (1, 2):
+            dataset.parts.create(
+                number=number, num_rows=5, size=10, sha256="0" * 64
+            )
+
+        response = self.client.get(self.VIEW_URL)
+        self.assertContains(response, "Manifest")
+        for number in (1, 2):
+            self.assertContains(
+                response,
+                reverse("schema:download_part", args=(dataset.pk, number)),
+            )
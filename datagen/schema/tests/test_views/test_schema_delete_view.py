@@ -3,7 +3,7 @@ from django.test import TestCase
 from django.urls import resolve, reverse
 
 from ... import views
-from ...models import NameColumn, Schema
+from ...models import ForeignKeyColumn, NameColumn, Schema, SequenceColumn
 
 
 class TestDeleteSchemaView(TestCase):
@@ -52,6 +52,22 @@ class TestDeleteSchemaView(TestCase):
         with self.assertRaises(self.schema.DoesNotExist):
             self.schema.refresh_from_db()
 
+    def test_parents_of_other_schemas_arent_deleted(self):
+        customer_id = SequenceColumn.objects.create(
+            name="id", order=2, schema=self.schema
+        )
+        orders = Schema.objects.create(name="Orders", user=self.user)
+        ForeignKeyColumn.objects.create(
+            name="customer", schema=orders, parent=customer_id
+        )
+        self.client.force_login(self.user)
+        response = self.client.post(self.VIEW_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response, "Foreign keys of &quot;Orders&quot; refer to this schema"
+        )
+        self.schema.refresh_from_db()
+
     def test_only_owner_can_delete(self):
         user_2 = get_user_model().objects.create_user(
             username="testuser_2", password="12345"
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+
+from ... import views
+from ...models import (
+    ForeignKeyColumn,
+    NameColumn,
+    RandomIntColumn,
+    Schema,
+    SequenceColumn,
+)
+
+
+class TestSchemaPreviewView(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="testuser", password="12345"
+        )
+        cls.schema = Schema.objects.create(name="Test schema", user=cls.user)
+        NameColumn.objects.create(name="Full name", order=1, schema=cls.schema)
+        RandomIntColumn.objects.create(
+            name="Age", min=15, max=80, order=2, schema=cls.schema
+        )
+
+    @property
+    def VIEW_URL(self):
+        return reverse("schema:preview", kwargs={"pk": self.schema.pk})
+
+    def test_url_resolves_to_view(self):
+        self.assertIs(
+            resolve(self.VIEW_URL).func.view_class, views.SchemaPreviewView
+        )
+
+    def test_call_view_deny_anonymous(self):
+        response = self.client.get(self.VIEW_URL, follow=True)
+        self.assertRedirects(
+            response, reverse("users:login") + "?next=" + self.VIEW_URL
+        )
+
+    def test_previews_only_own_schemas(self):
+        user_2 = get_user_model().objects.create_user(
+            username="testuser_2", password="12345"
+        )
+        self.client.force_login(user_2)
+        response = self.client.get(self.VIEW_URL)
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(PREVIEW_NUM_ROWS=7)
+    def test_render_html_table(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.VIEW_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "data/preview.html")
+        self.assertEqual(response.context["header"], ["Full name", "Age"])
+        self.assertEqual(len(response.context["rows"]), 7)
+        self.assertContains(response, "<th>Full name</th>", html=True)
+
+    @override_settings(PREVIEW_NUM_ROWS=5)
+    def test_render_json(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.VIEW_URL, {"format": "json"})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["header"], ["Full name", "Age"])
+        self.assertEqual(len(data["rows"]), 5)
+        self.assertIsInstance(data["rows"][0][1], int)
+
+    def test_preview_follows_edited_parents(self):
+        parent = Schema.objects.create(name="Parent", user=self.user)
+        parent_id = SequenceColumn.objects.create(name="id", schema=parent)
+        ForeignKeyColumn.objects.create(
+            name="Parent", order=3, schema=self.schema, parent=parent_id
+        )
+        self.client.force_login(self.user)
+        response = self.client.get(self.VIEW_URL, {"format": "json"})
+        self.assertLess(max(row[2] for row in response.json()["rows"]), 100)
+
+        parent_id.start = 1000
+        parent_id.save()
+        parent.save()
+        response = self.client.get(self.VIEW_URL, {"format": "json"})
+        self.assertGreaterEqual(
+            min(row[2] for row in response.json()["rows"]), 1000
+        )
+
+    def test_does_not_create_datasets(self):
+        self.client.force_login(self.user)
+        with mock.patch.object(Schema, "run_generate_task") as mock_generate:
+            self.client.get(self.VIEW_URL)
+            mock_generate.assert_not_called()
+        self.assertEqual(self.schema.datasets.count(), 0)
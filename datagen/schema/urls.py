@@ -11,4 +11,22 @@ urlpatterns = [
     path("<int:pk>/edit/", views.EditSchemaView.as_view(), name="edit"),
     path("<int:pk>/delete/", views.DeleteSchemaView.as_view(), name="delete"),
     path("<int:pk>/", views.SchemaDataSetsView.as_view(), name="datasets"),
+    path(
+        "datasets/<int:pk>/peek/",
+        views.DatasetPeekView.as_view(),
+        name="peek",
+    ),
+    path(
+        "datasets/<int:pk>/download/",
+        views.DatasetDownloadView.as_view(),
+        name="download",
+    ),
+    path(
+        "datasets/<int:pk>/parts/<int:number>/download/",
+        views.DatasetDownloadView.as_view(),
+        name="download_part",
+    ),
+    path(
+        "<int:pk>/preview/", views.SchemaPreviewView.as_view(), name="preview"
+    ),
 ]
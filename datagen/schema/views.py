@@ -1,22 +1,37 @@
+import os
 from typing import Any, Dict
 
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db import transaction
-from django.db.models import QuerySet
+from django.core.files.storage import DefaultStorage
+from django.db.models import QuerySet, RestrictedError
 from django.forms import Form
-from django.http.response import HttpResponse
+from django.http import HttpRequest
+from django.http.response import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseBase,
+    HttpResponseRedirect,
+    JsonResponse,
+)
 from django.shortcuts import get_object_or_404
 from django.urls import reverse, reverse_lazy
+from django.utils.cache import get_conditional_response
+from django.views import View
 from django.views.generic import (
     CreateView,
     DeleteView,
+    DetailView,
     FormView,
     ListView,
     UpdateView,
 )
+from django.views.generic.detail import SingleObjectMixin
 
 from .forms import FieldSelectForm, GenerateForm, SchemaForm
-from .models import Schema
+from .models import Dataset, DatasetPart, ForeignKeyColumn, Schema
+from .services.peek import parse_head, parse_ndjson_head, read_head
 
 
 class OwnSchemaMixin(LoginRequiredMixin):
@@ -34,7 +49,6 @@ class CreateSchemaView(OwnSchemaMixin, AtomicFormSavingMixin, CreateView):  # ty
     template_name = "schema/edit.html"
     form_class = SchemaForm
     prefix = "Schema"
-    extra_context = {"field_select_form": FieldSelectForm()}
     success_url = reverse_lazy("schema:list")
 
     def get_form_kwargs(self) -> Dict[str, Any]:
@@ -42,12 +56,16 @@ class CreateSchemaView(OwnSchemaMixin, AtomicFormSavingMixin, CreateView):  # ty
         kwargs["user"] = self.request.user
         return kwargs
 
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["field_select_form"] = FieldSelectForm(user=self.request.user)  # type: ignore[arg-type]
+        return context
+
 
 class EditSchemaView(OwnSchemaMixin, AtomicFormSavingMixin, UpdateView):  # type: ignore[misc]
     template_name = "schema/edit.html"
     form_class = SchemaForm
     prefix = "Schema"
-    extra_context = {"field_select_form": FieldSelectForm()}
     success_url = reverse_lazy("schema:list")
 
     def get_form_kwargs(self) -> Dict[str, Any]:
@@ -55,11 +73,31 @@ class EditSchemaView(OwnSchemaMixin, AtomicFormSavingMixin, UpdateView):  # type
         kwargs["user"] = self.request.user
         return kwargs
 
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["field_select_form"] = FieldSelectForm(user=self.request.user)  # type: ignore[arg-type]
+        return context
+
 
 class DeleteSchemaView(OwnSchemaMixin, DeleteView):
     template_name = "schema/delete.html"
     success_url = reverse_lazy("schema:list")
 
+    def form_valid(self, form: Form) -> HttpResponse:
+        try:
+            return super().form_valid(form)  # type: ignore[no-any-return, misc]
+        except RestrictedError:
+            children = ForeignKeyColumn.objects.filter(
+                parent__schema=self.object  # type: ignore[attr-defined]
+            ).select_related("schema")
+            names = sorted({f'"{fk.schema.name}"' for fk in children})
+            form.add_error(
+                None,
+                f"Foreign keys of {', '.join(names)} refer to this schema, "
+                "change them first.",
+            )
+            return self.form_invalid(form)  # type: ignore[no-any-return, attr-defined]
+
 
 class ListSchemasView(OwnSchemaMixin, ListView):
     template_name = "schema/list.html"
@@ -81,11 +119,137 @@ class SchemaDataSetsView(OwnSchemaMixin, FormView):
     def get_form_kwargs(self) -> Dict[str, Any]:
         kwargs = super().get_form_kwargs()
         kwargs["request"] = self.request
+        kwargs["schema"] = self.get_object()
         return kwargs
 
     def form_valid(self, form: GenerateForm) -> HttpResponse:
-        self.get_object().run_generate_task(form.cleaned_data["num_rows"])
+        self.get_object().run_generate_task(**form.cleaned_data)
         return super().form_valid(form)
 
     def get_success_url(self) -> str:
         return reverse("schema:datasets", args=(self.get_object().pk,))
+
+
+class SchemaPreviewView(OwnSchemaMixin, DetailView):
+    """Generate the first rows right in the request,
+    so there is no need to queue a whole dataset to see the output.
+    Add `?format=json` to get the rows as JSON instead of an HTML table."""
+
+    template_name = "data/preview.html"
+    context_object_name = "schema"
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        # generation imports Faker and factory_boy, so on the first preview
+        from .services.preview import generate_preview, get_cached_generator
+
+        context = super().get_context_data(**kwargs)
+        schema: Schema = context["schema"]
+        # foreign keys pick the keys of their parents, so they count too
+        key = tuple(
+            (bundled.pk, bundled.modified)
+            for bundled, _ in schema.get_bundle(settings.PREVIEW_NUM_ROWS)
+        )
+        generator = get_cached_generator(key, lambda: schema.get_generator)
+        context["header"] = generator.header
+        context["rows"] = generate_preview(
+            generator,
+            settings.PREVIEW_NUM_ROWS,
+            settings.PREVIEW_TIME_BUDGET,
+            settings.PREVIEW_MAX_CELL_LENGTH,
+        )
+        return context
+
+    def render_to_response(
+        self, context: Dict[str, Any], **response_kwargs: Any
+    ) -> HttpResponse:
+        if self.request.GET.get("format") == "json":
+            return JsonResponse(
+                {"header": context["header"], "rows": context["rows"]}
+            )
+        return super().render_to_response(context, **response_kwargs)
+
+
+class OwnDatasetMixin(LoginRequiredMixin):
+    """Only datasets of the user's schemas that are already generated"""
+
+    def get_queryset(self) -> QuerySet[Dataset]:
+        return (
+            Dataset.objects.filter(schema__user=self.request.user)  # type: ignore[attr-defined]
+            .exclude(file="")
+            .exclude(file__isnull=True)
+            .select_related("schema")
+        )
+
+
+class DatasetPeekView(OwnDatasetMixin, DetailView):
+    """Render the first rows of a stored dataset
+    reading only the beginning of the file."""
+
+    template_name = "data/peek.html"
+    context_object_name = "dataset"
+
+    def get_queryset(self) -> QuerySet[Dataset]:
+        return (
+            super().get_queryset().filter(format__in=Dataset.PEEKABLE_FORMATS)
+        )
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        dataset: Dataset = context["dataset"]
+        # the file of a split dataset is a manifest, so peek at the first part
+        # (of the table of the schema, if the dataset is a bundle)
+        first_part = dataset.parts.filter(
+            table__in=("", dataset.schema.table_name)
+        ).first()
+        file = first_part.file if first_part else dataset.file
+        data = read_head(file, settings.PEEK_BYTES)
+        truncated = len(data) >= settings.PEEK_BYTES
+        if dataset.format == Dataset.Format.NDJSON:
+            context["header"], context["rows"] = parse_ndjson_head(
+                data, truncated, max_rows=settings.PEEK_MAX_ROWS
+            )
+        else:
+            context["header"], context["rows"] = parse_head(
+                data,
+                truncated,
+                delimiter=dataset.schema.column_separator,
+                quotechar=dataset.schema.quotechar,
+                max_rows=settings.PEEK_MAX_ROWS,
+            )
+        return context
+
+
+class DatasetDownloadView(OwnDatasetMixin, SingleObjectMixin, View):
+    """Serve a dataset file (or its part if a part number is given)
+    with its checksum as `ETag` and `Digest`,
+    answering conditional requests without touching the storage.
+    Files of a remote storage are redirected to."""
+
+    def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponseBase:
+        stored: Dataset | DatasetPart = self.get_object()  # type: ignore[assignment]
+        if "number" in kwargs:
+            stored = get_object_or_404(stored.parts, number=kwargs["number"])  # type: ignore[union-attr]
+
+        etag = f'"{stored.sha256}"' if stored.sha256 else None
+        if etag and (
+            not_modified := get_conditional_response(request, etag=etag)  # type: ignore[arg-type]
+        ):
+            return not_modified
+
+        response: HttpResponseBase
+        if settings.PRIVATE_MEDIA_STORAGE is DefaultStorage:
+            response = FileResponse(
+                stored.file.open("rb"),
+                as_attachment=True,
+                filename=os.path.basename(stored.file.name),
+            )
+            if stored.size is not None:
+                response["Content-Length"] = stored.size
+        else:
+            response = HttpResponseRedirect(stored.file.url)
+        if etag:
+            response["ETag"] = etag
+            response["Digest"] = stored.digest
+        return response